@@ -0,0 +1,87 @@
+"""
+Codec Benchmark - Reminder encode/decode and whole-file throughput, per record vs batched
+
+Run from the project root: python benchmarks/bench_codec.py [--size 1000000]
+Files are written to a temporary directory.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.reminder import Reminder, MINUTES_PER_DAY
+from src.models.reminder_codec import encode_records, decode_records
+from src.services.storage_backends import JsonBackend, BinaryBackend
+
+LAST_SAVED = "2026-01-01"
+
+
+def timed(label: str, size: int, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>30} {elapsed * 1000:>10.0f} {size / elapsed / 1e6:>10.2f}")
+    return result
+
+
+def megabytes(path: str) -> str:
+    return f"{os.path.getsize(path) / 1e6:.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    size = args.size
+    
+    random.seed(20)
+    reminders = [Reminder(random.randrange(MINUTES_PER_DAY), f"reminder {i} é",
+                          completed=i % 3 == 0, repeat_daily=i % 5 != 0)
+                 for i in range(size)]
+    data_dir = tempfile.mkdtemp(prefix="bench_codec_")
+    try:
+        print(f"{size} reminders")
+        print(f"{'':>30} {'ms':>10} {'M rec/s':>10}")
+        records = timed("to_dict per record", size, lambda: [r.to_dict() for r in reminders])
+        assert timed("encode_records", size, lambda: encode_records(reminders)) == records
+        timed("from_dict per record", size, lambda: [Reminder.from_dict(r) for r in records])
+        assert timed("decode_records", size, lambda: decode_records(records)) == reminders
+        
+        json_path = os.path.join(data_dir, "reminders.json")
+        
+        def dump_indented():
+            # How the JSON file was written before dump_json
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump({"last_saved": LAST_SAVED, "reminders": records}, f,
+                          indent=2, ensure_ascii=False)
+        timed("json.dump indent=2", size, dump_indented)
+        timed("JsonBackend.write_all", size,
+              lambda: JsonBackend(json_path).write_all(records, LAST_SAVED))
+        loaded = timed(f"JsonBackend.load ({megabytes(json_path)})", size,
+                       lambda: JsonBackend(json_path).load())
+        assert loaded == (records, LAST_SAVED)
+        
+        binary_path = os.path.join(data_dir, "reminders.rmdb")
+        timed("BinaryBackend.write_all", size,
+              lambda: BinaryBackend(binary_path).write_all(records, LAST_SAVED))
+        loaded = timed(f"BinaryBackend.load ({megabytes(binary_path)})", size,
+                       lambda: BinaryBackend(binary_path).load())
+        assert loaded == (records, LAST_SAVED)
+        
+        def stream_and_decode():
+            _, batches = BinaryBackend(binary_path).stream()
+            return sum(len(decode_records(batch)) for batch in batches)
+        assert timed("BinaryBackend.stream + decode", size, stream_and_decode) == size
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Flip Power Benchmark - Timer wakeups per minute of the flip clock while shown and minimized
+
+Run from the project root: python benchmarks/bench_flip_power.py [--seconds 10]
+A FlipClock window runs on Qt's offscreen platform: shown, then minimized,
+then restored, for the given number of seconds each. The driver's
+wakeup_report() is printed after each phase and for the whole run.
+"""
+
+import argparse
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+from src.ui.widgets.flip_clock import FlipClock
+
+
+def run_for(seconds: float):
+    """Spin the event loop for seconds"""
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def print_report(title: str, report: dict):
+    print(title)
+    print(f"  {'mode':>6} {'seconds':>9} {'wakeups':>8} {'wakeups/min':>12}")
+    for mode, row in report.items():
+        print(f"  {mode:>6} {row['seconds']:>9.1f} {row['wakeups']:>8} "
+              f"{row['wakeups_per_minute']:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0, help="length of each phase")
+    args = parser.parse_args()
+    
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    clock = FlipClock()
+    clock.resize(900, 400)
+    clock.show()
+    driver = clock.driver
+    
+    phases = (("shown", clock.showNormal), ("minimized", clock.showMinimized),
+              ("restored", clock.showNormal))
+    before = {mode: (0.0, 0) for mode in driver.mode_wakeups}
+    for name, enter in phases:
+        enter()
+        run_for(args.seconds)
+        report = driver.wakeup_report()
+        # This phase only: the difference to the totals after the last one
+        phase = {}
+        for mode, row in report.items():
+            seconds = row["seconds"] - before[mode][0]
+            wakeups = row["wakeups"] - before[mode][1]
+            if seconds > 0.05:
+                phase[mode] = {"seconds": seconds, "wakeups": wakeups,
+                               "wakeups_per_minute": 60 * wakeups / seconds}
+        before = {mode: (row["seconds"], row["wakeups"]) for mode, row in report.items()}
+        print_report(f"{name} (mode now {driver.mode}):", phase)
+    
+    print_report("whole run:", driver.wakeup_report())
+    clock.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
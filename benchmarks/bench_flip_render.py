@@ -0,0 +1,114 @@
+"""
+Flip Render Benchmark - Frame time of FlipNumberWidget with and without its pixmap cache
+
+Run from the project root: python benchmarks/bench_flip_render.py [--frames 2000] [--seconds 5]
+Frames are rendered on Qt's offscreen platform into an off-screen pixmap,
+stepping through flips between changing values the way the clock does;
+each frame repaints the digit band like a running flip.
+
+A live FlipClock then runs for --seconds twice, once invalidating whole
+digit widgets on every flip frame and once only their digit band, and
+paint_report() gives the pixels repainted per second for each.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QEventLoop, QPoint, QTimer
+from PyQt6.QtGui import QPixmap, QRegion
+from PyQt6.QtWidgets import QApplication
+from src.ui.widgets.flip_clock import FlipClock, FlipNumberWidget, PixmapCache
+
+FRAMES_PER_FLIP = 30  # About half a second of animation at 60 fps
+
+
+class BypassedCache(PixmapCache):
+    """Renders on every lookup, like painting without a cache"""
+    
+    def get(self, key, render):
+        self.misses += 1
+        return render()
+
+
+def bench(widget: FlipNumberWidget, frames: int) -> float:
+    """Milliseconds per frame for frames frames of flipping"""
+    target = QPixmap(widget.size())
+    region = QRegion(widget._digit_area())
+    value = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        step = frame % FRAMES_PER_FLIP
+        if step == 0:
+            value = (value + 1) % 60
+            widget.current_value = widget.next_value
+            widget.next_value = str(value).zfill(2)
+        widget.flip_progress = step / (FRAMES_PER_FLIP - 1)
+        widget.render(target, QPoint(), region)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def repaint_area(seconds: float, full: bool) -> dict:
+    """paint_report() of a live clock after seconds, repainting whole digits if full"""
+    band_update = FlipNumberWidget.update_digit_area
+    if full:
+        FlipNumberWidget.update_digit_area = lambda digit: digit.update()
+    try:
+        clock = FlipClock()
+        clock.resize(900, 400)
+        clock.show()
+        loop = QEventLoop()
+        QTimer.singleShot(300, loop.quit)  # Settle the first full paint
+        loop.exec()
+        clock.paint_report()
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec()
+        report = clock.paint_report()
+        clock.close()
+        return report
+    finally:
+        FlipNumberWidget.update_digit_area = band_update
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--size", type=int, nargs=2, default=[200, 360], metavar=("W", "H"))
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="how long the live clock runs per repaint mode")
+    args = parser.parse_args()
+    
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    print(f"{'cache':>9} {'ms/frame':>10} {'hits':>8} {'misses':>8}")
+    results = {}
+    for name, cache in (("enabled", PixmapCache(max_entries=64)), ("bypassed", BypassedCache())):
+        widget = FlipNumberWidget()
+        widget.resize(*args.size)
+        widget.show()  # Delivers the resize that sizes the font
+        app.processEvents()
+        widget.pixmap_cache = cache
+        bench(widget, FRAMES_PER_FLIP)  # Warm up fonts and the painter
+        cache.hits = cache.misses = 0
+        results[name] = bench(widget, args.frames)
+        print(f"{name:>9} {results[name]:>10.3f} {cache.hits:>8} {cache.misses:>8}")
+        widget.close()
+    print(f"speed-up: {results['bypassed'] / results['enabled']:.1f}x")
+    
+    print(f"\n{'repaint':>9} " + " ".join(f"{name + ' px/s':>14}"
+                                         for name in ("hours", "minutes", "seconds", "total")))
+    areas = {}
+    for name, full in (("widget", True), ("band", False)):
+        areas[name] = repaint_area(args.seconds, full)
+        print(f"{name:>9} " + " ".join(f"{areas[name][key]:>14,.0f}"
+                                       for key in ("hours", "minutes", "seconds", "total")))
+    if areas["band"]["total"]:
+        print(f"saving: {1 - areas['band']['total'] / areas['widget']['total']:.0%}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Model Benchmark - Memory per reminder and bulk operations, objects vs ReminderTable
+
+Run from the project root: python benchmarks/bench_model.py [--size 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.reminder import Reminder, MINUTES_PER_DAY
+from src.models.reminder_table import ReminderTable
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def traced_bytes(fn):
+    """Bytes still allocated after fn() returns, and its result"""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    size = args.size
+    
+    random.seed(19)
+    minutes = [random.randrange(MINUTES_PER_DAY) for _ in range(size)]
+    contents = [f"reminder {i}" for i in range(size)]
+    # Contents are shared by both layouts, so they count for neither; ids are
+    # strings on the objects and 16 packed bytes in the table
+    object_bytes, reminders = traced_bytes(
+        lambda: [Reminder(m, c, completed=i % 2 == 0) for i, (m, c) in enumerate(zip(minutes, contents))])
+    table_bytes, table = traced_bytes(lambda: ReminderTable(reminders))
+    assert table.row(size // 2) == reminders[size // 2]
+    
+    print(f"{size} reminders")
+    print(f"{'':>18} {'objects':>12} {'table':>12}")
+    print(f"{'bytes/reminder':>18} {object_bytes / size:>12.1f} {table_bytes / size:>12.1f}")
+    rows = (
+        ("sort by time ms",
+         lambda: sorted(reminders, key=lambda r: r.minute_of_day), table.order_by_time),
+        ("scan minute ms",
+         lambda: [r for r in reminders if r.minute_of_day == 600], lambda: table.rows_at(600)),
+        ("count done ms",
+         lambda: sum(1 for r in reminders if r.completed), table.count_completed),
+        ("new-day reset ms",
+         lambda: [r.reset_for_new_day() for r in reminders], table.reset_for_new_day),
+    )
+    for label, on_objects, on_table in rows:
+        object_ms, _ = timed(on_objects)
+        table_ms, _ = timed(on_table)
+        print(f"{label:>18} {object_ms:>12.1f} {table_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Startup Benchmark - Import time of the UI and time to the first painted frame
+
+Run from the project root: python benchmarks/bench_startup.py [--runs 5]
+Every run starts a fresh interpreter, so nothing is cached between them.
+Import times come from python -X importtime; the first frame is timed on
+Qt's offscreen platform from interpreter start (QApplication, MainWindow,
+show()) to the first paint event of the main window. The window runs on a
+temporary copy of the app, so the saved reminders are never written.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODULE = "src.ui.main_window"
+TIMEOUT = 60  # Seconds a child run may take
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    return env
+
+
+def import_times() -> dict:
+    """Cumulative microseconds per module of one `import MODULE` in a fresh interpreter"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+                            cwd=ROOT, env=child_env(), capture_output=True, text=True,
+                            timeout=TIMEOUT, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def first_frame() -> dict:
+    """Run in the child: milliseconds from start to each start-up step"""
+    started = time.perf_counter()
+    
+    def elapsed():
+        return (time.perf_counter() - started) * 1000
+    
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    steps = {"import": elapsed()}
+    
+    app = QApplication(sys.argv[:1])
+    steps["QApplication"] = elapsed()
+    window = MainWindow()
+    steps["MainWindow"] = elapsed()
+    
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and "first paint" not in steps \
+                    and obj.isWidgetType() and obj.window() is window:
+                steps["first paint"] = elapsed()
+                QTimer.singleShot(0, app.quit)
+            return False
+    
+    paint_filter = FirstPaint()
+    app.installEventFilter(paint_filter)
+    QTimer.singleShot(TIMEOUT * 1000, app.quit)
+    window.show()
+    app.exec()
+    app.removeEventFilter(paint_filter)
+    window.close()
+    return steps
+
+
+def first_frame_run() -> dict:
+    app_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        # Compiled modules are copied along, as they would be in place
+        for name in ("src", "assets", "data"):
+            shutil.copytree(os.path.join(ROOT, name), os.path.join(app_dir, name))
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), "--first-frame-child"],
+                                cwd=app_dir, env=child_env(), capture_output=True, text=True,
+                                timeout=TIMEOUT, check=True)
+    finally:
+        shutil.rmtree(app_dir, ignore_errors=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--first-frame-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.first_frame_child:
+        # The app copy in the working directory, not this checkout
+        sys.path.insert(0, os.getcwd())
+        print(json.dumps(first_frame()))
+        return
+    
+    imports = [import_times() for _ in range(args.runs)]
+    total = statistics.median(run[MODULE] for run in imports) / 1000
+    print(f"import {MODULE}: {total:.1f} ms (median of {args.runs})")
+    slowest = sorted(imports[-1].items(), key=lambda item: item[1], reverse=True)[:args.top]
+    for name, cumulative in slowest:
+        print(f"  {cumulative / 1000:>9.1f} ms  {name}")
+    
+    frames = [first_frame_run() for _ in range(args.runs)]
+    steps = ("import", "QApplication", "MainWindow", "first paint")
+    print(f"\ntime to first frame, ms since start (median of {args.runs}):")
+    for step in steps:
+        values = [run[step] for run in frames if step in run]
+        if values:
+            print(f"  {step:>12} {statistics.median(values):>9.1f}")
+        else:
+            print(f"  {step:>12} {'no paint':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Storage Benchmark - Load, save and query latency of each storage backend
+
+Run from the project root: python benchmarks/bench_storage.py [--sizes 100 10000 100000]
+Everything is written to a temporary directory.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.reminder import Reminder, MINUTES_PER_DAY
+from src.services.storage_service import BACKENDS, StorageService
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def bench(backend: str, reminders, data_dir: str) -> dict:
+    # A long window keeps the background writer idle; flush() writes on this thread
+    service = StorageService(coalesce_window=60, backend=backend, data_dir=data_dir)
+    results = {}
+    results["save all"], _ = timed(lambda: service.save_reminders(reminders))
+    
+    changed = reminders[len(reminders) // 2]
+    changed.completed = not changed.completed
+    service.mark_dirty(changed)
+    results["save one"], _ = timed(service.flush)
+    service.close()
+    
+    service = StorageService(coalesce_window=60, backend=backend, data_dir=data_dir)
+    results["load"], (loaded, _) = timed(service.load_reminders)
+    assert len(loaded) == len(reminders)
+    results["query 1h"], _ = timed(lambda: service.backend.query_between("12:00", "12:59"))
+    service.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    args = parser.parse_args()
+    
+    random.seed(4)
+    columns = ("save all", "save one", "load", "query 1h")
+    print(f"{'reminders':>10} {'backend':>8} " + " ".join(f"{c + ' ms':>12}" for c in columns))
+    for size in args.sizes:
+        reminders = [Reminder(random.randrange(MINUTES_PER_DAY), f"reminder {i}",
+                              completed=i % 3 == 0)
+                     for i in range(size)]
+        for backend in args.backends:
+            data_dir = tempfile.mkdtemp(prefix="bench_storage_")
+            try:
+                results = bench(backend, reminders, data_dir)
+            finally:
+                shutil.rmtree(data_dir, ignore_errors=True)
+            print(f"{size:>10} {backend:>8} " + " ".join(f"{results[c]:>12.2f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
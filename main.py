@@ -3,14 +3,117 @@ AppClockAndRemind - English Learning Clock & Reminder App
 Main entry point for the application
 """
 
+import argparse
+import os
+import shutil
+import signal
 import sys
-from PyQt6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
+import tempfile
+import time
+from datetime import timedelta
+
+# Kept in step with src.services.storage_service.BACKENDS; importing it
+# here would load the storage code before the window is up
+STORAGE_BACKENDS = ("json", "journal", "binary", "sqlite")
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="English learning clock and reminders")
+    parser.add_argument("--headless", action="store_true",
+                        help="run only the reminder scheduler, without a window")
+    parser.add_argument("--sink", default="console",
+                        help='where headless notifications go: "console", "json" '
+                             'or a "package.module:factory" path (default: console)')
+    parser.add_argument("--storage", default="json", choices=STORAGE_BACKENDS,
+                        help="how reminders are stored: a JSON file, a JSON snapshot "
+                             "with a change journal, a binary file or SQLite; the last "
+                             "two import the JSON file on first run (default: json)")
+    parser.add_argument("--simulate", type=float, metavar="DAYS",
+                        help="replay DAYS days headless on a fake clock and exit")
+    # Leave anything else (e.g. -style) to Qt
+    return parser.parse_known_args(argv)[0]
+
+
+def load_saved_copy(backend: str) -> list:
+    """
+    The saved reminders, read from a temporary copy of the data directory.
+    Opening a backend may write (SQLite imports the JSON file, a damaged
+    file is moved aside), so the originals are never opened.
+    """
+    from src.services.storage_service import StorageService
+    
+    data_dir = tempfile.mkdtemp(prefix="clock_simulate_")
+    try:
+        if os.path.isdir(DATA_DIR):
+            shutil.copytree(DATA_DIR, data_dir, dirs_exist_ok=True)
+        storage = StorageService(backend=backend, data_dir=data_dir)
+        try:
+            reminders, _ = storage.load_reminders()
+        finally:
+            storage.close()
+        return reminders
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def run_headless(args) -> int:
+    """Run the scheduling core without Qt, delivering notifications to a sink"""
+    from src.core import ReminderEngine, HeadlessRunner, FakeClock, load_sink
+    from src.services.storage_service import StorageService
+    
+    try:
+        sink = load_sink(args.sink)
+    except (ValueError, ImportError, AttributeError, TypeError) as e:
+        print(f"Error loading notification sink: {e}", file=sys.stderr)
+        return 2
+    
+    if args.simulate is None:
+        engine = ReminderEngine(sink, storage=StorageService(backend=args.storage))
+        engine.load()
+        runner = HeadlessRunner(engine)
+        # A service manager stops us with SIGTERM: handle it like Ctrl+C
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            runner.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            engine.shutdown()
+        return 0
+    
+    # Simulate on a copy of the saved reminders; nothing is written back
+    saved_reminders = load_saved_copy(args.storage)
+    clock = FakeClock()
+    engine = ReminderEngine(sink, clock=clock)
+    for reminder in saved_reminders or engine.default_reminders():
+        engine.add(reminder)
+    runner = HeadlessRunner(engine, watchdog_interval=None)
+    started = time.perf_counter()
+    runner.run(until=clock.now() + timedelta(days=args.simulate))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"Simulated {args.simulate:g} day(s) of {len(engine.index)} reminders "
+          f"in {elapsed_ms:.1f} ms ({runner.ticks} ticks)", file=sys.stderr)
+    return 0
+
 
 def main():
+    args = parse_args(sys.argv[1:])
+    if args.headless or args.simulate is not None:
+        sys.exit(run_headless(args))
+    
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    from src.ui.main_window import MainWindow
+    from src.services.audio_service import AudioService
+    from src.services.notification_service import NotificationService
+    
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(storage_backend=args.storage)
     window.show()
+    # Initialize audio off the GUI thread once the first frame is up
+    QTimer.singleShot(0, AudioService().warm_up)
+    QTimer.singleShot(0, lambda: NotificationService().prewarm(1, window))
     sys.exit(app.exec())
 
 if __name__ == "__main__":
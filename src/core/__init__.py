@@ -0,0 +1,5 @@
+"""Core package: reminder scheduling without a UI toolkit"""
+from .clock import Clock, FakeClock
+from .engine import ReminderEngine
+from .runner import HeadlessRunner
+from .sinks import Notification, NotificationSink, ConsoleSink, JsonSink, load_sink
@@ -0,0 +1,74 @@
+"""
+Clock - Wall and monotonic time for the scheduling core
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+# Longest single timer wait the hosts arm; longer waits re-arm when it elapses
+MAX_TIMER_MS = 24 * 60 * 60 * 1000
+
+
+class Clock:
+    """
+    The real clocks. Everything in the core reads time through a Clock so a
+    FakeClock can stand in for it, e.g. to simulate a whole day at once.
+    """
+    
+    def now(self) -> datetime:
+        """Local wall-clock time"""
+        return datetime.now()
+    
+    def monotonic(self) -> float:
+        """Seconds on a clock that never jumps"""
+        return time.monotonic()
+    
+    def sync_zone(self):
+        """Pick up a changed local time zone; the C library caches it otherwise"""
+        if hasattr(time, "tzset"):
+            time.tzset()
+    
+    def sleep_until(self, when: datetime):
+        """Block until the wall clock reaches when"""
+        delay = (when - self.now()).total_seconds()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FakeClock(Clock):
+    """
+    A clock that only moves when told to. advance() moves both clocks
+    together like time passing; jump() moves only the wall clock, like a
+    suspend or the user setting the time. Sleeping returns immediately.
+    """
+    
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime.now().replace(microsecond=0)
+        self._monotonic = 0.0
+    
+    def now(self) -> datetime:
+        return self._now
+    
+    def monotonic(self) -> float:
+        return self._monotonic
+    
+    def sync_zone(self):
+        pass
+    
+    def advance(self, delta: Union[timedelta, float]):
+        """Let delta (a timedelta or seconds) pass on both clocks"""
+        if not isinstance(delta, timedelta):
+            delta = timedelta(seconds=delta)
+        self._now += delta
+        self._monotonic += delta.total_seconds()
+    
+    def jump(self, delta: Union[timedelta, float]):
+        """Move only the wall clock by delta"""
+        if not isinstance(delta, timedelta):
+            delta = timedelta(seconds=delta)
+        self._now += delta
+    
+    def sleep_until(self, when: datetime):
+        if when > self._now:
+            self.advance(when - self._now)
@@ -0,0 +1,174 @@
+"""
+Engine - The reminder app's state and behaviour, independent of any UI
+"""
+
+from datetime import datetime
+from typing import Callable, List, Optional
+from src.core.clock import Clock
+from src.core.rollover import DayRollover
+from src.core.scheduler import Scheduler, Occurrences
+from src.core.sinks import Notification, NotificationSink
+from src.models.recurrence import Recurrence
+from src.models.reminder import Reminder, format_time
+from src.models.reminder_index import ReminderIndex
+from src.models.trigger_log import TriggerLog
+from src.services.storage_service import StorageService
+
+
+class ReminderEngine:
+    """
+    Owns the reminders and everything that acts on them: the index, the
+    Scheduler, the DayRollover and the TriggerLog, optionally backed by a
+    StorageService. Due and missed reminders are delivered to a
+    NotificationSink. Time is read from an injectable Clock, and nothing
+    here needs an event loop: RemindersPanel drives the engine with Qt
+    timers, HeadlessRunner by sleeping on the clock.
+    
+    Without a storage service nothing is loaded or written, which is what
+    simulations and benchmarks want.
+    """
+    
+    def __init__(self, sink: NotificationSink, clock: Optional[Clock] = None,
+                 storage: Optional[StorageService] = None):
+        self.sink = sink
+        self.clock = clock or Clock()
+        self.storage = storage
+        self.index = ReminderIndex()
+        self.trigger_log = TriggerLog()  # Occurrences already shown
+        
+        self.scheduler = Scheduler(self.index, self.clock)
+        self.scheduler.on_fired = self.on_fired
+        self.rollover = DayRollover(self.index, self.clock)
+        self.rollover.on_reset = self.on_day_rollover
+        self.scheduler.on_clock_jump = self.rollover.clock_changed
+        self.scheduler.on_new_day = self.rollover.check_rollover
+        
+        # Called with the reminders a rollover reset, so views can repaint them
+        self.on_reminders_changed: Optional[Callable[[List[Reminder]], None]] = None
+    
+    @staticmethod
+    def default_reminders() -> List[Reminder]:
+        """Reminders seeded on a true first run"""
+        return [
+            Reminder(8 * 60, "Learn 10 new words", repeat_daily=True),
+            Reminder(12 * 60, "Practice pronunciation", repeat_daily=True),
+            Reminder(15 * 60, "Grammar exercise", repeat_daily=True),
+            Reminder(19 * 60, "Review vocabulary", repeat_daily=True),
+        ]
+    
+    def load(self):
+        """Load reminders and shown occurrences from storage, or seed the defaults"""
+        if self.storage is None:
+            return
+        saved_reminders, is_new_day = self.storage.load_reminders()
+        
+        # Only seed defaults on a true first run, never because the saved
+        # data was empty or could not be read
+        if saved_reminders or self.storage.has_saved_data():
+            for reminder in saved_reminders:
+                self.add(reminder, persist=False)
+            if is_new_day:
+                # Save the reset state
+                self.save()
+        else:
+            for reminder in self.default_reminders():
+                self.add(reminder, persist=False)
+            self.save()
+        
+        self.trigger_log.load(self.storage.load_triggers(), self.clock.now())
+        # load_reminders() already did any new-day reset, so the rollover
+        # starts from the date of the load, not of __init__
+        self.rollover.current_date = self.clock.now().date()
+    
+    def save(self):
+        """Write every reminder to storage"""
+        if self.storage is not None:
+            self.storage.save_reminders(self.index)
+    
+    def add(self, reminder: Reminder, persist: bool = True):
+        """Add and schedule a reminder"""
+        self.index.add(reminder)
+        self.scheduler.schedule(reminder)
+        if persist and self.storage is not None:
+            self.storage.mark_dirty(reminder)
+    
+    def status_changed(self, reminder: Reminder):
+        """Re-schedule a reminder completed or un-completed and persist the change"""
+        self.scheduler.schedule(reminder)
+        if self.storage is not None:
+            self.storage.mark_dirty(reminder)
+    
+    def remove(self, reminder: Reminder) -> bool:
+        """Remove a reminder; False if it was not in the engine"""
+        if reminder not in self.index:
+            return False
+        self.index.remove(reminder)
+        self.scheduler.unschedule(reminder)
+        if self.storage is not None:
+            self.storage.mark_deleted(reminder.id)
+        return True
+    
+    def next_wakeup(self, now: Optional[datetime] = None) -> datetime:
+        """Earliest time tick() has something to do"""
+        next_rollover = self.rollover.next_rollover(now)
+        next_due = self.scheduler.next_due()
+        return min(next_due, next_rollover) if next_due is not None else next_rollover
+    
+    def tick(self, now: Optional[datetime] = None):
+        """Handle everything that has come due by now"""
+        # The scheduler rolls the day over at the right point of its pass
+        self.scheduler.check_clock(now)
+    
+    def on_fired(self, due: Occurrences, missed: Occurrences):
+        """Deliver one scheduler pass: on-time reminders one by one, missed ones together"""
+        marked = False
+        for reminder, occurrence in due:
+            if self._is_pending(reminder) and self._mark_fired(reminder, occurrence):
+                marked = True
+                self.notify_reminder(reminder, occurrence)
+        
+        late = [reminder for reminder, occurrence in missed
+                if self._is_pending(reminder)
+                and self._mark_fired(reminder, occurrence)]
+        if len(late) == 1:
+            self.notify_reminder(late[0], missed=True)
+        elif late:
+            self.sink.notify(Notification(f"{len(late)} missed", late, self.clock.now(),
+                                          missed=True))
+        
+        # Persist once per pass, however many fired together
+        if (marked or late) and self.storage is not None:
+            self.storage.save_triggers(self.trigger_log.entries())
+    
+    def notify_reminder(self, reminder: Reminder, occurrence: Optional[datetime] = None,
+                        missed: bool = False):
+        """Deliver a single reminder, titled with the time it was due"""
+        if occurrence is not None:
+            title = format_time(occurrence.hour * 60 + occurrence.minute, twelve_hour=True)
+        else:
+            title = reminder.time_text(twelve_hour=True)
+        self.sink.notify(Notification(title, [reminder], self.clock.now(), occurrence, missed))
+    
+    def on_day_rollover(self, reminders: List[Reminder]):
+        """A new day started: re-arm and persist only the reset reminders"""
+        for reminder in reminders:
+            self.scheduler.schedule(reminder)
+            if self.storage is not None:
+                self.storage.mark_dirty(reminder)
+        if self.on_reminders_changed is not None:
+            self.on_reminders_changed(reminders)
+    
+    def shutdown(self):
+        """Write any pending changes"""
+        if self.storage is not None:
+            self.storage.close()
+    
+    def _mark_fired(self, reminder: Reminder, occurrence: datetime) -> bool:
+        """Log an occurrence as shown; False if it already was"""
+        # Hourly rules step in real time, so a repeated DST hour is new for them
+        real_time = reminder.recurrence is not None and \
+            reminder.recurrence.freq == Recurrence.HOURLY
+        return self.trigger_log.mark(reminder.id, occurrence, self.clock.now(), real_time)
+    
+    def _is_pending(self, reminder: Reminder) -> bool:
+        return not reminder.completed and reminder in self.index
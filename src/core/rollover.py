@@ -0,0 +1,71 @@
+"""
+Rollover - Resets repeating reminders when the local date changes
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+from src.core.clock import Clock
+from src.models.reminder import Reminder
+from src.models.reminder_index import ReminderIndex
+
+
+class DayRollover:
+    """
+    Tracks the local date. On rollover every completed repeating reminder
+    is reset in a single pass and the ones that changed are reported
+    together through on_reset(reminders). Like Scheduler it owns no timer:
+    next_rollover() says when to call check_rollover() again, and on_rearm
+    is called with that time whenever it may have moved. Clock jumps and
+    time zone changes move local midnight; the scheduler re-reads the zone
+    (Clock.sync_zone) on each check, sees both as wall-clock jumps and
+    calls clock_changed().
+    """
+    
+    SLACK = timedelta(milliseconds=50)  # Check just after midnight so the date has moved on
+    
+    def __init__(self, index: ReminderIndex, clock: Optional[Clock] = None):
+        self.index = index
+        self.clock = clock or Clock()
+        self.current_date = self.clock.now().date()
+        self.rollovers = 0
+        
+        self.on_reset: Optional[Callable[[List[Reminder]], None]] = None
+        self.on_rearm: Optional[Callable[[datetime], None]] = None
+    
+    @staticmethod
+    def next_midnight(now: datetime) -> datetime:
+        """Start of the next local day"""
+        return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    
+    def next_rollover(self, now: Optional[datetime] = None) -> datetime:
+        """When check_rollover() should run next"""
+        return self.next_midnight(now or self.clock.now()) + self.SLACK
+    
+    def clock_changed(self):
+        """The wall clock jumped: roll over if the date moved, then re-arm"""
+        self.check_rollover()
+    
+    def check_rollover(self, today: Optional[date] = None) -> bool:
+        """Reset reminders if the date has moved on since the last check"""
+        today = today or self.clock.now().date()
+        rolled = today > self.current_date
+        if rolled:
+            self.current_date = today
+            self.rollovers += 1
+            changed = self.reset_reminders()
+            if self.on_reset is not None:
+                self.on_reset(changed)
+        elif today < self.current_date:
+            # Clock set back past midnight: follow it without resetting
+            self.current_date = today
+        if self.on_rearm is not None:
+            self.on_rearm(self.next_rollover())
+        return rolled
+    
+    def reset_reminders(self) -> List[Reminder]:
+        """Reset completed repeating reminders, returns only those that changed"""
+        changed = [r for r in self.index
+                   if r.completed and (r.repeat_daily or r.recurrence is not None)]
+        for reminder in changed:
+            reminder.completed = False
+        return changed
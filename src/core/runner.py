@@ -0,0 +1,49 @@
+"""
+Runner - Drives a ReminderEngine without an event loop
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+from src.core.engine import ReminderEngine
+
+
+class HeadlessRunner:
+    """
+    Sleeps on the engine's clock until the next thing is due, then ticks
+    the engine. Sleeps are capped at watchdog_interval seconds so a
+    suspend or a clock change is noticed within that time, like the
+    watchdog timer in the Qt app. With a FakeClock every sleep returns at
+    once, so run(until=...) simulates that span as fast as the engine can
+    process it; pass watchdog_interval=None there, as a fake clock never
+    drifts.
+    """
+    
+    WATCHDOG_INTERVAL = 30.0
+    
+    def __init__(self, engine: ReminderEngine, watchdog_interval: Optional[float] = WATCHDOG_INTERVAL):
+        self.engine = engine
+        self.watchdog_interval = watchdog_interval
+        self.ticks = 0
+        self._running = False
+    
+    def run(self, until: Optional[datetime] = None):
+        """Tick the engine until stop() is called or the clock reaches until"""
+        clock = self.engine.clock
+        self._running = True
+        while self._running:
+            now = clock.now()
+            if until is not None and now >= until:
+                break
+            wake = self.engine.next_wakeup(now)
+            if self.watchdog_interval is not None:
+                wake = min(wake, now + timedelta(seconds=self.watchdog_interval))
+            if until is not None:
+                wake = min(wake, until)
+            clock.sleep_until(wake)
+            self.engine.tick()
+            self.ticks += 1
+        self._running = False
+    
+    def stop(self):
+        """Make run() return after the current tick"""
+        self._running = False
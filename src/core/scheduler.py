@@ -0,0 +1,321 @@
+"""
+Scheduler - Event-driven scheduling of due reminders, without a UI toolkit
+"""
+
+import heapq
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from src.core.clock import Clock
+from src.models.reminder import Reminder
+from src.models.reminder_index import ReminderIndex, MINUTES_PER_DAY, minute_of_day
+
+Occurrences = List[Tuple[Reminder, datetime]]
+
+
+class Scheduler:
+    """
+    Keeps the occupied minutes of a ReminderIndex in a min-heap keyed by
+    their next fire time. Reminders with a recurrence rule get a heap entry
+    of their own at their cached next occurrence, which is only recomputed
+    when it fires or the reminder is edited. Adding, removing or completing
+    a reminder costs at most O(log n).
+    
+    The scheduler owns no timer. Whenever the earliest fire time changes it
+    calls on_rearm(fire_at) (None when nothing is scheduled), and the host
+    calls timer_fired() once that time has come: SchedulerService does this
+    with a QTimer, HeadlessRunner by sleeping on the Clock.
+    
+    The last processed wall-clock instant is kept next to a monotonic
+    reference; check_clock() compares the two. When the wall clock ran
+    ahead (suspend, clock set forward) everything due in the gap is found
+    with one range query on the index; when it went back the heap is
+    rebuilt. A pass that crosses local midnight calls on_new_day(date)
+    before anything of the new day is looked at, so the day rollover always
+    runs at the same point whichever host drives the scheduler; a catch-up
+    gap is split there and each part is read with the completion state of
+    its own day. Each pass reports through on_fired(due, missed), both lists of
+    (reminder, occurrence); reminders whose minute passed more than
+    LATE_TOLERANCE ago (after a suspend or a stalled loop) count as missed.
+    """
+    
+    LATE_TOLERANCE = timedelta(minutes=1)
+    JUMP_TOLERANCE = 5.0  # Seconds the wall clock may drift from the monotonic one
+    
+    SLOT = 0  # Heap entry for a minute of day of daily reminders
+    RULE = 1  # Heap entry for one reminder with a recurrence rule
+    
+    def __init__(self, index: ReminderIndex, clock: Optional[Clock] = None):
+        self.index = index
+        self.clock = clock or Clock()
+        self._heap = []  # [fire_at, kind, minute or reminder id, active]
+        self._slots: Dict[int, list] = {}  # minute of day -> heap entry
+        self._rules: Dict[str, list] = {}  # reminder id -> heap entry
+        self._armed_for: Optional[datetime] = None
+        self.last_processed = self.clock.now()
+        self._monotonic_ref = self.clock.monotonic()
+        
+        self.on_rearm: Optional[Callable[[Optional[datetime]], None]] = None
+        self.on_fired: Optional[Callable[[Occurrences, Occurrences], None]] = None
+        self.on_clock_jump: Optional[Callable[[], None]] = None
+        self.on_new_day: Optional[Callable[[date], None]] = None
+    
+    @staticmethod
+    def next_fire_time(minute: int, now: datetime) -> datetime:
+        """Next start of the given minute of day that has not fully passed"""
+        fire_at = now.replace(hour=minute // 60, minute=minute % 60, second=0, microsecond=0)
+        # Still inside the minute counts as due now
+        if fire_at + timedelta(minutes=1) <= now:
+            fire_at += timedelta(days=1)
+        return fire_at
+    
+    def next_rule_time(self, reminder: Reminder, now: datetime) -> Optional[datetime]:
+        """Next occurrence of a rule-based reminder; one in the current minute is due now"""
+        return reminder.next_occurrence(now - timedelta(minutes=1))
+    
+    def schedule(self, reminder: Reminder):
+        """Make sure a (re-)added or un-completed reminder's minute is armed"""
+        if reminder.completed:
+            self.unschedule(reminder)
+            return
+        if reminder.recurrence is not None:
+            self._discard(self.RULE, reminder.id)
+            fire_at = self.next_rule_time(reminder, self.clock.now())
+            if fire_at is not None:
+                self._push(self.RULE, reminder.id, fire_at)
+            self._rearm()
+            return
+        minute = minute_of_day(reminder)
+        fire_at = self.next_fire_time(minute, self.clock.now())
+        entry = self._slots.get(minute)
+        # A slot that already fired this minute is armed for tomorrow; bring
+        # it back so a reminder added to it now still fires (the trigger
+        # log keeps the ones already shown from repeating)
+        if entry is None or entry[0] > fire_at:
+            self._discard(self.SLOT, minute)
+            self._push(self.SLOT, minute, fire_at)
+            self._rearm()
+    
+    def unschedule(self, reminder: Reminder):
+        """Drop the reminder's minute if nothing pending is left in it"""
+        if reminder.id in self._rules:
+            self._discard(self.RULE, reminder.id)
+            self._rearm()
+        minute = minute_of_day(reminder)
+        if minute in self._slots and not self._pending_at(minute):
+            self._discard(self.SLOT, minute)
+            self._rearm()
+    
+    def reschedule_all(self, include_current: bool = True, now: Optional[datetime] = None):
+        """
+        Rebuild the heap from the index (e.g. after a daily reset). With
+        include_current=False the minute in progress counts as handled.
+        """
+        now = now or self.clock.now()
+        self._heap = []
+        self._slots.clear()
+        self._rules.clear()
+        for minute in self.index.occupied_minutes():
+            if self._pending_at(minute):
+                fire_at = self.next_fire_time(minute, now)
+                if not include_current and fire_at <= now:
+                    fire_at += timedelta(days=1)
+                entry = [fire_at, self.SLOT, minute, True]
+                self._slots[minute] = entry
+                self._heap.append(entry)
+        for reminder in self.index.recurring():
+            if reminder.completed:
+                continue
+            fire_at = reminder.next_occurrence(now) if not include_current \
+                else self.next_rule_time(reminder, now)
+            if fire_at is not None:
+                entry = [fire_at, self.RULE, reminder.id, True]
+                self._rules[reminder.id] = entry
+                self._heap.append(entry)
+        heapq.heapify(self._heap)
+        self._armed_for = None
+        self._rearm()
+    
+    def clear(self):
+        """Drop every scheduled minute"""
+        self._heap = []
+        self._slots.clear()
+        self._rules.clear()
+        self._rearm()
+    
+    def next_due(self) -> Optional[datetime]:
+        """Fire time of the earliest scheduled minute"""
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+    
+    def timer_fired(self):
+        """The host's timer for the armed fire time went off"""
+        self._armed_for = None
+        self.check_clock()
+    
+    def _pending_at(self, minute: int) -> bool:
+        return any(not r.completed for r in self.index.due_at(minute))
+    
+    def _entries(self, kind: int) -> dict:
+        return self._slots if kind == self.SLOT else self._rules
+    
+    def _push(self, kind: int, key, fire_at: datetime):
+        entry = [fire_at, kind, key, True]
+        self._entries(kind)[key] = entry
+        heapq.heappush(self._heap, entry)
+    
+    def _discard(self, kind: int, key):
+        # Lazy deletion: mark the entry dead, it is dropped when it reaches the top
+        entry = self._entries(kind).pop(key, None)
+        if entry:
+            entry[3] = False
+    
+    def _prune(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+    
+    def _rearm(self):
+        """Tell the host about the earliest entry, only if it changed"""
+        fire_at = self.next_due()
+        if fire_at == self._armed_for:
+            return
+        self._armed_for = fire_at
+        if self.on_rearm is not None:
+            self.on_rearm(fire_at)
+    
+    def clock_drift(self, now: datetime) -> float:
+        """Seconds the wall clock moved beyond the monotonic clock since the last check"""
+        monotonic_now = self.clock.monotonic()
+        wall = (now - self.last_processed).total_seconds()
+        return wall - (monotonic_now - self._monotonic_ref)
+    
+    def check_clock(self, now: Optional[datetime] = None):
+        """Catch up after a wall-clock jump, otherwise just advance"""
+        if now is None:
+            # A time zone change then reads as a wall-clock jump
+            self.clock.sync_zone()
+            now = self.clock.now()
+        drift = self.clock_drift(now)
+        if drift > self.JUMP_TOLERANCE:
+            self.catch_up(now)
+            self._clock_jumped()
+        elif drift < -self.JUMP_TOLERANCE:
+            # Clock set back: fire times were computed on the old clock
+            self._mark_processed(now)
+            self.reschedule_all(now=now)
+            self._clock_jumped()
+        else:
+            # Roll over first so reminders reset at midnight can fire right away
+            if now.date() > self.last_processed.date():
+                self._new_day(now.date())
+            self._process_heap(now)
+    
+    def catch_up(self, now: Optional[datetime] = None):
+        """Handle everything due since the last processed instant in one pass"""
+        now = now or self.clock.now()
+        start = self.last_processed
+        if now.date() > start.date():
+            # Yesterday's part still sees what was completed yesterday; after
+            # the rollover only today's part is read, whole days skipped in
+            # between would only repeat the same reminders
+            end_of_day = datetime.combine(start.date() + timedelta(days=1),
+                                          datetime.min.time()) - timedelta(microseconds=1)
+            fired = self.due_in_gap(start, end_of_day)
+            self._new_day(now.date())
+            start_of_today = datetime.combine(now.date(), datetime.min.time())
+            fired += self.due_in_gap(max(start, start_of_today - timedelta(microseconds=1)), now)
+            # A reminder missed on both days is reported once, at its latest time
+            latest = {reminder.id: fire_at for fire_at, reminder in fired}
+            fired = [(fire_at, reminder) for fire_at, reminder in fired
+                     if latest[reminder.id] == fire_at]
+        else:
+            fired = self.due_in_gap(start, now)
+        self._mark_processed(now)
+        self.reschedule_all(include_current=False, now=now)
+        self._emit(fired, now)
+    
+    def due_in_gap(self, start: datetime, end: datetime) -> List[Tuple[datetime, Reminder]]:
+        """
+        (fire time, reminder) for every pending reminder whose minute began
+        in (start, end], each at most once, found with a single range query.
+        """
+        first = start.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        if end < first:
+            return []
+        count = min(int((end - first).total_seconds() // 60) + 1, MINUTES_PER_DAY)
+        first_minute = first.hour * 60 + first.minute
+        due = []
+        for reminder in self.index.due_between(first_minute, first_minute + count - 1):
+            if not reminder.completed:
+                offset = (minute_of_day(reminder) - first_minute) % MINUTES_PER_DAY
+                due.append((first + timedelta(minutes=offset), reminder))
+        # Rule-based reminders: the latest occurrence in the gap, if any
+        for reminder in self.index.recurring():
+            if reminder.completed:
+                continue
+            occurrence = reminder.next_occurrence(start)
+            if occurrence is None or occurrence > end:
+                continue
+            while True:
+                following = reminder.next_occurrence(occurrence)
+                if following is None or following > end:
+                    break
+                occurrence = following
+            due.append((occurrence, reminder))
+        due.sort(key=lambda item: item[0])
+        return due
+    
+    def _mark_processed(self, now: datetime):
+        self.last_processed = now
+        self._monotonic_ref = self.clock.monotonic()
+    
+    def _new_day(self, today: date):
+        if self.on_new_day is not None:
+            self.on_new_day(today)
+    
+    def _clock_jumped(self):
+        if self.on_clock_jump is not None:
+            self.on_clock_jump()
+    
+    def _process_heap(self, now: datetime):
+        """Report every reminder in the minutes that have come and re-arm"""
+        fired = []
+        self._prune()
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, kind, key, _ = heapq.heappop(self._heap)
+            del self._entries(kind)[key]
+            if kind == self.RULE:
+                reminder = self.index.get(key)
+                if reminder is not None and not reminder.completed:
+                    fired.append((fire_at, reminder))
+                    next_at = reminder.next_occurrence(max(fire_at, now))
+                    while next_at is not None and next_at <= now:
+                        # The hour repeated when DST ends reads as passed; the
+                        # clock going back reschedules it, the next one stands in
+                        next_at = reminder.next_occurrence(next_at)
+                    if next_at is not None:
+                        self._push(self.RULE, key, next_at)
+            else:
+                pending = [r for r in self.index.due_at(key) if not r.completed]
+                if pending:
+                    fired.extend((fire_at, r) for r in pending)
+                    # Daily reminders fire again on the next day still to come
+                    next_at = fire_at + timedelta(days=1)
+                    while next_at <= now:
+                        next_at += timedelta(days=1)
+                    self._push(self.SLOT, key, next_at)
+            self._prune()
+        self._mark_processed(now)
+        self._rearm()
+        self._emit(fired, now)
+    
+    def _emit(self, fired: List[Tuple[datetime, Reminder]], now: datetime):
+        """Split a pass into on-time and late (missed) occurrences"""
+        if not fired or self.on_fired is None:
+            return
+        due, missed = [], []
+        for fire_at, reminder in fired:
+            if fire_at + self.LATE_TOLERANCE > now:
+                due.append((reminder, fire_at))
+            else:
+                missed.append((reminder, fire_at))
+        self.on_fired(due, missed)
@@ -0,0 +1,94 @@
+"""
+Sinks - Where the core delivers reminder notifications
+"""
+
+import importlib
+import json
+import sys
+from datetime import datetime
+from typing import List, Optional, TextIO
+from src.models.reminder import Reminder
+
+
+class Notification:
+    """One notification: a reminder that came due, or several missed ones"""
+    
+    __slots__ = ("title", "reminders", "occurrence", "at", "missed")
+    
+    def __init__(self, title: str, reminders: List[Reminder], at: datetime,
+                 occurrence: Optional[datetime] = None, missed: bool = False):
+        self.title = title
+        self.reminders = reminders
+        self.at = at  # When it was delivered, on the engine's clock
+        self.occurrence = occurrence
+        self.missed = missed
+    
+    @property
+    def contents(self) -> List[str]:
+        return [r.content for r in self.reminders]
+
+
+class NotificationSink:
+    """
+    Receives notifications from a ReminderEngine. Anything with a
+    notify(notification) method will do; RemindersPanel shows them as
+    popups, the sinks below write them to a stream for headless runs.
+    """
+    
+    def notify(self, notification: Notification):
+        raise NotImplementedError
+
+
+class ConsoleSink(NotificationSink):
+    """One human-readable line per notification"""
+    
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+    
+    def notify(self, notification: Notification):
+        self.stream.write(f"[{notification.at:%Y-%m-%d %H:%M:%S}] {notification.title}: "
+                          f"{' · '.join(notification.contents)}\n")
+        self.stream.flush()
+
+
+class JsonSink(NotificationSink):
+    """One JSON object per line, for other programs to consume"""
+    
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+    
+    def notify(self, notification: Notification):
+        occurrence = notification.occurrence
+        self.stream.write(json.dumps({
+            "at": notification.at.isoformat(timespec="seconds"),
+            "title": notification.title,
+            "occurrence": occurrence.isoformat(timespec="seconds") if occurrence else None,
+            "missed": notification.missed,
+            "reminders": [{"id": r.id, "content": r.content} for r in notification.reminders],
+        }, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+SINKS = {"console": ConsoleSink, "json": JsonSink}
+
+
+def load_sink(spec: str) -> NotificationSink:
+    """
+    Create a sink from its name ("console", "json") or a
+    "package.module:factory" path to any callable returning an object
+    with a notify(notification) method
+    """
+    if spec in SINKS:
+        return SINKS[spec]()
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown notification sink: {spec}")
+    factory = getattr(importlib.import_module(module_name), attr)
+    if not callable(factory):
+        raise TypeError(f"Notification sink factory {spec} is not callable")
+    sink = factory()
+    # Any object with a notify(notification) method will do
+    if not callable(getattr(sink, "notify", None)):
+        raise TypeError(f"Notification sink factory {spec} returned "
+                        f"{type(sink).__name__}, which has no notify() method")
+    return sink
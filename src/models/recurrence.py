@@ -0,0 +1,146 @@
+"""
+Recurrence - Repeat rules for reminders (a practical RRULE subset)
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import FrozenSet, Iterable, Optional
+
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Anchor for rules saved without a DTSTART, so their cycle never shifts
+DEFAULT_START = date(1970, 1, 5)  # A Monday
+
+
+class Recurrence:
+    """
+    When a reminder repeats: FREQ=DAILY, WEEKLY or HOURLY every INTERVAL
+    units counted from DTSTART, optionally limited to BYDAY weekdays and
+    ending at UNTIL. The reminder's minute of day gives the time for daily
+    and weekly rules and the first occurrence for hourly ones.
+    
+    Daily and weekly occurrences are local wall-clock times, so they keep
+    their time of day across DST changes (a time skipped by the change is
+    reported as the naive local time and fires when the clock reaches the
+    next minute). Hourly occurrences are stepped in real elapsed time, so
+    the hour repeated when DST ends occurs twice; the second pass is
+    returned with fold=1.
+    """
+    
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    HOURLY = "HOURLY"
+    FREQUENCIES = (DAILY, WEEKLY, HOURLY)
+    
+    __slots__ = ("freq", "interval", "weekdays", "start", "until")
+    
+    def __init__(self, freq: str = DAILY, interval: int = 1, weekdays: Iterable[int] = (),
+                 start: Optional[date] = None, until: Optional[datetime] = None):
+        if freq not in self.FREQUENCIES:
+            raise ValueError(f"unsupported FREQ: {freq!r}")
+        if interval < 1:
+            raise ValueError(f"INTERVAL must be positive: {interval}")
+        self.freq = freq
+        self.interval = interval
+        self.weekdays: FrozenSet[int] = frozenset(weekdays)  # 0 = Monday
+        self.start = start or date.today()
+        self.until = until
+        if freq == self.WEEKLY and not self.weekdays:
+            self.weekdays = frozenset([self.start.weekday()])
+    
+    @classmethod
+    def parse(cls, text: str) -> "Recurrence":
+        """
+        Parse "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE", optionally with an
+        "RRULE:" prefix and a "DTSTART:YYYYMMDD" line before it
+        """
+        params = {}
+        start = DEFAULT_START
+        for line in text.strip().splitlines():
+            line = line.strip()
+            if line.upper().startswith("DTSTART"):
+                start = datetime.strptime(line.split(":", 1)[1][:8], "%Y%m%d").date()
+                continue
+            if line.upper().startswith("RRULE:"):
+                line = line[6:]
+            for part in filter(None, line.split(";")):
+                key, _, value = part.partition("=")
+                params[key.strip().upper()] = value.strip().upper()
+        
+        if "FREQ" not in params:
+            raise ValueError(f"RRULE without FREQ: {text!r}")
+        weekdays = [WEEKDAY_CODES.index(code) for code in params.get("BYDAY", "").split(",") if code]
+        until = None
+        if "UNTIL" in params:
+            value = params["UNTIL"].rstrip("Z")
+            until = datetime.strptime(value, "%Y%m%dT%H%M%S") if "T" in value \
+                else datetime.combine(datetime.strptime(value, "%Y%m%d").date(), time.max)
+        return cls(params["FREQ"], int(params.get("INTERVAL", 1)), weekdays, start, until)
+    
+    def to_rrule(self) -> str:
+        """Text form understood by parse()"""
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.weekdays:
+            parts.append("BYDAY=" + ",".join(WEEKDAY_CODES[d] for d in sorted(self.weekdays)))
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%dT%H%M%S}")
+        return f"DTSTART:{self.start:%Y%m%d}\nRRULE:" + ";".join(parts)
+    
+    def next_after(self, minute_of_day: int, after: datetime) -> Optional[datetime]:
+        """First occurrence strictly after the given local time, or None once the rule has ended"""
+        if self.freq == self.HOURLY:
+            occurrence = self._next_hourly(minute_of_day, after)
+        else:
+            occurrence = self._next_by_day(minute_of_day, after)
+        if occurrence is None or (self.until is not None and occurrence > self.until):
+            return None
+        return occurrence
+    
+    def _day_matches(self, day: date) -> bool:
+        if day < self.start:
+            return False
+        if self.weekdays and day.weekday() not in self.weekdays:
+            return False
+        if self.freq == self.DAILY:
+            return (day - self.start).days % self.interval == 0
+        # WEEKLY: weeks counted from the Monday of DTSTART's week
+        first_monday = self.start - timedelta(days=self.start.weekday())
+        return ((day - first_monday).days // 7) % self.interval == 0
+    
+    def _next_by_day(self, minute_of_day: int, after: datetime) -> Optional[datetime]:
+        at = time(minute_of_day // 60, minute_of_day % 60)
+        day = max(after.date(), self.start)
+        # The day pattern repeats within interval weeks
+        for _ in range(7 * self.interval + 1):
+            if self._day_matches(day):
+                occurrence = datetime.combine(day, at)
+                if occurrence > after:
+                    return occurrence
+            day += timedelta(days=1)
+        return None
+    
+    def _next_hourly(self, minute_of_day: int, after: datetime) -> Optional[datetime]:
+        anchor = datetime.combine(self.start, time(minute_of_day // 60, minute_of_day % 60))
+        # Step in epoch seconds and convert each step to local time, so a DST
+        # change neither stretches an interval nor skips the repeated hour.
+        # timestamp() honours after.fold, fromtimestamp() sets it.
+        anchor_ts = anchor.timestamp()
+        step = self.interval * 3600
+        k = max(0, int((after.timestamp() - anchor_ts) // step) + 1)
+        for _ in range(7 * 24 + 1):
+            occurrence = datetime.fromtimestamp(anchor_ts + k * step)
+            if not self.weekdays or occurrence.weekday() in self.weekdays:
+                return occurrence
+            k += 1
+        return None
+    
+    def __eq__(self, other):
+        if not isinstance(other, Recurrence):
+            return NotImplemented
+        return self.to_rrule() == other.to_rrule()
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"Recurrence({self.to_rrule()!r})"
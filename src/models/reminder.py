@@ -3,42 +3,137 @@ Reminder Model - Data model for reminders
 """
 
 import uuid
-from PyQt6.QtCore import QTime
-from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+from src.models.recurrence import Recurrence
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def parse_time(text: str) -> int:
+    """Minute of day (0-1439) for an "hh:mm" string"""
+    hours, minutes = text.split(":")
+    minute = int(hours) * 60 + int(minutes)
+    if not 0 <= minute < MINUTES_PER_DAY:
+        raise ValueError(f"time out of range: {text!r}")
+    return minute
+
+
+def format_time(minute: int, twelve_hour: bool = False) -> str:
+    """"hh:mm" for a minute of day, or "hh:mm AM/PM" with twelve_hour"""
+    hours, minutes = divmod(minute, 60)
+    if not twelve_hour:
+        return f"{hours:02d}:{minutes:02d}"
+    suffix = "AM" if hours < 12 else "PM"
+    return f"{hours % 12 or 12:02d}:{minutes:02d} {suffix}"
 
 
-@dataclass
 class Reminder:
-    """Reminder data model"""
-    time: QTime
-    content: str
-    completed: bool = False
-    repeat_daily: bool = True  # Lặp lại hàng ngày
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    """
+    Reminder data model.
+    The time is kept as a plain minute of day (0-1439); widgets convert it
+    to and from QTime at the UI edge. __slots__ keeps each instance small.
+    
+    Without a recurrence the reminder is due every day at its time. With
+    one, next_occurrence() follows the rule and caches its answer until
+    that occurrence passes, or until the time or the rule is edited.
+    """
+    
+    __slots__ = ("_minute_of_day", "content", "completed", "repeat_daily", "id",
+                 "_recurrence", "_next_from", "_next_at")
+    
+    def __init__(self, minute_of_day: int, content: str, completed: bool = False,
+                 repeat_daily: bool = True,  # Lặp lại hàng ngày
+                 id: Optional[str] = None, recurrence: Optional[Recurrence] = None):
+        self.minute_of_day = minute_of_day
+        self.content = content
+        self.completed = completed
+        self.repeat_daily = repeat_daily
+        self.id = id if id is not None else str(uuid.uuid4())
+        self.recurrence = recurrence
+    
+    @property
+    def minute_of_day(self) -> int:
+        return self._minute_of_day
+    
+    @minute_of_day.setter
+    def minute_of_day(self, minute: int):
+        self._minute_of_day = minute
+        self._next_from = self._next_at = None
+    
+    @property
+    def recurrence(self) -> Optional[Recurrence]:
+        return self._recurrence
+    
+    @recurrence.setter
+    def recurrence(self, recurrence: Optional[Recurrence]):
+        self._recurrence = recurrence
+        self._next_from = self._next_at = None
+    
+    @property
+    def hour(self) -> int:
+        return self.minute_of_day // 60
+    
+    @property
+    def minute(self) -> int:
+        return self.minute_of_day % 60
+    
+    def next_occurrence(self, after: datetime) -> Optional[datetime]:
+        """First time strictly after the given one that this reminder is due"""
+        if self.recurrence is None:
+            at = after.replace(hour=self.minute_of_day // 60, minute=self.minute_of_day % 60,
+                               second=0, microsecond=0)
+            return at if at > after else at + timedelta(days=1)
+        # The cached answer holds for any time between where it was computed and itself
+        if self._next_from is not None and self._next_from <= after and \
+                (self._next_at is None or after < self._next_at):
+            return self._next_at
+        self._next_from = after
+        self._next_at = self.recurrence.next_after(self.minute_of_day, after)
+        return self._next_at
+    
+    def time_text(self, twelve_hour: bool = False) -> str:
+        """Time as "hh:mm", or "hh:mm AM/PM" with twelve_hour"""
+        return format_time(self.minute_of_day, twelve_hour)
     
     def to_dict(self):
         """Convert reminder to dictionary"""
-        return {
+        data = {
             "id": self.id,
-            "time": self.time.toString("hh:mm"),
+            "time": format_time(self.minute_of_day),
             "content": self.content,
             "completed": self.completed,
             "repeat_daily": self.repeat_daily
         }
+        if self.recurrence is not None:
+            data["rrule"] = self.recurrence.to_rrule()
+        return data
     
     @staticmethod
     def from_dict(data):
         """Create reminder from dictionary"""
-        time = QTime.fromString(data["time"], "hh:mm")
         return Reminder(
-            time=time,
+            minute_of_day=parse_time(data["time"]),
             content=data["content"],
             completed=data.get("completed", False),
             repeat_daily=data.get("repeat_daily", True),
-            id=data.get("id", str(uuid.uuid4()))
+            id=data.get("id"),
+            recurrence=Recurrence.parse(data["rrule"]) if data.get("rrule") else None
         )
     
     def reset_for_new_day(self):
-        """Reset completed status for new day if repeat_daily is True"""
-        if self.repeat_daily:
+        """Reset completed status for new day if the reminder repeats"""
+        if self.repeat_daily or self.recurrence is not None:
             self.completed = False
+    
+    def __eq__(self, other):
+        if not isinstance(other, Reminder):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__[:6])
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return (f"Reminder(time={self.time_text()!r}, content={self.content!r}, "
+                f"completed={self.completed}, repeat_daily={self.repeat_daily}, id={self.id!r}, "
+                f"recurrence={self.recurrence!r})")
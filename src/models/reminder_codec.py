@@ -0,0 +1,262 @@
+"""
+Reminder Codec - Batch conversion of reminders to and from stored records
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, Iterator, List, Optional, TextIO, Tuple
+from src.models.recurrence import Recurrence
+from src.models.reminder import Reminder, MINUTES_PER_DAY, parse_time
+from src.models.reminder_table import ReminderTable, COMPLETED, REPEAT_DAILY
+
+# "hh:mm" text for every minute of day, and the reverse lookup
+TIME_TEXT = [f"{m // 60:02d}:{m % 60:02d}" for m in range(MINUTES_PER_DAY)]
+MINUTE_BY_TEXT = {text: m for m, text in enumerate(TIME_TEXT)}
+
+BINARY_MAGIC = b"RMDB"
+BINARY_VERSION = 3  # 2 added the recurrence rule column, 3 ids that are not UUIDs
+BLOCK_ROWS = 4096
+
+_FILE_HEADER = struct.Struct("<4sBH")  # magic, version, last_saved length
+_BLOCK_HEADER = struct.Struct("<II")  # rows, content bytes
+_ROW_BYTES = {1: 2 + 1 + 16 + 4,  # minute, flags, id, content length
+              2: 2 + 1 + 16 + 4 + 4,  # ... and rule length
+              3: 2 + 1 + 16 + 4 + 4 + 4}  # ... and text id length
+_SWAP = sys.byteorder != "little"  # Columns are stored little-endian
+
+
+def _minute(time_text: str) -> int:
+    minute = MINUTE_BY_TEXT.get(time_text)
+    # Unpadded or otherwise unusual text takes the slow path
+    return parse_time(time_text) if minute is None else minute
+
+
+def new_ids(count: int) -> List[str]:
+    """count random (version 4) UUID strings, drawn from one urandom call"""
+    raw = bytearray(os.urandom(16 * count))
+    ids = []
+    for i in range(0, 16 * count, 16):
+        raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40
+        raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80
+        h = raw[i:i + 16].hex()
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return ids
+
+
+def encode_records(reminders: List[Reminder]) -> List[dict]:
+    """Reminder.to_dict() for a whole batch"""
+    text = TIME_TEXT
+    records = [{"id": r.id, "time": text[r.minute_of_day], "content": r.content,
+                "completed": r.completed, "repeat_daily": r.repeat_daily}
+               for r in reminders]
+    for record, reminder in zip(records, reminders):
+        if reminder.recurrence is not None:
+            record["rrule"] = reminder.recurrence.to_rrule()
+    return records
+
+
+def decode_records(records: List[dict], rejected: Optional[List] = None) -> List[Reminder]:
+    """
+    Reminder.from_dict() for a whole batch; missing ids are generated
+    together. A record that cannot be decoded (bad time, unknown rule, wrong
+    type) raises ValueError, or with a rejected list is appended there and
+    skipped so one bad record does not cost the rest of the batch.
+    """
+    minute = _minute
+    missing = sum(1 for r in records if isinstance(r, dict) and not r.get("id"))
+    fresh = iter(new_ids(missing)) if missing else None
+    rules = {}  # Reminders sharing a rule text share the parsed Recurrence
+    reminders = []
+    append = reminders.append
+    for r in records:
+        try:
+            rule = r.get("rrule")
+            if rule and rule not in rules:
+                rules[rule] = Recurrence.parse(rule)
+            content = r["content"]
+            if not isinstance(content, str):
+                raise TypeError(f"content is not text: {content!r}")
+            reminder = Reminder(minute(r["time"]), content, r.get("completed", False),
+                                r.get("repeat_daily", True), r.get("id") or next(fresh),
+                                rules[rule] if rule else None)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            if rejected is None:
+                raise ValueError(f"bad reminder record {r!r}: {e}") from e
+            rejected.append(r)
+            continue
+        append(reminder)
+    return reminders
+
+
+def dump_json(f: TextIO, records: List[dict], last_saved: Optional[str]):
+    """
+    Write the reminders document with one record per line. It stays easy to
+    read and diff, but unlike json.dump(indent=2) it runs on the C encoder.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    f.write('{\n  "last_saved": %s,\n  "reminders": [' % encode(last_saved))
+    if records:
+        f.write("\n    " + ",\n    ".join(map(encode, records)) + "\n  ")
+    f.write("]\n}\n")
+
+
+def records_to_table(records: List[dict]) -> ReminderTable:
+    """Pack records into columns"""
+    pack_id = ReminderTable.pack_id
+    pack_flags = ReminderTable.pack_flags
+    table = ReminderTable()
+    table.minutes = array("H", [_minute(r["time"]) for r in records])
+    table.flags = array("B", [pack_flags(r.get("completed", False), r.get("repeat_daily", True),
+                                         bool(r.get("rrule")))
+                              for r in records])
+    packed = [pack_id(r["id"]) for r in records]
+    if None in packed:
+        for row, (record, packed_id) in enumerate(zip(records, packed)):
+            if packed_id is None:
+                table.text_ids[row] = record["id"]
+                packed[row] = bytes(16)
+    table.ids = bytearray(b"".join(packed))
+    table.contents = [r["content"] for r in records]
+    table.rules = [r.get("rrule") or "" for r in records]
+    return table
+
+
+def table_to_records(table: ReminderTable) -> List[dict]:
+    """Unpack columns into records"""
+    text = TIME_TEXT
+    ids = [table.id_at(i) for i in range(len(table))]
+    records = [{"id": rid, "time": text[m], "content": c,
+                "completed": bool(f & COMPLETED), "repeat_daily": bool(f & REPEAT_DAILY)}
+               for rid, m, f, c in zip(ids, table.minutes, table.flags, table.contents)]
+    for record, rule in zip(records, table.rules):
+        if rule:
+            record["rrule"] = rule
+    return records
+
+
+def write_binary(f: BinaryIO, records: List[dict], last_saved: Optional[str],
+                 block_rows: int = BLOCK_ROWS):
+    """
+    Compact binary document: a short header, then blocks of up to block_rows
+    rows. Each block stores its columns back to back (minutes, flags, ids,
+    content lengths, rule lengths, text id lengths, contents, rules, text
+    ids), so a reader can decode one block at a time. Ids that are not UUIDs
+    are stored as text after the rules, with zeros in the packed id column.
+    """
+    saved = (last_saved or "").encode("utf-8")
+    f.write(_FILE_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(saved)) + saved)
+    for start in range(0, len(records), block_rows):
+        table = records_to_table(records[start:start + block_rows])
+        minutes = table.minutes
+        lengths = array("I", map(len, table.contents))
+        rule_lengths = array("I", map(len, table.rules))
+        id_lengths = array("I", [0]) * len(table)
+        for row, text_id in table.text_ids.items():
+            id_lengths[row] = len(text_id)
+        if _SWAP:
+            minutes = array("H", minutes)
+            minutes.byteswap()
+            lengths.byteswap()
+            rule_lengths.byteswap()
+            id_lengths.byteswap()
+        text_ids = "".join(table.text_ids[row] for row in sorted(table.text_ids))
+        strings = ("".join(table.contents) + "".join(table.rules) + text_ids).encode("utf-8")
+        f.write(_BLOCK_HEADER.pack(len(table), len(strings)))
+        f.write(minutes.tobytes())
+        f.write(table.flags.tobytes())
+        f.write(table.ids)
+        f.write(lengths.tobytes())
+        f.write(rule_lengths.tobytes())
+        f.write(id_lengths.tobytes())
+        f.write(strings)
+
+
+def read_binary_header(f: BinaryIO) -> Tuple[Optional[str], int]:
+    """Check the file header, returns (last_saved, format version)"""
+    header = f.read(_FILE_HEADER.size)
+    if len(header) < _FILE_HEADER.size:
+        raise ValueError("truncated reminder file header")
+    magic, version, saved_len = _FILE_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or version not in _ROW_BYTES:
+        raise ValueError(f"not a reminder file (magic {magic!r}, version {version})")
+    return f.read(saved_len).decode("utf-8") or None, version
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("truncated reminder block")
+    return data
+
+
+def check_binary_blocks(f: BinaryIO, version: int = BINARY_VERSION) -> int:
+    """
+    Walk the block headers after read_binary_header() without decoding
+    anything, returns the row count; raises ValueError if the file was
+    cut short. The file position is restored afterwards.
+    """
+    start = f.tell()
+    size = os.fstat(f.fileno()).st_size
+    total = 0
+    while True:
+        header = f.read(_BLOCK_HEADER.size)
+        if not header:
+            break
+        if len(header) < _BLOCK_HEADER.size:
+            raise ValueError("truncated reminder block")
+        rows, content_size = _BLOCK_HEADER.unpack(header)
+        if f.seek(_ROW_BYTES[version] * rows + content_size, os.SEEK_CUR) > size:
+            raise ValueError("truncated reminder block")
+        total += rows
+    f.seek(start)
+    return total
+
+
+def _split(text: str, lengths) -> List[str]:
+    ends = list(accumulate(lengths))
+    return [text[end - n:end] for end, n in zip(ends, lengths)]
+
+
+def iter_binary_blocks(f: BinaryIO, version: int = BINARY_VERSION) -> Iterator[ReminderTable]:
+    """Decode the blocks after read_binary_header(), one table at a time"""
+    while True:
+        header = f.read(_BLOCK_HEADER.size)
+        if not header:
+            return
+        if len(header) < _BLOCK_HEADER.size:
+            raise ValueError("truncated reminder block")
+        rows, content_size = _BLOCK_HEADER.unpack(header)
+        table = ReminderTable()
+        table.minutes.frombytes(_read_exact(f, 2 * rows))
+        table.flags.frombytes(_read_exact(f, rows))
+        table.ids = bytearray(_read_exact(f, 16 * rows))
+        lengths = array("I")
+        lengths.frombytes(_read_exact(f, 4 * rows))
+        rule_lengths = array("I")
+        if version >= 2:
+            rule_lengths.frombytes(_read_exact(f, 4 * rows))
+        else:
+            rule_lengths.extend([0] * rows)
+        id_lengths = array("I")
+        if version >= 3:
+            id_lengths.frombytes(_read_exact(f, 4 * rows))
+        if _SWAP:
+            table.minutes.byteswap()
+            lengths.byteswap()
+            rule_lengths.byteswap()
+            id_lengths.byteswap()
+        # Lengths count characters, so the block is decoded in one call
+        strings = _read_exact(f, content_size).decode("utf-8")
+        split_at = sum(lengths)
+        ids_at = split_at + sum(rule_lengths)
+        table.contents = _split(strings[:split_at], lengths)
+        table.rules = _split(strings[split_at:ids_at], rule_lengths)
+        if ids_at < len(strings):
+            text_rows = [row for row, n in enumerate(id_lengths) if n]
+            text_ids = _split(strings[ids_at:], [id_lengths[row] for row in text_rows])
+            table.text_ids = dict(zip(text_rows, text_ids))
+        yield table
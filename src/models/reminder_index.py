@@ -0,0 +1,108 @@
+"""
+Reminder Index - Time-indexed store of reminders
+"""
+
+from typing import Dict, Iterator, List, Optional
+from src.models.reminder import Reminder, MINUTES_PER_DAY
+
+
+def minute_of_day(reminder: Reminder) -> int:
+    """Minute of day (0-1439) a reminder is set for"""
+    return reminder.minute_of_day
+
+
+class ReminderIndex:
+    """
+    Reminders indexed by id and by minute of day.
+    Each of the 1440 minute buckets maps id -> reminder, so looking up
+    what is due at a minute is a single bucket read, and add/remove
+    are O(1). Iteration follows insertion order.
+    
+    Reminders with a recurrence rule are kept apart in recurring(): their
+    minute of day alone does not say when they are due.
+    """
+    
+    def __init__(self, reminders: Optional[List[Reminder]] = None):
+        self._by_id: Dict[str, Reminder] = {}
+        self._minute_by_id: Dict[str, int] = {}
+        self._buckets: List[Dict[str, Reminder]] = [{} for _ in range(MINUTES_PER_DAY)]
+        self._recurring: Dict[str, Reminder] = {}
+        for reminder in reminders or []:
+            self.add(reminder)
+    
+    def add(self, reminder: Reminder):
+        """Add a reminder (replaces any reminder with the same id)"""
+        if reminder.id in self._by_id:
+            self.remove(reminder.id)
+        self._by_id[reminder.id] = reminder
+        self._place(reminder)
+    
+    def _place(self, reminder: Reminder):
+        if reminder.recurrence is not None:
+            self._recurring[reminder.id] = reminder
+        else:
+            minute = minute_of_day(reminder)
+            self._minute_by_id[reminder.id] = minute
+            self._buckets[minute][reminder.id] = reminder
+    
+    def _unplace(self, reminder_id: str):
+        if self._recurring.pop(reminder_id, None) is None:
+            minute = self._minute_by_id.pop(reminder_id, None)
+            if minute is not None:
+                del self._buckets[minute][reminder_id]
+    
+    def remove(self, reminder) -> Optional[Reminder]:
+        """Remove a reminder by object or id, returns the removed reminder"""
+        reminder_id = reminder if isinstance(reminder, str) else reminder.id
+        removed = self._by_id.pop(reminder_id, None)
+        if removed is not None:
+            self._unplace(reminder_id)
+        return removed
+    
+    def get(self, reminder_id: str) -> Optional[Reminder]:
+        """Look up a reminder by id"""
+        return self._by_id.get(reminder_id)
+    
+    def due_at(self, minute: int) -> List[Reminder]:
+        """All daily reminders set for the given minute of day"""
+        return list(self._buckets[minute % MINUTES_PER_DAY].values())
+    
+    def due_between(self, start: int, end: int) -> List[Reminder]:
+        """
+        All daily reminders set from minute start to minute end inclusive, in time
+        order. The range wraps past midnight when end < start.
+        """
+        start %= MINUTES_PER_DAY
+        end %= MINUTES_PER_DAY
+        if end >= start:
+            minutes = range(start, end + 1)
+        else:
+            minutes = list(range(start, MINUTES_PER_DAY)) + list(range(0, end + 1))
+        buckets = self._buckets
+        return [r for m in minutes for r in buckets[m].values()]
+    
+    def recurring(self) -> List[Reminder]:
+        """Reminders that follow a recurrence rule"""
+        return list(self._recurring.values())
+    
+    def occupied_minutes(self) -> List[int]:
+        """Minutes of day that have at least one reminder"""
+        return [m for m, bucket in enumerate(self._buckets) if bucket]
+    
+    def clear(self):
+        """Remove all reminders"""
+        self._by_id.clear()
+        self._minute_by_id.clear()
+        self._recurring.clear()
+        for bucket in self._buckets:
+            bucket.clear()
+    
+    def __contains__(self, reminder) -> bool:
+        reminder_id = reminder if isinstance(reminder, str) else reminder.id
+        return reminder_id in self._by_id
+    
+    def __iter__(self) -> Iterator[Reminder]:
+        return iter(list(self._by_id.values()))
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
@@ -0,0 +1,144 @@
+"""
+Reminder Table - Columnar store of reminders for bulk operations
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.models.recurrence import Recurrence
+from src.models.reminder import Reminder, MINUTES_PER_DAY
+
+COMPLETED = 0x01
+REPEAT_DAILY = 0x02
+RECURRING = 0x04  # Row has a recurrence rule
+
+# Byte translation that clears COMPLETED on every repeating row
+_RESET_TABLE = bytes((f & ~COMPLETED) if f & (REPEAT_DAILY | RECURRING) else f
+                     for f in range(256))
+_COMPLETED_VALUES = bytes(f for f in range(256) if f & COMPLETED)
+
+
+class ReminderTable:
+    """
+    Reminders stored column by column instead of as objects: minute of day
+    in an unsigned 16-bit array, flags in a byte array and ids as packed
+    16-byte UUIDs, with contents and recurrence rules (RRULE text, "" for
+    none) in plain lists. A row costs a few bytes plus its strings, and
+    bulk operations (new-day reset, counting, sorting by time) run over
+    flat buffers. Ids that are not UUID strings (imported or hand-edited
+    data) are kept as text in text_ids, with zeros in their packed slot.
+    """
+    
+    def __init__(self, reminders: Iterable[Reminder] = ()):
+        self.minutes = array("H")
+        self.flags = array("B")
+        self.ids = bytearray()
+        self.contents: List[str] = []
+        self.rules: List[str] = []
+        self.text_ids: Dict[int, str] = {}  # Row -> id that is not a UUID
+        self.extend(reminders)
+    
+    @staticmethod
+    def pack_flags(completed: bool, repeat_daily: bool, recurring: bool = False) -> int:
+        return (COMPLETED if completed else 0) | (REPEAT_DAILY if repeat_daily else 0) | \
+            (RECURRING if recurring else 0)
+    
+    @staticmethod
+    def pack_id(reminder_id: str) -> Optional[bytes]:
+        """16 raw bytes of a UUID string as Reminder generates it, None for any other id"""
+        # Only the canonical form packs, so every id reads back unchanged
+        if len(reminder_id) != 36 or reminder_id != reminder_id.lower() or \
+                reminder_id[8] + reminder_id[13] + reminder_id[18] + reminder_id[23] != "----":
+            return None
+        try:
+            packed = bytes.fromhex(reminder_id.replace("-", ""))
+        except ValueError:
+            return None
+        return packed if len(packed) == 16 else None
+    
+    def append(self, reminder: Reminder):
+        """Add one reminder as a new row"""
+        packed = self.pack_id(reminder.id)
+        if packed is None:
+            self.text_ids[len(self)] = reminder.id
+            packed = bytes(16)
+        self.ids += packed
+        self.minutes.append(reminder.minute_of_day)
+        recurrence = reminder.recurrence
+        self.flags.append(self.pack_flags(reminder.completed, reminder.repeat_daily,
+                                          recurrence is not None))
+        self.contents.append(reminder.content)
+        self.rules.append(recurrence.to_rrule() if recurrence is not None else "")
+    
+    def extend(self, reminders: Iterable[Reminder]):
+        """Add many reminders"""
+        for reminder in reminders:
+            self.append(reminder)
+    
+    def id_at(self, row: int) -> str:
+        text = self.text_ids.get(row)
+        if text is not None:
+            return text
+        h = self.ids[row * 16:row * 16 + 16].hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    
+    def row(self, row: int) -> Reminder:
+        """Materialize one row as a Reminder"""
+        flags = self.flags[row]
+        return Reminder(self.minutes[row], self.contents[row],
+                        completed=bool(flags & COMPLETED),
+                        repeat_daily=bool(flags & REPEAT_DAILY),
+                        id=self.id_at(row),
+                        recurrence=Recurrence.parse(self.rules[row]) if self.rules[row] else None)
+    
+    def to_reminders(self) -> List[Reminder]:
+        """Materialize every row"""
+        return [self.row(i) for i in range(len(self))]
+    
+    def reset_for_new_day(self) -> int:
+        """Clear completed on every repeating row, returns how many changed"""
+        before = self.flags.tobytes()
+        after = before.translate(_RESET_TABLE)
+        if after == before:
+            return 0
+        self.flags = array("B", after)
+        return self.count_completed(before) - self.count_completed(after)
+    
+    def count_completed(self, flags: Optional[bytes] = None) -> int:
+        """Number of completed rows"""
+        flags = self.flags.tobytes() if flags is None else flags
+        return len(flags) - len(flags.translate(None, _COMPLETED_VALUES))
+    
+    def rows_at(self, minute: int) -> List[int]:
+        """Rows set for the given minute of day"""
+        minute %= MINUTES_PER_DAY
+        rows = []
+        row = -1
+        while True:
+            try:
+                row = self.minutes.index(minute, row + 1)
+            except ValueError:
+                return rows
+            rows.append(row)
+    
+    def order_by_time(self) -> List[int]:
+        """Row numbers sorted by time of day (stable)"""
+        return sorted(range(len(self)), key=self.minutes.__getitem__)
+    
+    def sort_by_time(self):
+        """Reorder every column by time of day (stable)"""
+        order = self.order_by_time()
+        ids = self.ids
+        self.minutes = array("H", [self.minutes[i] for i in order])
+        self.flags = array("B", [self.flags[i] for i in order])
+        self.ids = bytearray(b"".join(ids[i * 16:i * 16 + 16] for i in order))
+        self.contents = [self.contents[i] for i in order]
+        self.rules = [self.rules[i] for i in order]
+        if self.text_ids:
+            self.text_ids = {new: self.text_ids[old] for new, old in enumerate(order)
+                             if old in self.text_ids}
+    
+    def __len__(self) -> int:
+        return len(self.minutes)
+    
+    def __iter__(self) -> Iterator[Reminder]:
+        return (self.row(i) for i in range(len(self)))
@@ -0,0 +1,92 @@
+"""
+Trigger Log - Which reminder occurrences have already been shown
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+from src.models.reminder import MINUTES_PER_DAY
+
+
+def occurrence_key(occurrence: datetime, real_time: bool = False) -> int:
+    """
+    Local wall-clock minute of an occurrence (day and minute of day),
+    doubled so the second pass of a repeated DST hour (fold=1) gets its
+    own key when the occurrence was stepped in real time
+    """
+    minute = occurrence.toordinal() * MINUTES_PER_DAY + occurrence.hour * 60 + occurrence.minute
+    return 2 * minute + (occurrence.fold if real_time else 0)
+
+
+class TriggerLog:
+    """
+    Remembers fired occurrences as reminder id -> wall-clock key of the
+    occurrence, so two reminders with the same time and text never collide
+    and editing a reminder does not re-arm it. Keys are local date and
+    minute of day: when DST ends and the clock repeats an hour, a daily
+    reminder that already fired in it is not shown again. Only hourly rules,
+    which step in real time, count the repeated hour as new occurrences.
+    
+    An entry is kept until the wall clock is REPEAT_WINDOW minutes past
+    it, long enough to outlast a DST change setting the clock back;
+    expire() drops older entries oldest first from a deque, so the log
+    only ever holds what fired in the last hour.
+    """
+    
+    REPEAT_WINDOW = 60  # Minutes; the most a DST change sets the clock back
+    
+    def __init__(self):
+        self._fired: Dict[str, int] = {}
+        self._order: Deque[Tuple[int, str]] = deque()  # (key, id), oldest first
+    
+    def mark(self, reminder_id: str, occurrence: datetime,
+             now: Optional[datetime] = None, real_time: bool = False) -> bool:
+        """Record an occurrence as fired; False if it already was"""
+        oldest = self._oldest_key(now)
+        self.expire(oldest)
+        key = occurrence_key(occurrence, real_time)
+        if self._fired.get(reminder_id) == key:
+            return False
+        if key >= oldest:
+            self._fired[reminder_id] = key
+            self._order.append((key, reminder_id))
+        # Older occurrences are reported once by the scheduler's catch-up
+        # and need no entry
+        return True
+    
+    def _oldest_key(self, now: Optional[datetime]) -> int:
+        """Key of the oldest minute still worth remembering"""
+        return occurrence_key(now or datetime.now()) - 2 * self.REPEAT_WINDOW
+    
+    def expire(self, oldest_key: int):
+        """Drop entries whose minute is before oldest_key's"""
+        order = self._order
+        fired = self._fired
+        # After the clock goes back newer entries can sit behind older,
+        # later ones; they are dropped once those expire
+        while order and order[0][0] < oldest_key:
+            key, reminder_id = order.popleft()
+            if fired.get(reminder_id) == key:
+                del fired[reminder_id]
+    
+    def entries(self) -> List[dict]:
+        """Live entries for persisting"""
+        return [{"id": rid, "key": key} for rid, key in self._fired.items()]
+    
+    def load(self, entries: List[dict], now: Optional[datetime] = None):
+        """Restore persisted entries, skipping expired ones"""
+        oldest = self._oldest_key(now)
+        # Entries without a key were saved by an older version and have
+        # long expired
+        live = [e for e in entries
+                if isinstance(e, dict) and isinstance(e.get("key"), int) and e["key"] >= oldest]
+        for entry in sorted(live, key=lambda e: e["key"]):
+            self._fired[entry["id"]] = entry["key"]
+            self._order.append((entry["key"], entry["id"]))
+    
+    def clear(self):
+        self._fired.clear()
+        self._order.clear()
+    
+    def __len__(self) -> int:
+        return len(self._fired)
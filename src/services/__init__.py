@@ -1,2 +1,10 @@
 """Services package"""
-from .notification_service import NotificationService, NotificationDialog
+
+
+def __getattr__(name):
+    # Imported on first use so the headless core can load the storage
+    # services without pulling in PyQt
+    if name in ("NotificationService", "NotificationDialog"):
+        from . import notification_service
+        return getattr(notification_service, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,197 @@
+"""
+Audio Service - Plays the notification sound from a preloaded buffer
+"""
+
+import itertools
+import os
+import sys
+import threading
+import time
+
+
+class PygameAudioBackend:
+    """
+    Notification sound decoded once into a pygame Sound and played on a
+    reserved pool of mixer channels, so overlapping alerts each get their
+    own channel. Works with the SDL dummy driver (SDL_AUDIODRIVER=dummy).
+    """
+    
+    name = "pygame"
+    
+    def __init__(self, sound_file: str, channels: int = 8, volume: float = 0.8):
+        import pygame  # Deferred: SDL audio init is only paid on first use
+        if not os.path.exists(sound_file):
+            raise FileNotFoundError(sound_file)
+        pygame.mixer.init()
+        self.sound = pygame.mixer.Sound(sound_file)
+        self.sound.set_volume(volume)
+        # Reserve a pool so nothing else grabs our channels
+        pygame.mixer.set_num_channels(max(channels, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._started = {}  # channel index -> monotonic start time
+        self._owners = {}  # channel index -> serial of the play that owns it
+        self._serials = itertools.count(1)
+        self.steals = 0
+        self.max_overlap = 0
+    
+    def play(self):
+        """Play on a free channel, returns a (channel, serial) handle"""
+        index = next((i for i, c in enumerate(self.channels) if not c.get_busy()), None)
+        if index is None:
+            # Every channel busy: reuse the one that has been playing longest
+            index = min(self._started, key=self._started.get)
+            self.steals += 1
+        self.channels[index].play(self.sound)
+        self._started[index] = time.monotonic()
+        serial = next(self._serials)
+        self._owners[index] = serial
+        self.max_overlap = max(self.max_overlap, sum(1 for c in self.channels if c.get_busy()))
+        return index, serial
+    
+    def stop(self, handle):
+        """Stop a sound, unless its channel was reused by a later play"""
+        index, serial = handle
+        if self._owners.get(index) == serial:
+            self.channels[index].stop()
+            self._started.pop(index, None)
+            self._owners.pop(index, None)
+    
+    def stats(self) -> dict:
+        return {"steals": self.steals, "max_overlap": self.max_overlap}
+
+
+class WinsoundAudioBackend:
+    """Windows system notification sound, used when pygame is unavailable"""
+    
+    name = "winsound"
+    
+    def __init__(self, sound_file: str, channels: int = 8, volume: float = 0.8):
+        import winsound
+        self.winsound = winsound
+    
+    def play(self):
+        self.winsound.PlaySound("SystemExclamation",
+                                self.winsound.SND_ALIAS | self.winsound.SND_ASYNC)
+        return None
+    
+    def stop(self, handle):
+        self.winsound.PlaySound(None, self.winsound.SND_PURGE)
+    
+    def stats(self) -> dict:
+        return {}
+
+
+class BeepAudioBackend:
+    """Last resort: the platform beep through Qt"""
+    
+    name = "beep"
+    
+    def __init__(self, sound_file: str, channels: int = 8, volume: float = 0.8):
+        pass
+    
+    def play(self):
+        from PyQt6.QtWidgets import QApplication
+        QApplication.beep()
+        return None
+    
+    def stop(self, handle):
+        pass
+    
+    def stats(self) -> dict:
+        return {}
+
+
+class AudioService:
+    """
+    Plays the notification sound through the best backend for the platform.
+    Nothing is imported or initialized until the first play() or an
+    explicit warm_up(), which does the work on a background thread so app
+    start-up never waits for SDL audio or MP3 decoding.
+    """
+    
+    _instance = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._setup()
+        return cls._instance
+    
+    def _setup(self, channels: int = 8, volume: float = 0.8):
+        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.sound_file = os.path.join(base_path, "assets", "sounds", "notification.mp3")
+        self.channel_count = channels
+        self.volume = volume
+        self.backend = None
+        self._lock = threading.Lock()
+        self.metrics = {
+            "load_ms": 0.0,
+            "plays": 0,
+            "last_play_ms": 0.0,
+            "max_play_ms": 0.0,
+            "total_play_ms": 0.0
+        }
+    
+    @staticmethod
+    def candidate_backends():
+        """Backends to try, best first, for the running platform"""
+        backends = [PygameAudioBackend]
+        if sys.platform == "win32":
+            backends.append(WinsoundAudioBackend)
+        backends.append(BeepAudioBackend)
+        return backends
+    
+    def ensure_ready(self):
+        """Pick and initialize a backend, once"""
+        with self._lock:
+            if self.backend is not None:
+                return self.backend
+            start = time.perf_counter()
+            for backend_cls in self.candidate_backends():
+                try:
+                    self.backend = backend_cls(self.sound_file, self.channel_count, self.volume)
+                    break
+                except Exception as e:
+                    print(f"Audio backend {backend_cls.name} unavailable: {e}")
+            self.metrics["load_ms"] = (time.perf_counter() - start) * 1000
+            return self.backend
+    
+    def warm_up(self):
+        """Initialize the backend on a background thread"""
+        if self.backend is None:
+            threading.Thread(target=self.ensure_ready, name="AudioWarmUp", daemon=True).start()
+    
+    @property
+    def available(self) -> bool:
+        """True if a backend is ready or can be initialized"""
+        return self.ensure_ready() is not None
+    
+    def play(self):
+        """Play the notification sound, returns a handle for stop()"""
+        backend = self.ensure_ready()
+        if backend is None:
+            return None
+        start = time.perf_counter()
+        handle = backend.play()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.metrics["plays"] += 1
+        self.metrics["last_play_ms"] = elapsed
+        self.metrics["max_play_ms"] = max(self.metrics["max_play_ms"], elapsed)
+        self.metrics["total_play_ms"] += elapsed
+        return handle
+    
+    def stop(self, handle):
+        """Stop the sound started with the given handle"""
+        if handle is not None and self.backend is not None:
+            self.backend.stop(handle)
+    
+    def latency_stats(self) -> dict:
+        """Playback call latency metrics in milliseconds"""
+        stats = dict(self.metrics)
+        plays = stats.pop("total_play_ms")
+        stats["avg_play_ms"] = plays / self.metrics["plays"] if self.metrics["plays"] else 0.0
+        stats["backend"] = self.backend.name if self.backend else None
+        if self.backend is not None:
+            stats.update(self.backend.stats())
+        return stats
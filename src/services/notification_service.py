@@ -2,34 +2,44 @@
 Notification Service - Handles reminder notifications with sound and popup
 """
 
-import os
-import winsound
-import threading
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QGraphicsDropShadowEffect)
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QFont, QColor
+import time
 
-# Try to import pygame for audio playback
-try:
-    import pygame
-    pygame.mixer.init()
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
+                             QPushButton, QGraphicsScene, QGraphicsPixmapItem,
+                             QGraphicsBlurEffect)
+from PyQt6.QtCore import Qt, QTimer, QUrl, QRectF, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPainter, QPixmap
+from src.services.audio_service import AudioService
+from src.services.snooze_service import SnoozeService
 
 
 class NotificationDialog(QDialog):
-    """Beautiful notification popup for reminders"""
+    """
+    Beautiful notification popup for reminders.
+    Dialogs are reusable: set_content() changes the text and present()
+    shows it again with a fresh sound and auto-close timer. The drop
+    shadow is painted from a pixmap blurred once per size instead of a
+    live blur effect.
+    """
+    
+    snooze_requested = pyqtSignal(list, object)  # Reminder ids, minutes (None: the default)
+    
+    _shadow_cache = {}  # (width, height) -> QPixmap
+    
+    SHADOW_BLUR = 40
+    SHADOW_OFFSET = 15
+    SHADOW_COLOR = QColor(102, 126, 234, 150)
     
     def __init__(self, title: str, message: str, parent=None):
         super().__init__(parent)
         self.title_text = title
         self.message_text = message
-        self.sound_playing = False
+        self.sound_channel = None
+        self.snoozed = False
+        self.stack_slot = 0
+        self.reminder_ids = []
         self.init_ui()
-        self.init_sound()
-        
+    
     def init_ui(self):
         """Initialize UI"""
         self.setWindowTitle("Reminder")
@@ -56,13 +66,6 @@ class NotificationDialog(QDialog):
             }
         """)
         
-        # Shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(40)
-        shadow.setOffset(0, 15)
-        shadow.setColor(QColor(102, 126, 234, 150))
-        container.setGraphicsEffect(shadow)
-        
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(25, 20, 25, 20)
         container_layout.setSpacing(12)
@@ -110,19 +113,19 @@ class NotificationDialog(QDialog):
         container_layout.addLayout(header)
         
         # Time display
-        time_label = QLabel(self.title_text)
-        time_label.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
-        time_label.setStyleSheet("color: white; background: transparent;")
-        time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        container_layout.addWidget(time_label)
+        self.time_label = QLabel(self.title_text)
+        self.time_label.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
+        self.time_label.setStyleSheet("color: white; background: transparent;")
+        self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        container_layout.addWidget(self.time_label)
         
         # Message
-        msg_label = QLabel(self.message_text)
-        msg_label.setFont(QFont("Segoe UI", 14))
-        msg_label.setStyleSheet("color: rgba(255,255,255,0.95); background: transparent;")
-        msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        msg_label.setWordWrap(True)
-        container_layout.addWidget(msg_label)
+        self.msg_label = QLabel(self.message_text)
+        self.msg_label.setFont(QFont("Segoe UI", 14))
+        self.msg_label.setStyleSheet("color: rgba(255,255,255,0.95); background: transparent;")
+        self.msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.msg_label.setWordWrap(True)
+        container_layout.addWidget(self.msg_label)
         
         container_layout.addStretch()
         
@@ -131,7 +134,7 @@ class NotificationDialog(QDialog):
         btn_layout.setSpacing(15)
         
         # Snooze button
-        snooze_btn = QPushButton("⏰ Snooze 5 min")
+        snooze_btn = QPushButton(f"⏰ Snooze {SnoozeService.DEFAULT_MINUTES:g} min")
         snooze_btn.setMinimumHeight(40)
         snooze_btn.setFont(QFont("Segoe UI", 11))
         snooze_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -175,69 +178,103 @@ class NotificationDialog(QDialog):
         
         main_layout.addWidget(container)
         
-        # Position at top-right corner of screen
-        self.position_on_screen()
-        
-        # Auto-close timer (30 seconds)
+        # Auto-close timer (30 seconds), started by present()
         self.auto_close_timer = QTimer(self)
+        self.auto_close_timer.setSingleShot(True)
         self.auto_close_timer.timeout.connect(self.close_notification)
+    
+    def set_content(self, title: str, message: str, reminder_ids=()):
+        """Change the text shown by this dialog and the reminders it stands for"""
+        self.reminder_ids = list(reminder_ids)
+        self.title_text = title
+        self.message_text = message
+        self.time_label.setText(title)
+        self.msg_label.setText(message)
+    
+    def present(self, play_sound: bool = True):
+        """Show the dialog with sound and a fresh auto-close timer"""
+        self.snoozed = False
+        # Position at top-right corner of screen, below any dialogs already stacked there
+        self.position_on_screen(self.stack_slot)
         self.auto_close_timer.start(30000)
+        if play_sound:
+            self.init_sound()
+        self.show()
+    
+    @classmethod
+    def shadow_pixmap(cls, width: int, height: int, margin: int) -> QPixmap:
+        """Blurred drop shadow for a card inset by margin, rendered once per size"""
+        key = (width, height, margin)
+        pixmap = cls._shadow_cache.get(key)
+        if pixmap is None:
+            # Card silhouette in the shadow colour
+            shape = QPixmap(width - 2 * margin, height - 2 * margin)
+            shape.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(shape)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(cls.SHADOW_COLOR)
+            painter.drawRoundedRect(QRectF(shape.rect()), 20, 20)
+            painter.end()
+            
+            # Blur it once through a scene
+            scene = QGraphicsScene()
+            item = QGraphicsPixmapItem(shape)
+            blur = QGraphicsBlurEffect()
+            blur.setBlurRadius(cls.SHADOW_BLUR)
+            item.setGraphicsEffect(blur)
+            item.setPos(margin, margin + cls.SHADOW_OFFSET)
+            scene.addItem(item)
+            
+            pixmap = QPixmap(width, height)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            scene.render(painter, QRectF(0, 0, width, height), QRectF(0, 0, width, height))
+            painter.end()
+            cls._shadow_cache[key] = pixmap
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the cached shadow behind the card"""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.shadow_pixmap(self.width(), self.height(), 15))
+        painter.end()
     
     def init_sound(self):
         """Initialize and play notification sound"""
         try:
-            # Get the app root directory
-            base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            sound_file = os.path.join(base_path, "assets", "sounds", "notification.mp3")
-            
-            if os.path.exists(sound_file) and PYGAME_AVAILABLE:
-                # Use pygame to play sound in a separate thread
-                def play_sound():
-                    try:
-                        pygame.mixer.music.load(sound_file)
-                        pygame.mixer.music.set_volume(0.8)
-                        pygame.mixer.music.play()
-                        self.sound_playing = True
-                    except Exception as e:
-                        print(f"Pygame error: {e}")
-                
-                threading.Thread(target=play_sound, daemon=True).start()
-            else:
-                # Fallback: Use Windows default notification sound
-                winsound.PlaySound("SystemExclamation", 
-                                   winsound.SND_ALIAS | winsound.SND_ASYNC)
+            # Preloaded buffer on its own channel, or the platform fallback
+            self.sound_channel = AudioService().play()
         except Exception as e:
             print(f"Error playing sound: {e}")
-            # Fallback to simple beep
-            try:
-                winsound.Beep(800, 200)
-                winsound.Beep(1000, 200)
-                winsound.Beep(1200, 300)
-            except:
-                pass
     
     def stop_sound(self):
         """Stop playing sound"""
-        if PYGAME_AVAILABLE and self.sound_playing:
+        if self.sound_channel is not None:
             try:
-                pygame.mixer.music.stop()
-                self.sound_playing = False
+                AudioService().stop(self.sound_channel)
+                self.sound_channel = None
             except:
                 pass
     
-    def position_on_screen(self):
-        """Position dialog at top-right corner of screen"""
+    def position_on_screen(self, slot: int = 0):
+        """Position dialog at top-right corner of screen, slot rows further down"""
         from PyQt6.QtWidgets import QApplication
         screen = QApplication.primaryScreen()
         if screen:
             screen_geo = screen.availableGeometry()
             x = screen_geo.right() - self.width() - 20
-            y = screen_geo.top() + 20
+            y = screen_geo.top() + 20 + slot * (self.height() - 10)
+            # Wrap back to the top rather than going off screen
+            if y + self.height() > screen_geo.bottom():
+                y = screen_geo.top() + 20
             self.move(x, y)
     
     def snooze(self):
-        """Snooze the reminder for 5 minutes"""
+        """Snooze the reminder for SnoozeService's default duration"""
         self.snoozed = True
+        if self.reminder_ids:
+            self.snooze_requested.emit(self.reminder_ids, None)
         self.close_notification()
     
     def close_notification(self):
@@ -260,28 +297,125 @@ class NotificationDialog(QDialog):
 
 
 class NotificationService:
-    """Service to manage reminder notifications"""
+    """
+    Service to manage reminder notifications.
+    Closed dialogs go back to an idle pool and are reused, and at most
+    MAX_ACTIVE dialogs are on screen; showing one more recycles the oldest.
+    
+    Reminders passed to queue_notification() are shown from the event loop
+    rather than inline: everything queued for the same time becomes one
+    grouped dialog, one dialog is built per event-loop pass, and the sound
+    plays at most once every SOUND_MIN_INTERVAL seconds.
+    """
     
     _instance = None
     
+    MAX_ACTIVE = 5
+    MAX_IDLE = 5
+    SOUND_MIN_INTERVAL = 5.0  # seconds
+    GROUP_PREVIEW = 2  # reminders listed by name in a grouped dialog
+    
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.active_notifications = []
+            cls._instance.idle_dialogs = []
+            cls._instance.dialogs_created = 0
+            cls._instance._queue = []
+            cls._instance._drain_scheduled = False
+            cls._instance._last_sound_at = None
+            # Called with (reminder ids, minutes) when a dialog is snoozed
+            cls._instance.snooze_handler = None
         return cls._instance
     
-    def show_notification(self, time_str: str, content: str, parent=None):
+    def _create_dialog(self, parent=None) -> NotificationDialog:
+        dialog = NotificationDialog("", "", parent)
+        dialog.finished.connect(lambda _result, d=dialog: self._release(d))
+        dialog.snooze_requested.connect(self._on_snooze)
+        self.dialogs_created += 1
+        return dialog
+    
+    def prewarm(self, count: int = 1, parent=None):
+        """Build dialogs ahead of time so the first reminder shows instantly"""
+        while len(self.idle_dialogs) < min(count, self.MAX_IDLE):
+            self.idle_dialogs.append(self._create_dialog(parent))
+    
+    def _release(self, dialog: NotificationDialog):
+        """Return a closed dialog to the idle pool"""
+        if dialog in self.active_notifications:
+            self.active_notifications.remove(dialog)
+        if dialog in self.idle_dialogs:
+            return
+        if len(self.idle_dialogs) < self.MAX_IDLE:
+            self.idle_dialogs.append(dialog)
+        else:
+            dialog.deleteLater()
+    
+    def _on_snooze(self, reminder_ids, minutes):
+        if self.snooze_handler is not None:
+            self.snooze_handler(reminder_ids, minutes)
+    
+    def show_notification(self, time_str: str, content: str, parent=None, reminder_ids=()):
         """Show a notification popup"""
-        dialog = NotificationDialog(time_str, content, parent)
-        dialog.show()
+        if len(self.active_notifications) >= self.MAX_ACTIVE:
+            # Too many on screen: close the oldest, which frees its dialog
+            self.active_notifications[0].close_notification()
+        
+        dialog = self.idle_dialogs.pop() if self.idle_dialogs else self._create_dialog(parent)
+        dialog.set_content(time_str, content, reminder_ids)
+        used_slots = {d.stack_slot for d in self.active_notifications}
+        dialog.stack_slot = next(i for i in range(self.MAX_ACTIVE + 1) if i not in used_slots)
+        dialog.present(play_sound=self._take_sound_slot())
         self.active_notifications.append(dialog)
         return dialog
     
+    def _take_sound_slot(self) -> bool:
+        """Rate-limit the alert sound"""
+        now = time.monotonic()
+        if self._last_sound_at is not None and now - self._last_sound_at < self.SOUND_MIN_INTERVAL:
+            return False
+        self._last_sound_at = now
+        return True
+    
+    def queue_notification(self, time_str: str, content: str, parent=None, reminder_id=None):
+        """Queue a reminder; it is shown, grouped with others at the same time, from the event loop"""
+        self._queue.append((time_str, content, parent, reminder_id))
+        self._schedule_drain()
+    
+    def _schedule_drain(self):
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            QTimer.singleShot(0, self._drain)
+    
+    def _drain(self):
+        """Show one grouped dialog, then yield to the event loop for the rest"""
+        self._drain_scheduled = False
+        if not self._queue:
+            return
+        time_str, _, parent, _ = self._queue[0]
+        group = [entry for entry in self._queue if entry[0] == time_str]
+        self._queue = [entry for entry in self._queue if entry[0] != time_str]
+        contents = [entry[1] for entry in group]
+        reminder_ids = [entry[3] for entry in group if entry[3] is not None]
+        self.show_notification(time_str, self.group_message(contents), parent, reminder_ids)
+        if self._queue:
+            self._schedule_drain()
+    
+    @classmethod
+    def group_message(cls, contents) -> str:
+        """Message text for one or more reminders due together"""
+        if len(contents) == 1:
+            return contents[0]
+        parts = list(contents[:cls.GROUP_PREVIEW])
+        if len(contents) > cls.GROUP_PREVIEW:
+            parts.append(f"+{len(contents) - cls.GROUP_PREVIEW} more")
+        return " · ".join(parts)
+    
     def close_all(self):
         """Close all active notifications"""
-        for notif in self.active_notifications:
+        for notif in list(self.active_notifications):
             try:
-                notif.close()
+                notif.close_notification()
             except:
                 pass
         self.active_notifications.clear()
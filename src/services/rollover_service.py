@@ -0,0 +1,33 @@
+"""
+Rollover Service - Drives the core DayRollover from the Qt event loop
+"""
+
+from datetime import datetime
+from PyQt6.QtCore import QObject, QTimer, Qt
+from src.core.clock import MAX_TIMER_MS
+from src.core.rollover import DayRollover
+
+
+class RolloverService(QObject):
+    """
+    Thin Qt adapter for a DayRollover: arms one timer for the next local
+    midnight instead of polling the date, and re-arms it whenever the
+    rollover reports a new time (after each check and after clock jumps).
+    """
+    
+    def __init__(self, rollover: DayRollover, parent=None):
+        super().__init__(parent)
+        self.rollover = rollover
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(rollover.check_rollover)
+        
+        rollover.on_rearm = self.rearm
+        self.rearm(rollover.next_rollover())
+    
+    def rearm(self, at: datetime):
+        """Arm the timer for the next rollover check"""
+        delay_ms = int((at - self.rollover.clock.now()).total_seconds() * 1000)
+        self.timer.start(min(max(0, delay_ms), MAX_TIMER_MS))
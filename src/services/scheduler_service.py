@@ -0,0 +1,45 @@
+"""
+Scheduler Service - Drives the core Scheduler from the Qt event loop
+"""
+
+from datetime import datetime
+from typing import Optional
+from PyQt6.QtCore import QObject, QTimer, Qt
+from src.core.clock import MAX_TIMER_MS
+from src.core.scheduler import Scheduler
+
+
+class SchedulerService(QObject):
+    """
+    Thin Qt adapter for a core Scheduler: a single one-shot timer is armed
+    for the earliest fire time the scheduler reports through on_rearm, and
+    a coarse watchdog lets it compare the wall and monotonic clocks so
+    suspends and clock changes are caught within WATCHDOG_INTERVAL.
+    """
+    
+    WATCHDOG_INTERVAL = 30000
+    
+    def __init__(self, scheduler: Scheduler, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(scheduler.timer_fired)
+        
+        self.watchdog = QTimer(self)
+        self.watchdog.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self.watchdog.timeout.connect(scheduler.check_clock)
+        self.watchdog.start(self.WATCHDOG_INTERVAL)
+        
+        scheduler.on_rearm = self.rearm
+        self.rearm(scheduler.next_due())
+    
+    def rearm(self, fire_at: Optional[datetime]):
+        """Arm the timer for fire_at, or stop it if nothing is scheduled"""
+        if fire_at is None:
+            self.timer.stop()
+            return
+        delay_ms = int((fire_at - self.scheduler.clock.now()).total_seconds() * 1000)
+        self.timer.start(min(max(0, delay_ms), MAX_TIMER_MS))
@@ -0,0 +1,111 @@
+"""
+Snooze Service - One-shot snooze timers that survive restarts
+"""
+
+import heapq
+import time
+from typing import Dict, Iterable, Optional
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from src.core.clock import MAX_TIMER_MS
+from src.services.storage_service import StorageService
+
+
+class SnoozeService(QObject):
+    """
+    Pending snoozes kept in a min-heap of (due time, reminder id) with a
+    single one-shot timer armed for the earliest one, so thousands of
+    snoozes cost O(log n) each and nothing polls. Each reminder has at most
+    one pending snooze; snoozing again replaces it. Pending snoozes are
+    saved through StorageService and restored on start-up.
+    """
+    
+    DEFAULT_MINUTES = 5
+    
+    snooze_due = pyqtSignal(str)  # Emits the id of the reminder to show again
+    
+    def __init__(self, storage_service: StorageService, parent=None):
+        super().__init__(parent)
+        self.storage_service = storage_service
+        self._heap = []  # [due, seq, reminder_id, active]
+        self._entries: Dict[str, list] = {}
+        self._seq = 0
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._on_timeout)
+    
+    def load(self):
+        """Restore snoozes saved by a previous run; overdue ones fire right away"""
+        for entry in self.storage_service.load_snoozes():
+            # Skip records a hand edit or an older version left malformed
+            if not isinstance(entry, dict) or not isinstance(entry.get("id"), str):
+                continue
+            try:
+                due = float(entry["due"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._push(entry["id"], due)
+        self._rearm()
+    
+    def snooze(self, reminder_ids: Iterable[str], minutes: Optional[float] = None):
+        """Show the given reminders again after minutes (DEFAULT_MINUTES if None)"""
+        minutes = self.DEFAULT_MINUTES if minutes is None else minutes
+        due = time.time() + minutes * 60
+        for reminder_id in reminder_ids:
+            self._push(reminder_id, due)
+        self._save()
+        self._rearm()
+    
+    def cancel(self, reminder_id: str):
+        """Drop a pending snooze, e.g. when its reminder is deleted or completed"""
+        if self._discard(reminder_id):
+            self._save()
+            self._rearm()
+    
+    def pending(self) -> Dict[str, float]:
+        """Pending snoozes as reminder id -> due time (epoch seconds)"""
+        return {rid: entry[0] for rid, entry in self._entries.items()}
+    
+    def _push(self, reminder_id: str, due: float):
+        self._discard(reminder_id)
+        self._seq += 1
+        entry = [due, self._seq, reminder_id, True]
+        self._entries[reminder_id] = entry
+        heapq.heappush(self._heap, entry)
+    
+    def _discard(self, reminder_id: str) -> bool:
+        # Lazy deletion: the dead entry is dropped when it reaches the top
+        entry = self._entries.pop(reminder_id, None)
+        if entry:
+            entry[3] = False
+            return True
+        return False
+    
+    def _save(self):
+        self.storage_service.save_snoozes(
+            [{"id": rid, "due": entry[0]} for rid, entry in self._entries.items()])
+    
+    def _rearm(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self.timer.stop()
+            return
+        delay_ms = int((self._heap[0][0] - time.time()) * 1000)
+        self.timer.start(min(max(0, delay_ms), MAX_TIMER_MS))
+    
+    def _on_timeout(self):
+        """Emit every snooze that is due and re-arm"""
+        now = time.time()
+        due = []
+        while self._heap and (not self._heap[0][3] or self._heap[0][0] <= now):
+            entry = heapq.heappop(self._heap)
+            if entry[3]:
+                del self._entries[entry[2]]
+                due.append(entry[2])
+        if due:
+            self._save()
+        self._rearm()
+        for reminder_id in due:
+            self.snooze_due.emit(reminder_id)
@@ -0,0 +1,452 @@
+"""
+Storage Backends - Pluggable on-disk formats for StorageService
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Callable, Iterator, List, Optional, Tuple
+from src.models.reminder_codec import (dump_json, write_binary, read_binary_header,
+                                       check_binary_blocks, iter_binary_blocks,
+                                       table_to_records)
+
+
+class StorageBackend:
+    """
+    Interface for reminder storage backends.
+    Backends work on serialized reminders (Reminder.to_dict() records)
+    and never touch Reminder objects, so they can run on the writer thread.
+    """
+    
+    def exists(self) -> bool:
+        """Check if the backend has saved data"""
+        raise NotImplementedError
+    
+    def load(self) -> Tuple[List[dict], Optional[str]]:
+        """Return (records in save order, last_saved ISO date or None)"""
+        raise NotImplementedError
+    
+    def write_all(self, records: List[dict], last_saved: str):
+        """Replace all stored data with the given records"""
+        raise NotImplementedError
+    
+    def apply(self, upserts: List[dict], deletes: List[str],
+              records: List[dict], last_saved: str):
+        """
+        Persist an incremental change. records is the full current list for
+        backends that can only rewrite everything.
+        """
+        self.write_all(records, last_saved)
+    
+    def query_between(self, start: str, end: str, include_completed: bool = False) -> List[dict]:
+        """Records whose "hh:mm" time lies in [start, end]"""
+        records, _ = self.load()
+        return [r for r in records
+                if start <= r["time"] <= end and (include_completed or not r.get("completed"))]
+    
+    def stream(self) -> Tuple[Optional[str], Iterator[List[dict]]]:
+        """
+        Return (last_saved, batches of records in save order). Backends that
+        can decode part of a file yield it batch by batch; the rest load
+        everything and yield a single batch.
+        """
+        records, last_saved = self.load()
+        return last_saved, iter([records] if records else [])
+    
+    def close(self):
+        """Release any open resources"""
+        pass
+
+
+def _fsync_dir(path: str):
+    """Make a rename in the given directory durable (no-op where unsupported)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: str, write: Callable, backup_path: Optional[str] = None,
+                 binary: bool = False):
+    """
+    Call write(f) on a temp file, fsync it and rename it over path, so
+    readers only ever see the old or the new document. With backup_path the
+    previous document is kept there as the last-known-good copy.
+    """
+    tmp_path = path + ".tmp"
+    with (open(tmp_path, 'wb') if binary else open(tmp_path, 'w', encoding='utf-8')) as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    # Rotate the last-known-good document, then swap the new one in
+    if backup_path and os.path.exists(path):
+        os.replace(path, backup_path)
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(path) or ".")
+
+
+def atomic_write_json(path: str, data, backup_path: Optional[str] = None):
+    """Write a JSON document with atomic_write()"""
+    atomic_write(path, lambda f: json.dump(data, f, indent=2, ensure_ascii=False), backup_path)
+
+
+def load_with_backup(read: Callable, path: str, backup_path: str):
+    """
+    read(path), or read(backup_path) if the live file is unreadable and a
+    backup exists. The damaged file is then moved aside to .corrupt, so the
+    next save does not rotate it over the good backup.
+    """
+    try:
+        return read(path)
+    except Exception as e:
+        if not os.path.exists(backup_path):
+            raise
+        print(f"Error reading {path}: {e}, recovering from backup")
+    
+    result = read(backup_path)
+    if os.path.exists(path):
+        os.replace(path, path + ".corrupt")
+    return result
+
+
+class JsonBackend(StorageBackend):
+    """
+    Single JSON document, rewritten on every save.
+    Writes go to a temp file that is fsynced and renamed over the live file,
+    so a crash never leaves a truncated document. The previous document is
+    kept as a .bak copy and load() falls back to it if the live file is
+    missing or unreadable.
+    """
+    
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.backup_path = filepath + ".bak"
+    
+    def exists(self) -> bool:
+        return os.path.exists(self.filepath) or os.path.exists(self.backup_path)
+    
+    @staticmethod
+    def _read(path: str) -> Tuple[List[dict], Optional[str]]:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Valid JSON of the wrong shape is as damaged as a torn file
+        if not isinstance(data, dict) or not isinstance(data.get("reminders", []), list):
+            raise ValueError("not a reminders document")
+        return data.get("reminders", []), data.get("last_saved")
+    
+    def load(self) -> Tuple[List[dict], Optional[str]]:
+        if not self.exists():
+            return [], None
+        return load_with_backup(self._read, self.filepath, self.backup_path)
+    
+    def write_all(self, records: List[dict], last_saved: str):
+        atomic_write(self.filepath, lambda f: dump_json(f, records, last_saved),
+                     backup_path=self.backup_path)
+
+
+class BinaryBackend(StorageBackend):
+    """
+    Compact columnar file (see reminder_codec.write_binary), rewritten on
+    every save like JsonBackend. stream() checks the block headers, then
+    decodes one block at a time, so a large file is never held in memory at
+    once. The JSON file is imported on first run.
+    """
+    
+    def __init__(self, filepath: str, migrate_from: Optional[str] = None):
+        self.filepath = filepath
+        self.backup_path = filepath + ".bak"
+        self.migrate_from = migrate_from
+    
+    def _has_file(self) -> bool:
+        return os.path.exists(self.filepath) or os.path.exists(self.backup_path)
+    
+    def exists(self) -> bool:
+        return self._has_file() or bool(self.migrate_from and os.path.exists(self.migrate_from))
+    
+    @staticmethod
+    def _read(path: str) -> Tuple[List[dict], Optional[str]]:
+        with open(path, 'rb') as f:
+            last_saved, version = read_binary_header(f)
+            records = []
+            for table in iter_binary_blocks(f, version):
+                records.extend(table_to_records(table))
+        return records, last_saved
+    
+    def load(self) -> Tuple[List[dict], Optional[str]]:
+        if not self._has_file():
+            if self.migrate_from and os.path.exists(self.migrate_from):
+                return JsonBackend(self.migrate_from).load()
+            return [], None
+        return load_with_backup(self._read, self.filepath, self.backup_path)
+    
+    def stream(self) -> Tuple[Optional[str], Iterator[List[dict]]]:
+        if not os.path.exists(self.filepath):
+            return super().stream()
+        f = open(self.filepath, 'rb')
+        try:
+            last_saved, version = read_binary_header(f)
+            check_binary_blocks(f, version)
+        except Exception:
+            f.close()
+            # Damaged file: load() handles the backup fallback
+            return super().stream()
+        
+        def batches():
+            with f:
+                for table in iter_binary_blocks(f, version):
+                    yield table_to_records(table)
+        return last_saved, batches()
+    
+    def write_all(self, records: List[dict], last_saved: str):
+        atomic_write(self.filepath, lambda f: write_binary(f, records, last_saved),
+                     backup_path=self.backup_path, binary=True)
+
+
+class JournalBackend(StorageBackend):
+    """
+    JSON snapshot plus an append-only journal of changes.
+    Each upsert/delete is appended as one fsynced line, so saving costs
+    O(changes) instead of rewriting every reminder. Once the journal grows
+    past compact_threshold bytes it is folded into a new snapshot.
+    Loading replays the snapshot and then the journal; a torn last line
+    from a crash mid-append is dropped and an unreadable line is skipped.
+    A failed append is cut back off before the error propagates.
+    """
+    
+    def __init__(self, snapshot_path: str, journal_path: str,
+                 compact_threshold: int = 256 * 1024):
+        self.snapshot = JsonBackend(snapshot_path)
+        self.journal_path = journal_path
+        self.compact_threshold = compact_threshold
+    
+    def exists(self) -> bool:
+        return self.snapshot.exists() or os.path.exists(self.journal_path)
+    
+    def load(self) -> Tuple[List[dict], Optional[str]]:
+        snapshot_records, last_saved = self.snapshot.load()
+        records = {r["id"]: r for r in snapshot_records}
+        if not os.path.exists(self.journal_path):
+            return list(records.values()), last_saved
+        
+        skipped = 0
+        good_offset = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn last line from a crash mid-append
+                    break
+                good_offset += len(line)
+                try:
+                    entry = json.loads(line)
+                    if entry["op"] == "put":
+                        records[entry["record"]["id"]] = entry["record"]
+                    elif entry["op"] == "del":
+                        records.pop(entry["id"], None)
+                    last_saved = entry.get("date", last_saved)
+                except (ValueError, KeyError, TypeError):
+                    # One bad line must not cost the changes after it
+                    skipped += 1
+        if skipped:
+            print(f"Warning: skipped {skipped} unreadable line(s) in {self.journal_path}")
+        
+        # Cut off a torn tail so later appends start on a clean line
+        if good_offset < os.path.getsize(self.journal_path):
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(good_offset)
+        return list(records.values()), last_saved
+    
+    def write_all(self, records: List[dict], last_saved: str):
+        """Write a fresh snapshot and empty the journal"""
+        self.snapshot.write_all(records, last_saved)
+        # Replaying the old journal over the new snapshot is harmless,
+        # so a crash before this truncation loses nothing
+        with open(self.journal_path, 'wb'):
+            pass
+    
+    def apply(self, upserts: List[dict], deletes: List[str],
+              records: List[dict], last_saved: str):
+        lines = [{"op": "put", "record": r, "date": last_saved} for r in upserts]
+        lines += [{"op": "del", "id": d, "date": last_saved} for d in deletes]
+        if lines:
+            payload = "".join(json.dumps(l, ensure_ascii=False, separators=(",", ":")) + "\n"
+                              for l in lines)
+            size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+            try:
+                with open(self.journal_path, 'ab') as f:
+                    f.write(payload.encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception:
+                # Drop a partly written payload so the retry starts on a clean line
+                try:
+                    with open(self.journal_path, 'r+b') as f:
+                        f.truncate(size)
+                except OSError:
+                    pass
+                raise
+        
+        if os.path.exists(self.journal_path) and \
+                os.path.getsize(self.journal_path) > self.compact_threshold:
+            self.compact(records, last_saved)
+    
+    def compact(self, records: List[dict], last_saved: str):
+        """Fold the journal into the snapshot"""
+        self.write_all(records, last_saved)
+
+
+class SqliteBackend(StorageBackend):
+    """
+    SQLite database in WAL mode with one row per reminder.
+    Changes are single-row upserts/deletes and time range queries use an
+    index on (time, completed). An existing JSON file is migrated on first run.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reminders (
+            id TEXT PRIMARY KEY,
+            time TEXT NOT NULL,
+            content TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            repeat_daily INTEGER NOT NULL DEFAULT 1,
+            rrule TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_reminders_time_completed
+            ON reminders (time, completed);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    
+    UPSERT = """
+        INSERT INTO reminders (id, time, content, completed, repeat_daily, rrule)
+        VALUES (:id, :time, :content, :completed, :repeat_daily, :rrule)
+        ON CONFLICT(id) DO UPDATE SET
+            time = excluded.time,
+            content = excluded.content,
+            completed = excluded.completed,
+            repeat_daily = excluded.repeat_daily,
+            rrule = excluded.rrule
+    """
+    
+    COLUMNS = "id, time, content, completed, repeat_daily, rrule"
+    
+    def __init__(self, filepath: str, migrate_from: Optional[str] = None):
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        # Used from the GUI thread and the writer thread, serialized by _lock
+        self._conn = sqlite3.connect(filepath, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._upgrade_schema()
+        if migrate_from:
+            self._migrate(migrate_from)
+    
+    def _upgrade_schema(self):
+        """Add columns introduced after a database was created"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(reminders)")}
+        if "rrule" not in columns:
+            self._conn.execute("ALTER TABLE reminders ADD COLUMN rrule TEXT")
+            self._conn.commit()
+    
+    def _migrate(self, json_path: str):
+        """
+        Import the JSON file once, into a database that has never been
+        used. The marker is set either way, so a JSON file written later by
+        the json backend never replaces what the database holds.
+        """
+        if self._get_meta("migrated_from") is not None:
+            return
+        used = self._conn.execute("SELECT 1 FROM reminders LIMIT 1").fetchone() is not None \
+            or self._get_meta("last_saved") is not None
+        source = ""
+        if not used and os.path.exists(json_path):
+            try:
+                records, last_saved = JsonBackend(json_path).load()
+            except Exception as e:
+                print(f"Error migrating {json_path}: {e}")
+                return
+            self.write_all(records, last_saved or "")
+            source = os.path.basename(json_path)
+        self._set_meta("migrated_from", source)
+        self._conn.commit()
+    
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+    
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
+    @staticmethod
+    def _to_row(record: dict) -> dict:
+        return {
+            "id": record["id"],
+            "time": record["time"],
+            "content": record["content"],
+            "completed": int(bool(record.get("completed", False))),
+            "repeat_daily": int(bool(record.get("repeat_daily", True))),
+            "rrule": record.get("rrule") or None
+        }
+    
+    @staticmethod
+    def _from_row(row) -> dict:
+        record = {
+            "id": row["id"],
+            "time": row["time"],
+            "content": row["content"],
+            "completed": bool(row["completed"]),
+            "repeat_daily": bool(row["repeat_daily"])
+        }
+        if row["rrule"]:
+            record["rrule"] = row["rrule"]
+        return record
+    
+    def exists(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM reminders LIMIT 1").fetchone() is not None \
+                or self._get_meta("last_saved") is not None
+    
+    def load(self) -> Tuple[List[dict], Optional[str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self.COLUMNS} FROM reminders ORDER BY rowid").fetchall()
+            return [self._from_row(r) for r in rows], self._get_meta("last_saved") or None
+    
+    def write_all(self, records: List[dict], last_saved: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM reminders")
+            self._conn.executemany(self.UPSERT, [self._to_row(r) for r in records])
+            self._set_meta("last_saved", last_saved)
+    
+    def apply(self, upserts: List[dict], deletes: List[str],
+              records: List[dict], last_saved: str):
+        with self._lock, self._conn:
+            if deletes:
+                self._conn.executemany("DELETE FROM reminders WHERE id = ?",
+                                       [(d,) for d in deletes])
+            if upserts:
+                self._conn.executemany(self.UPSERT, [self._to_row(r) for r in upserts])
+            self._set_meta("last_saved", last_saved)
+    
+    def query_between(self, start: str, end: str, include_completed: bool = False) -> List[dict]:
+        sql = f"SELECT {self.COLUMNS} FROM reminders WHERE time BETWEEN ? AND ?"
+        if not include_completed:
+            sql += " AND completed = 0"
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY time", (start, end)).fetchall()
+            return [self._from_row(r) for r in rows]
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,72 +1,344 @@
 """
-Storage Service - Handles saving and loading reminders to/from JSON file
+Storage Service - Handles saving and loading reminders to/from disk
 """
 
+import atexit
 import json
 import os
+import threading
+import time
 from datetime import date
-from typing import List
+from typing import Dict, List, Optional, Union
 from src.models.reminder import Reminder
+from src.models.reminder_codec import encode_records, decode_records
+from src.services.storage_backends import (StorageBackend, JsonBackend, BinaryBackend,
+                                          JournalBackend, SqliteBackend,
+                                          atomic_write)
+
+BACKENDS = ("json", "journal", "binary", "sqlite")
 
 
 class StorageService:
-    """Service for persisting reminders to JSON file"""
+    """
+    Service for persisting reminders through a pluggable StorageBackend
+    ("json" by default, "journal" for a snapshot plus append-only change log,
+    "binary" for a compact columnar file, or "sqlite"; the last two migrate
+    the JSON file on first run). Records are converted in whole batches by
+    reminder_codec.
+    
+    Besides the synchronous save_reminders(), changes can be recorded with
+    mark_dirty()/mark_deleted(). Those only re-serialize the changed reminder
+    and leave the file write to a background thread, which coalesces every
+    change made within coalesce_window seconds into a single write. A
+    failed write keeps its changes and is retried after RETRY_DELAY seconds.
+    The snooze and trigger side files go through the same writer; only the
+    latest state of each is written.
+    """
+    
+    RETRY_DELAY = 5.0
     
-    def __init__(self, filename: str = "reminders.json"):
+    def __init__(self, filename: str = "reminders.json", coalesce_window: float = 0.5,
+                 backend: Union[str, StorageBackend] = "json", data_dir: Optional[str] = None):
         # Get the directory where the app is running
         self.app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_dir = os.path.join(self.app_dir, "data")
+        self.data_dir = data_dir or os.path.join(self.app_dir, "data")
         self.filepath = os.path.join(self.data_dir, filename)
+        self.snooze_path = os.path.join(self.data_dir, "snoozes.json")
+        self.trigger_path = os.path.join(self.data_dir, "triggers.json")
+        self.rejected_path = os.path.splitext(self.filepath)[0] + ".rejected.jsonl"
+        self.coalesce_window = coalesce_window
+        
+        # Serialized reminders in save order, and ids changed since last write
+        self._records: Dict[str, dict] = {}
+        self._dirty = set()
+        self._full_rewrite = False
+        self._pending_state: Dict[str, tuple] = {}  # path -> (key, entries) not yet written
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer = None
+        self._closed = False
+        self.read_only = False  # Set when a load failed, so nothing overwrites the files
         
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
+        self.backend = self._create_backend(backend)
+        atexit.register(self.close)
+    
+    def _create_backend(self, backend: Union[str, StorageBackend]) -> StorageBackend:
+        """Resolve a backend name to a StorageBackend instance"""
+        if isinstance(backend, StorageBackend):
+            return backend
+        if backend == "json":
+            return JsonBackend(self.filepath)
+        if backend == "journal":
+            journal_path = os.path.splitext(self.filepath)[0] + ".journal"
+            return JournalBackend(self.filepath, journal_path)
+        if backend == "binary":
+            binary_path = os.path.splitext(self.filepath)[0] + ".rmdb"
+            return BinaryBackend(binary_path, migrate_from=self.filepath)
+        if backend == "sqlite":
+            db_path = os.path.splitext(self.filepath)[0] + ".db"
+            return SqliteBackend(db_path, migrate_from=self.filepath)
+        raise ValueError(f"Unknown storage backend: {backend}")
     
     def save_reminders(self, reminders: List[Reminder]) -> bool:
         """Save reminders to JSON file"""
-        try:
-            data = {
-                "last_saved": date.today().isoformat(),
-                "reminders": [r.to_dict() for r in reminders]
-            }
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        with self._cond:
+            self._records = {r["id"]: r for r in encode_records(reminders)}
+            self._dirty.clear()
+            self._full_rewrite = True
+        return self._write()
+    
+    def mark_dirty(self, reminder: Reminder):
+        """Record an added or changed reminder for the next background write"""
+        with self._cond:
+            self._records[reminder.id] = reminder.to_dict()
+            self._dirty.add(reminder.id)
+            self._wake_writer()
+    
+    def mark_deleted(self, reminder_id: str):
+        """Record a deleted reminder for the next background write"""
+        with self._cond:
+            if self._records.pop(reminder_id, None) is not None:
+                self._dirty.add(reminder_id)
+                self._wake_writer()
+    
+    def has_pending_changes(self) -> bool:
+        """True if there are changes not yet written to disk"""
+        with self._cond:
+            return bool(self._dirty) or self._full_rewrite or bool(self._pending_state)
+    
+    def flush(self) -> bool:
+        """Write pending changes now, on the calling thread"""
+        if not self.has_pending_changes():
             return True
-        except Exception as e:
-            print(f"Error saving reminders: {e}")
+        return self._write()
+    
+    def close(self):
+        """Stop the background writer, write anything still pending and close the backend"""
+        with self._cond:
+            if self._closed and self._writer is None:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        self.backend.close()
+    
+    def _wake_writer(self):
+        # Caller holds self._cond
+        if self._closed or not self._has_work():
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop,
+                                            name="StorageWriter", daemon=True)
+            self._writer.start()
+        self._cond.notify_all()
+    
+    def _writer_loop(self):
+        """Background thread: wait for changes, let the burst settle, write once"""
+        while True:
+            with self._cond:
+                while not self._has_work() and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                self._wait_unless_closed(self.coalesce_window)
+                if self._closed:
+                    return  # close() flushes on its own thread
+            if not self._write():
+                # The changes were kept; retry later rather than spin on a full disk
+                with self._cond:
+                    self._wait_unless_closed(self.RETRY_DELAY)
+    
+    def _has_work(self) -> bool:
+        # Caller holds self._cond; reminders are not written once read-only
+        return bool(self._pending_state) or \
+            (not self.read_only and (bool(self._dirty) or self._full_rewrite))
+    
+    def _wait_unless_closed(self, seconds: float):
+        # Caller holds self._cond
+        deadline = time.monotonic() + seconds
+        while not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+    
+    def _write(self) -> bool:
+        """Write the pending side files, then hand pending reminder changes to the backend"""
+        state_written = self._write_state()
+        if self.read_only:
             return False
+        with self._cond:
+            if not (self._dirty or self._full_rewrite):
+                return state_written
+        return self._write_reminders() and state_written
+    
+    def _write_state(self) -> bool:
+        with self._write_lock:
+            with self._cond:
+                pending, self._pending_state = self._pending_state, {}
+            written = True
+            for path, (key, entries) in pending.items():
+                if not self._write_state_file(path, key, entries):
+                    written = False
+                    with self._cond:
+                        # Retry unless a newer state was queued meanwhile
+                        self._pending_state.setdefault(path, (key, entries))
+                        self._wake_writer()
+            return written
+    
+    def _write_reminders(self) -> bool:
+        with self._write_lock:
+            # Snapshot under the write lock so writes land in order
+            with self._cond:
+                records = list(self._records.values())
+                dirty = self._dirty
+                upserts = [self._records[i] for i in dirty if i in self._records]
+                deletes = [i for i in dirty if i not in self._records]
+                full_rewrite = self._full_rewrite
+                self._dirty = set()
+                self._full_rewrite = False
+            try:
+                last_saved = date.today().isoformat()
+                if full_rewrite:
+                    self.backend.write_all(records, last_saved)
+                else:
+                    self.backend.apply(upserts, deletes, records, last_saved)
+                return True
+            except Exception as e:
+                print(f"Error saving reminders: {e}")
+                # Hand the changes back so the next write retries them;
+                # backends that only apply the dirty ids would lose them otherwise
+                with self._cond:
+                    self._dirty |= dirty
+                    self._full_rewrite = self._full_rewrite or full_rewrite
+                    self._wake_writer()
+                return False
     
     def load_reminders(self) -> tuple[List[Reminder], bool]:
         """
-        Load reminders from JSON file.
+        Load reminders from the backend.
         Returns tuple of (reminders list, is_new_day flag)
         """
         try:
-            if not os.path.exists(self.filepath):
-                return [], False
-            
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            reminders = [Reminder.from_dict(r) for r in data.get("reminders", [])]
+            last_saved, batches = self.backend.stream()
             
             # Check if it's a new day
-            last_saved = data.get("last_saved")
             is_new_day = False
             if last_saved:
-                last_date = date.fromisoformat(last_saved)
-                is_new_day = last_date < date.today()
+                try:
+                    is_new_day = date.fromisoformat(last_saved) < date.today()
+                except ValueError:
+                    print(f"Ignoring unreadable last_saved date: {last_saved!r}")
             
-            # Reset daily reminders if new day
-            if is_new_day:
-                for reminder in reminders:
-                    reminder.reset_for_new_day()
+            reminders = []
+            records = {}
+            rejected = []
+            for batch in batches:
+                decoded = decode_records(batch, rejected)
+                # Reset daily reminders if new day
+                if is_new_day:
+                    for reminder in decoded:
+                        reminder.reset_for_new_day()
+                reminders.extend(decoded)
+                records.update((r["id"], r) for r in encode_records(decoded))
             
-            return reminders, is_new_day
+            if rejected:
+                self._quarantine(rejected)
+            with self._cond:
+                self._records = records
             
+            return reminders, is_new_day
+        
         except Exception as e:
-            print(f"Error loading reminders: {e}")
+            # Saving now would replace the user's data with whatever is left
+            # in memory, so leave the files alone until the next start
+            print(f"Error loading reminders: {e}; not saving changes this session")
+            self.read_only = True
             return [], False
     
+    def _quarantine(self, records: List) -> bool:
+        """
+        Keep records that could not be decoded in a side file, so the next
+        save does not lose them; each distinct record is kept once
+        """
+        try:
+            seen = set()
+            if os.path.exists(self.rejected_path):
+                with open(self.rejected_path, 'r', encoding='utf-8') as f:
+                    seen = {line.rstrip("\n") for line in f}
+            lines = [json.dumps(r, ensure_ascii=False, sort_keys=True) for r in records]
+            new_lines = [line for line in dict.fromkeys(lines) if line not in seen]
+            if new_lines:
+                with open(self.rejected_path, 'a', encoding='utf-8') as f:
+                    f.write("".join(line + "\n" for line in new_lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+            print(f"Warning: skipped {len(records)} unreadable reminder(s), "
+                  f"kept in {self.rejected_path}")
+            return True
+        except Exception as e:
+            # Without a copy elsewhere the records must stay in the data file
+            print(f"Error quarantining unreadable reminders: {e}; not saving changes this session")
+            self.read_only = True
+            return False
+    
+    def _save_state(self, path: str, key: str, entries: List[dict]) -> bool:
+        """Queue a side file for the background writer; replaces any state not yet written"""
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._pending_state[path] = (key, list(entries))
+                self._wake_writer()
+        # Nothing writes after close(), so write now
+        return self._write_state_file(path, key, entries) if closed else True
+    
+    @staticmethod
+    def _write_state_file(path: str, key: str, entries: List[dict]) -> bool:
+        try:
+            # Compact: the trigger log can hold an entry per reminder
+            atomic_write(path, lambda f: json.dump({key: entries}, f, ensure_ascii=False,
+                                                   separators=(",", ":")))
+            return True
+        except Exception as e:
+            print(f"Error saving {key}: {e}")
+            return False
+    
+    def _load_state(self, path: str, key: str) -> List[dict]:
+        with self._cond:
+            pending = self._pending_state.get(path)
+        if pending is not None:
+            return list(pending[1])
+        try:
+            if not os.path.exists(path):
+                return []
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get(key, [])
+            return entries if isinstance(entries, list) else []
+        except Exception as e:
+            print(f"Error loading {key}: {e}")
+            return []
+    
+    def save_snoozes(self, entries: List[dict]) -> bool:
+        """Queue pending snoozes ({"id", "due"} records) for their own file"""
+        return self._save_state(self.snooze_path, "snoozes", entries)
+    
+    def load_snoozes(self) -> List[dict]:
+        """Load pending snoozes saved by save_snoozes()"""
+        return self._load_state(self.snooze_path, "snoozes")
+    
+    def save_triggers(self, entries: List[dict]) -> bool:
+        """Queue fired occurrences ({"id", "key"} records) for their own file"""
+        return self._save_state(self.trigger_path, "triggers", entries)
+    
+    def load_triggers(self) -> List[dict]:
+        """Load fired occurrences saved by save_triggers()"""
+        return self._load_state(self.trigger_path, "triggers")
+    
     def has_saved_data(self) -> bool:
         """Check if there's existing saved data"""
-        return os.path.exists(self.filepath)
+        return self.backend.exists()
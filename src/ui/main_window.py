@@ -10,7 +10,7 @@ from src.ui.widgets.reminders_panel import RemindersPanel
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, storage_backend: str = "json"):
         super().__init__()
         self.setWindowTitle("Clock and Remind - English Learning")
         self.setGeometry(100, 100, 1100, 1200)
@@ -75,12 +75,17 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.flip_clock)
         
         # Reminders Panel
-        self.reminders_panel = RemindersPanel()
+        self.reminders_panel = RemindersPanel(storage_backend)
         main_layout.addWidget(self.reminders_panel, 1)  # Give stretch factor
         
         # Add stretch to push everything to top
         main_layout.addStretch()
     
+    def closeEvent(self, event):
+        """Flush pending reminder changes on close"""
+        self.reminders_panel.shutdown()
+        super().closeEvent(event)
+    
     def position_top_right(self):
         """Position window at top-right corner of screen"""
         screen = QApplication.primaryScreen()
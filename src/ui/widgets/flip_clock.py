@@ -3,13 +3,15 @@ Flip Clock Widget - Displays time in flip clock style with animation
 """
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QVBoxLayout, QGraphicsOpacityEffect, QSizePolicy
-from PyQt6.QtCore import Qt, QTimer, QTime, QPropertyAnimation, QEasingCurve, QRect, QVariantAnimation
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer, QTime, QPropertyAnimation, QEasingCurve, QRect, QRectF, QVariantAnimation
 from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QPixmap, QTransform, QPen, QBrush, QPainterPath
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 
 
 class BlinkingSeparator(QLabel):
-    """Colon separator with blinking effect"""
+    """Colon separator with blinking effect, driven by the clock's AnimationDriver"""
     
     def __init__(self):
         super().__init__(":")
@@ -28,36 +30,78 @@ class BlinkingSeparator(QLabel):
         # Setup opacity effect for blinking
         self.opacity_effect = QGraphicsOpacityEffect()
         self.setGraphicsEffect(self.opacity_effect)
-        
-        # Opacity animation for blinking
-        self.blink_timer = QTimer()
-        self.blink_timer.timeout.connect(self.toggle_visibility)
-        self.blink_timer.start(500)  # Blink every 500ms
     
-    def toggle_visibility(self):
-        """Toggle visibility for blinking effect"""
-        self.visible_state = not self.visible_state
+    def set_blink_state(self, visible):
+        """Show or dim the colon, returns True if the state changed"""
+        if visible == self.visible_state:
+            return False
+        self.visible_state = visible
         opacity = 1.0 if self.visible_state else 0.3
         self.opacity_effect.setOpacity(opacity)
+        return True
+    
+    def toggle_visibility(self):
+        """Toggle visibility for blinking effect"""
+        self.set_blink_state(not self.visible_state)
+
+
+class PixmapCache:
+    """Small LRU cache of rendered pixmaps with hit/miss counters"""
+    
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key, render):
+        """Return the cached pixmap for key, rendering it with render() on a miss"""
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        pixmap = render()
+        self._entries[key] = pixmap
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return pixmap
+    
+    def clear(self):
+        """Drop every cached pixmap"""
+        self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
 
 
 class FlipNumberWidget(QWidget):
-    """Flip number display with real flip animation"""
+    """
+    Flip number display with real flip animation.
+    The card background and each two-digit glyph are rendered once into
+    pixmaps keyed by (value, size, device pixel ratio); animation frames
+    only blit and scale those pixmaps. A running flip only invalidates the
+    digit area, and painted_area counts the pixels actually repainted.
+    """
+    
+    FLIP_DURATION = 0.5  # seconds
     
     def __init__(self, initial_value="00"):
         super().__init__()
         self.current_value = initial_value
         self.next_value = initial_value
         self.flip_progress = 0.0
+        self.flip_started = 0.0
         self.is_flipping = False
         
         # Font styling - will be updated dynamically
         self.font_display = QFont("Courier New", 64, QFont.Weight.Bold)
         self.base_font_size = 64
         
-        # Setup animation timer
-        self.flip_timer = QTimer()
-        self.flip_timer.timeout.connect(self.update_flip_animation)
+        # Pre-rendered background and digit glyphs, cleared on resize
+        self.pixmap_cache = PixmapCache(max_entries=64)
+        self.painted_area = 0
         
         # Set size only (no stylesheet to avoid conflicts)
         self.setMinimumSize(130, 300)
@@ -70,27 +114,37 @@ class FlipNumberWidget(QWidget):
         # Calculate font size proportional to widget height (increased for better visibility)
         new_font_size = max(30, int(self.height() * 0.5))
         self.font_display.setPointSize(new_font_size)
+        self.pixmap_cache.clear()
     
-    def update_flip_animation(self):
-        """Update flip animation progress"""
+    def update_flip_animation(self, now=None):
+        """
+        Set flip progress from the monotonic time elapsed since the flip
+        started, so late frames catch up instead of slowing the flip down.
+        The caller schedules the repaint.
+        """
         if self.is_flipping:
-            self.flip_progress += 0.06  # Speed of flip
+            now = time.monotonic() if now is None else now
+            self.flip_progress = (now - self.flip_started) / self.FLIP_DURATION
             if self.flip_progress >= 1.0:
                 self.flip_progress = 1.0
                 self.is_flipping = False
                 self.current_value = self.next_value
-                self.flip_timer.stop()
-            self.update()
     
-    def paintEvent(self, a0):
-        """Draw flip animation with centered number"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
+    def _new_pixmap(self, width, height):
+        """Transparent pixmap at the screen's device pixel ratio"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+    
+    def _render_background(self):
+        """Rounded card with border"""
         width = self.width()
         height = self.height()
-        center_x = width / 2
-        center_y = height / 2
+        pixmap = self._new_pixmap(width, height)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Create rounded rectangle path for background
         path = QPainterPath()
@@ -104,52 +158,81 @@ class FlipNumberWidget(QWidget):
         border_pen.setWidth(3)
         painter.setPen(border_pen)
         painter.drawPath(path)
-        
-        # Calculate flip angle (0 to 180 degrees)
-        flip_angle = self.flip_progress * 180.0
-        
+        painter.end()
+        return pixmap
+    
+    def _render_glyph(self, value):
+        """Two-digit text centered in the text area, on a widget-sized pixmap"""
+        pixmap = self._new_pixmap(self.width(), self.height())
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setFont(self.font_display)
         painter.setPen(QColor("#ffffff"))
+        painter.drawText(self._text_rect(), Qt.AlignmentFlag.AlignCenter, value)
+        painter.end()
+        return pixmap
+    
+    def _text_rect(self):
+        # Text rect with padding to avoid clipping
+        return QRect(15, 15, self.width() - 30, self.height() - 30)
+    
+    def _digit_area(self):
+        # Band the glyphs can cover; large fonts may overflow the text rect sideways
+        return QRect(0, 15, self.width(), self.height() - 30)
+    
+    def _cache_key(self, kind, value=None):
+        return (kind, value, self.width(), self.height(), self.devicePixelRatioF())
+    
+    def update_digit_area(self):
+        """Schedule a repaint of just the area the flipping digits cover"""
+        self.update(self._digit_area())
+    
+    def paintEvent(self, a0):
+        """Draw flip animation with centered number from cached pixmaps"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         
-        # Create text rect with padding to avoid clipping
-        text_rect = QRect(15, 15, width - 30, height - 30)
+        width = self.width()
+        center_x = width / 2
+        center_y = self.height() / 2
         
-        # Current number - scales down and rotates as it flips (first half)
-        if flip_angle < 90:
-            scale_y = 1.0 - (flip_angle / 90.0)
-            
-            painter.save()
-            # Move to center, scale on Y axis, move back
-            painter.translate(center_x, center_y)
-            painter.scale(1.0, scale_y)
-            painter.translate(-center_x, -center_y)
-            
-            # Draw centered text
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.current_value)
-            
-            # Draw top half clip (only show top half during first flip)
-            painter.restore()
+        # Only blit the part of the static card that needs repainting
+        dirty = a0.rect()
+        self.painted_area += dirty.width() * dirty.height()
+        background = self.pixmap_cache.get(self._cache_key("bg"), self._render_background)
+        dpr = background.devicePixelRatio()
+        painter.drawPixmap(QRectF(dirty), background,
+                           QRectF(dirty.x() * dpr, dirty.y() * dpr,
+                                  dirty.width() * dpr, dirty.height() * dpr))
         
-        # Next number - scales up and rotates as it flips (second half)
-        if flip_angle > 90:
-            scale_y = (flip_angle - 90.0) / 90.0
-            
+        # Calculate flip angle (0 to 180 degrees)
+        flip_angle = self.flip_progress * 180.0
+        
+        # Current number scales down in the first half of the flip,
+        # next number scales up in the second half
+        if flip_angle < 90:
+            value, scale_y = self.current_value, 1.0 - (flip_angle / 90.0)
+        elif flip_angle > 90:
+            value, scale_y = self.next_value, (flip_angle - 90.0) / 90.0
+        else:
+            value, scale_y = None, 0.0
+        
+        if value is not None:
+            glyph = self.pixmap_cache.get(self._cache_key("glyph", value),
+                                          lambda: self._render_glyph(value))
             painter.save()
             # Move to center, scale on Y axis, move back
             painter.translate(center_x, center_y)
             painter.scale(1.0, scale_y)
             painter.translate(-center_x, -center_y)
-            
-            # Draw centered text
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.next_value)
-            
+            painter.drawPixmap(0, 0, glyph)
             painter.restore()
         
         # Draw divider line in the middle (always visible)
         painter.setPen(QColor("#444444"))
         painter.drawLine(0, int(center_y), width, int(center_y))
     
-    def animate_flip(self, new_value):
+    def animate_flip(self, new_value, now=None):
         """Animate flip when value changes"""
         new_value_str = str(new_value).zfill(2)
         
@@ -157,9 +240,7 @@ class FlipNumberWidget(QWidget):
             self.next_value = new_value_str
             self.is_flipping = True
             self.flip_progress = 0.0
-            
-            # Start animation timer
-            self.flip_timer.start(30)  # 30ms interval
+            self.flip_started = time.monotonic() if now is None else now
     
     def update_value_instant(self, value):
         """Update value without animation"""
@@ -168,7 +249,6 @@ class FlipNumberWidget(QWidget):
         self.next_value = value_str
         self.flip_progress = 0.0
         self.is_flipping = False
-        self.flip_timer.stop()
         self.update()
 
 
@@ -181,11 +261,185 @@ class AnimatedFlipNumber(QLabel):
         self.setText(str(value).zfill(2))
 
 
+class FrameStats:
+    """Timing of recent animation frames, for measuring jank"""
+    
+    def __init__(self, history=120):
+        self.intervals = deque(maxlen=history)  # seconds between frames
+        self.work_times = deque(maxlen=history)  # seconds spent in each frame
+        self.frames = 0
+        self.dropped = 0
+    
+    def record(self, interval, work, dropped):
+        self.frames += 1
+        self.dropped += dropped
+        self.intervals.append(interval)
+        self.work_times.append(work)
+    
+    def reset(self):
+        self.intervals.clear()
+        self.work_times.clear()
+        self.frames = 0
+        self.dropped = 0
+    
+    def as_dict(self):
+        """Summary in milliseconds"""
+        intervals = list(self.intervals) or [0.0]
+        work_times = list(self.work_times) or [0.0]
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "avg_interval_ms": 1000 * sum(intervals) / len(intervals),
+            "max_interval_ms": 1000 * max(intervals),
+            "avg_work_ms": 1000 * sum(work_times) / len(work_times),
+            "max_work_ms": 1000 * max(work_times)
+        }
+
+
+class AnimationDriver(QObject):
+    """
+    Single timer behind the whole clock. Each wakeup handles the second
+    tick, the separator blink and every running digit flip together; only
+    the digit areas that changed are invalidated, and Qt paints them in one
+    pass. While nothing is flipping it sleeps until the next half-second
+    boundary.
+    
+    Flips are timed with the monotonic clock: frames are paced on a fixed
+    grid and a late frame skips ahead rather than queueing up.
+    
+    In "idle" mode the driver does not run at all; wakeups are counted per
+    mode so the saving can be measured with wakeup_report().
+    """
+    
+    FRAME_INTERVAL = 30  # ms between flip frames
+    
+    def __init__(self, clock):
+        super().__init__(clock)
+        self.clock = clock
+        self.digits = []
+        self.separators = []
+        self.wakeups = 0
+        self.repaints = 0
+        self.stats = FrameStats()
+        self._last_second = None
+        self._last_frame_at = None
+        self._frame_anchor = 0.0
+        
+        # Power mode bookkeeping
+        self.mode = "active"
+        self.mode_wakeups = {"active": 0, "idle": 0}
+        self.mode_seconds = {"active": 0.0, "idle": 0.0}
+        self._mode_since = time.monotonic()
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+    
+    def start(self):
+        """Run the first tick now"""
+        self.tick()
+    
+    def stop(self):
+        """Stop ticking"""
+        self.timer.stop()
+        self._last_frame_at = None
+    
+    def set_mode(self, mode):
+        """Switch between "active" (ticking) and "idle" (stopped)"""
+        if mode == self.mode:
+            return
+        now = time.monotonic()
+        self.mode_seconds[self.mode] += now - self._mode_since
+        self._mode_since = now
+        self.mode = mode
+        if mode == "idle":
+            self.stop()
+        else:
+            self.start()
+    
+    def wakeup_report(self):
+        """Wakeups per minute spent in each mode so far"""
+        seconds = dict(self.mode_seconds)
+        seconds[self.mode] += time.monotonic() - self._mode_since
+        return {
+            mode: {
+                "seconds": seconds[mode],
+                "wakeups": self.mode_wakeups[mode],
+                "wakeups_per_minute": 60 * self.mode_wakeups[mode] / seconds[mode] if seconds[mode] else 0.0
+            }
+            for mode in seconds
+        }
+    
+    def frame_stats(self):
+        """Per-frame timing summary"""
+        return self.stats.as_dict()
+    
+    def tick(self):
+        """Advance everything that is due and re-arm the timer"""
+        self.wakeups += 1
+        self.mode_wakeups[self.mode] += 1
+        tick_start = time.monotonic()
+        now = datetime.now()
+        dirty = False
+        interval_ms = self.FRAME_INTERVAL
+        
+        # Frame timing, only between consecutive animation frames
+        dropped = 0
+        if self._last_frame_at is not None:
+            elapsed = tick_start - self._last_frame_at
+            dropped = max(0, int(elapsed * 1000 / interval_ms + 0.5) - 1)
+        
+        second = now.replace(microsecond=0)
+        if second != self._last_second:
+            self._last_second = second
+            self.clock.update_time(now, tick_start)
+        
+        # Colons are bright for the first half of every second
+        blink_on = now.microsecond < 500000
+        for separator in self.separators:
+            dirty |= separator.set_blink_state(blink_on)
+        
+        flipping = False
+        for digit in self.digits:
+            if digit.is_flipping:
+                digit.update_flip_animation(tick_start)
+                flipping = flipping or digit.is_flipping
+                digit.update_digit_area()
+                dirty = True
+        
+        if dirty:
+            self.repaints += 1
+        
+        if self._last_frame_at is not None:
+            self.stats.record(tick_start - self._last_frame_at,
+                              time.monotonic() - tick_start, dropped)
+        
+        if flipping:
+            # Stay on the frame grid started with this flip; a late frame
+            # skips to the next free slot instead of queueing up
+            if self._last_frame_at is None:
+                self._frame_anchor = tick_start
+            self._last_frame_at = tick_start
+            since_anchor_ms = int((time.monotonic() - self._frame_anchor) * 1000)
+            delay = interval_ms - since_anchor_ms % interval_ms
+        else:
+            self._last_frame_at = None
+            delay = 500 - (now.microsecond // 1000) % 500
+        self.timer.start(delay)
+
+
 class FlipClock(QWidget):
-    """Main flip clock widget combining hours, minutes, and seconds with animation"""
+    """
+    Main flip clock widget combining hours, minutes, and seconds with animation.
+    While its window is hidden, minimized or not exposed the clock stops
+    rendering entirely and snaps to the current time when shown again.
+    """
     
     def __init__(self):
         super().__init__()
+        self._watched_window = None
+        self._paint_report_since = time.monotonic()
         self.init_ui()
         self.setup_timer()
     
@@ -206,16 +460,16 @@ class FlipClock(QWidget):
         layout.addWidget(self.hours)
         
         # Separator - colon with blinking
-        separator1 = BlinkingSeparator()
-        layout.addWidget(separator1)
+        self.separator1 = BlinkingSeparator()
+        layout.addWidget(self.separator1)
         
         # Minutes
         self.minutes = FlipNumberWidget("38")
         layout.addWidget(self.minutes)
         
         # Separator - colon with blinking
-        separator2 = BlinkingSeparator()
-        layout.addWidget(separator2)
+        self.separator2 = BlinkingSeparator()
+        layout.addWidget(self.separator2)
         
         # Seconds
         self.seconds = FlipNumberWidget("45")
@@ -257,29 +511,86 @@ class FlipClock(QWidget):
         """)
     
     def setup_timer(self):
-        """Setup timer to update clock every second"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
-        self.update_time()  # Initial update
+        """Setup the shared driver that ticks the clock, flips and blinks"""
+        self.driver = AnimationDriver(self)
+        self.driver.digits = [self.hours, self.minutes, self.seconds]
+        self.driver.separators = [self.separator1, self.separator2]
+        self.driver.start()  # Initial update
     
-    def update_time(self):
+    def update_time(self, now=None, monotonic_now=None):
         """Update the displayed time"""
-        now = datetime.now()
+        now = now or datetime.now()
         
         # Update time components with animation
         hours = now.hour % 12 or 12
         minutes = now.minute
         seconds = now.second
         
-        self.hours.animate_flip(hours)
-        self.minutes.animate_flip(minutes)
-        self.seconds.animate_flip(seconds)
+        self.hours.animate_flip(hours, monotonic_now)
+        self.minutes.animate_flip(minutes, monotonic_now)
+        self.seconds.animate_flip(seconds, monotonic_now)
         
-        # Update AM/PM
+        # Update AM/PM, only when it changed to avoid relayout and repaint
         ampm = "PM" if now.hour >= 12 else "AM"
-        self.ampm.setText(ampm)
+        if ampm != self.ampm.text():
+            self.ampm.setText(ampm)
         
         # Update date
         date_str = now.strftime("%A, %B %d")
-        self.date_label.setText(date_str)
+        if date_str != self.date_label.text():
+            self.date_label.setText(date_str)
+    
+    def paint_report(self):
+        """Pixels repainted per second by each digit since the last call"""
+        now = time.monotonic()
+        elapsed = max(now - self._paint_report_since, 1e-6)
+        self._paint_report_since = now
+        report = {}
+        for name, digit in (("hours", self.hours), ("minutes", self.minutes), ("seconds", self.seconds)):
+            report[name] = digit.painted_area / elapsed
+            digit.painted_area = 0
+        report["total"] = sum(report.values())
+        return report
+    
+    def snap_to_now(self):
+        """Show the current time immediately, without flip animations"""
+        now = datetime.now()
+        self.hours.update_value_instant(now.hour % 12 or 12)
+        self.minutes.update_value_instant(now.minute)
+        self.seconds.update_value_instant(now.second)
+        self.update_time(now)
+    
+    def showEvent(self, event):
+        """Start watching the top-level window for visibility changes"""
+        super().showEvent(event)
+        window = self.window()
+        if window is not self._watched_window:
+            window.installEventFilter(self)
+            if window.windowHandle() is not None:
+                window.windowHandle().installEventFilter(self)
+            self._watched_window = window
+        self.update_power_mode()
+    
+    def eventFilter(self, obj, event):
+        """Re-evaluate the power mode whenever the window is shown, hidden or exposed"""
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.Show,
+                            QEvent.Type.Hide, QEvent.Type.Expose):
+            # Window state is only final once the event has been handled
+            QTimer.singleShot(0, self.update_power_mode)
+        return super().eventFilter(obj, event)
+    
+    def is_on_screen(self):
+        """True if the clock's window can currently be seen"""
+        window = self.window()
+        handle = window.windowHandle()
+        return window.isVisible() and not window.isMinimized() and \
+            (handle is None or handle.isExposed())
+    
+    def update_power_mode(self):
+        """Pause rendering while nobody can see the clock, resume on restore"""
+        if self.is_on_screen():
+            if self.driver.mode == "idle":
+                self.snap_to_now()
+                self.driver.set_mode("active")
+        else:
+            self.driver.set_mode("idle")
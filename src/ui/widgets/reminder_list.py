@@ -0,0 +1,272 @@
+"""
+Reminder List - Model/view display of reminders
+"""
+
+from bisect import bisect_left, bisect_right
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt6.QtCore import (Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize,
+                          QEvent, pyqtSignal)
+from PyQt6.QtGui import QFont, QColor, QPainter, QPainterPath, QPen, QCursor
+from src.models.reminder import Reminder
+
+
+ReminderRole = Qt.ItemDataRole.UserRole + 1
+ColorRole = Qt.ItemDataRole.UserRole + 2
+
+
+class ReminderListModel(QAbstractListModel):
+    """
+    List model of reminders sorted by time of day.
+    Single changes are applied as keyed, minimal updates: one row inserted at
+    its sorted position, one row removed or one row repainted. op_counts
+    records how many rows each kind of operation touched.
+    """
+    
+    # Color palette for different reminders
+    COLORS = ['#4a7adb', '#f5a623', '#4caf50', '#e74c3c', '#9b59b6', '#1abc9c']
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._reminders = []
+        self._keys = []  # Minute of day per row, kept sorted for bisect
+        self.op_counts = {"reset": 0, "inserted": 0, "removed": 0, "changed": 0}
+    
+    @staticmethod
+    def _key(reminder: Reminder) -> int:
+        return reminder.minute_of_day
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._reminders)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._reminders):
+            return None
+        reminder = self._reminders[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return reminder.content
+        if role == ReminderRole:
+            return reminder
+        if role == ColorRole:
+            return self.COLORS[index.row() % len(self.COLORS)]
+        return None
+    
+    def set_reminders(self, reminders):
+        """Replace the whole list"""
+        self.beginResetModel()
+        self._reminders = sorted(reminders, key=self._key)
+        self._keys = [self._key(r) for r in self._reminders]
+        self.endResetModel()
+        self.op_counts["reset"] += len(self._reminders)
+    
+    def insert_reminder(self, reminder: Reminder) -> int:
+        """Insert one reminder at its sorted position, returns the row"""
+        key = self._key(reminder)
+        row = bisect_right(self._keys, key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._reminders.insert(row, reminder)
+        self._keys.insert(row, key)
+        self.endInsertRows()
+        self.op_counts["inserted"] += 1
+        return row
+    
+    def remove_reminder(self, reminder: Reminder) -> bool:
+        """Remove exactly the row showing this reminder"""
+        row = self.row_of(reminder)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._reminders[row]
+        del self._keys[row]
+        self.endRemoveRows()
+        self.op_counts["removed"] += 1
+        return True
+    
+    def reminder_changed(self, reminder: Reminder):
+        """Repaint the row of a reminder whose state (not time) changed"""
+        row = self.row_of(reminder)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            self.op_counts["changed"] += 1
+    
+    def reminders_changed(self, reminders):
+        """Repaint many changed rows with a single dataChanged covering them"""
+        rows = [row for row in map(self.row_of, reminders) if row >= 0]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)))
+            self.op_counts["changed"] += len(rows)
+    
+    def row_of(self, reminder: Reminder) -> int:
+        """Row of a reminder, found by binary search on its time, or -1"""
+        key = self._key(reminder)
+        for row in range(bisect_left(self._keys, key), bisect_right(self._keys, key)):
+            if self._reminders[row].id == reminder.id:
+                return row
+        return -1
+    
+    def reminder_at(self, row: int) -> Reminder:
+        """Reminder shown in the given row"""
+        return self._reminders[row]
+
+
+class ReminderItemDelegate(QStyledItemDelegate):
+    """Paints a reminder card: colour bar, time, content, checkbox and delete button"""
+    
+    toggle_clicked = pyqtSignal(object)  # Emits the Reminder whose checkbox was clicked
+    remove_clicked = pyqtSignal(object)  # Emits the Reminder to delete
+    
+    ROW_HEIGHT = 80
+    SPACING = 12
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.time_font = QFont("Segoe UI", 13)
+        self.time_font.setBold(True)
+        self.content_font = QFont("Segoe UI", 12)
+        self.struck_font = QFont(self.content_font)
+        self.struck_font.setStrikeOut(True)
+        self.icon_font = QFont("Segoe UI Emoji", 11)
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.SPACING)
+    
+    def _card_rect(self, rect: QRect) -> QRect:
+        return rect.adjusted(5, self.SPACING // 2, -5, -self.SPACING // 2)
+    
+    def _delete_rect(self, rect: QRect) -> QRect:
+        card = self._card_rect(rect)
+        return QRect(card.right() - 20 - 32, card.center().y() - 16, 32, 32)
+    
+    def _checkbox_rect(self, rect: QRect) -> QRect:
+        delete = self._delete_rect(rect)
+        return QRect(delete.left() - 12 - 24, delete.center().y() - 12, 24, 24)
+    
+    def paint(self, painter, option, index):
+        reminder = index.data(ReminderRole)
+        color = QColor(index.data(ColorRole))
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card
+        card = self._card_rect(option.rect)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(card), 12, 12)
+        painter.fillPath(path, QColor("white"))
+        
+        # Left border indicator
+        content_top = card.top() + 15
+        content_height = card.height() - 30
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(card.left() + 20, content_top, 4, content_height), 2, 2)
+        
+        # Time row with repeat indicator, content below
+        text_left = card.left() + 20 + 4 + 12
+        checkbox = self._checkbox_rect(option.rect)
+        text_width = checkbox.left() - 12 - text_left
+        half = content_height // 2
+        time_rect = QRect(text_left, content_top, text_width, half)
+        content_rect = QRect(text_left, content_top + half, text_width, content_height - half)
+        
+        muted = QColor("#999")
+        painter.setFont(self.time_font)
+        painter.setPen(muted if reminder.completed else color)
+        time_text = reminder.time_text(twelve_hour=True)
+        painter.drawText(time_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, time_text)
+        if reminder.repeat_daily or reminder.recurrence is not None:
+            offset = painter.fontMetrics().horizontalAdvance(time_text) + 8
+            painter.setFont(self.icon_font)
+            painter.drawText(time_rect.adjusted(offset, 0, 0, 0),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "🔁")
+        
+        painter.setFont(self.struck_font if reminder.completed else self.content_font)
+        painter.setPen(muted if reminder.completed else QColor("#333"))
+        content = painter.fontMetrics().elidedText(reminder.content, Qt.TextElideMode.ElideRight,
+                                                   content_rect.width())
+        painter.drawText(content_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, content)
+        
+        # Checkbox
+        if reminder.completed:
+            painter.setPen(QPen(QColor("#4caf50"), 2))
+            painter.setBrush(QColor("#4caf50"))
+        else:
+            painter.setPen(QPen(color, 2))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(checkbox).adjusted(1, 1, -1, -1), 6, 6)
+        
+        # Delete button, highlighted while hovered
+        delete = self._delete_rect(option.rect)
+        view = self.parent()
+        if option.state & QStyle.StateFlag.State_MouseOver and view is not None:
+            cursor_pos = view.viewport().mapFromGlobal(QCursor.pos())
+            if delete.contains(cursor_pos):
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor("#ffebee"))
+                painter.drawRoundedRect(QRectF(delete), 6, 6)
+        painter.setFont(self.icon_font)
+        painter.setPen(QColor("#333"))
+        painter.drawText(delete, Qt.AlignmentFlag.AlignCenter, "🗑️")
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        """Handle clicks on the checkbox and delete button"""
+        if event.type() == QEvent.Type.MouseMove:
+            pos = event.position().toPoint()
+            on_control = (self._checkbox_rect(option.rect).contains(pos)
+                          or self._delete_rect(option.rect).contains(pos))
+            view = self.parent()
+            if view is not None:
+                view.viewport().setCursor(Qt.CursorShape.PointingHandCursor if on_control
+                                          else Qt.CursorShape.ArrowCursor)
+                view.viewport().update(option.rect)
+        elif event.type() == QEvent.Type.MouseButtonRelease and \
+                event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position().toPoint()
+            reminder = index.data(ReminderRole)
+            if self._checkbox_rect(option.rect).contains(pos):
+                self.toggle_clicked.emit(reminder)
+                return True
+            if self._delete_rect(option.rect).contains(pos):
+                self.remove_clicked.emit(reminder)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ReminderListView(QListView):
+    """List view that only paints the visible reminder rows"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.reminder_model = ReminderListModel(self)
+        self.delegate = ReminderItemDelegate(self)
+        self.setModel(self.reminder_model)
+        self.setItemDelegate(self.delegate)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setStyleSheet("""
+            QListView {
+                border: none;
+                background: transparent;
+            }
+            QScrollBar:vertical {
+                width: 6px;
+                background: transparent;
+                margin: 0;
+            }
+            QScrollBar::handle:vertical {
+                background: #ccc;
+                border-radius: 3px;
+                min-height: 30px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background: #999;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+        """)
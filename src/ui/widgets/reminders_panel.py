@@ -4,13 +4,19 @@ Reminders Panel Widget - Displays and manages reminders
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QCheckBox, QPushButton, QTimeEdit, 
-                             QScrollArea, QDialog, QLineEdit, QGraphicsDropShadowEffect,
+                             QDialog, QLineEdit, QGraphicsDropShadowEffect,
                              QMessageBox)
-from PyQt6.QtCore import Qt, QTime, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QTime
 from PyQt6.QtGui import QFont, QColor
+from src.core.engine import ReminderEngine
+from src.core.sinks import Notification
 from src.models.reminder import Reminder
 from src.services.notification_service import NotificationService
 from src.services.storage_service import StorageService
+from src.services.scheduler_service import SchedulerService
+from src.services.snooze_service import SnoozeService
+from src.services.rollover_service import RolloverService
+from src.ui.widgets.reminder_list import ReminderListView
 
 
 class AddReminderDialog(QDialog):
@@ -257,6 +263,11 @@ class AddReminderDialog(QDialog):
         """Get selected time"""
         return self.time_edit.time()
     
+    def get_minute_of_day(self) -> int:
+        """Get selected time as minute of day"""
+        selected = self.time_edit.time()
+        return selected.hour() * 60 + selected.minute()
+    
     def get_content(self) -> str:
         """Get reminder content"""
         return self.content_input.text().strip()
@@ -278,183 +289,25 @@ class AddReminderDialog(QDialog):
             event.accept()
 
 
-class ReminderItem(QWidget):
-    """Individual reminder item widget"""
-    
-    remove_clicked = pyqtSignal(object)
-    status_changed = pyqtSignal()  # Signal khi có thay đổi cần lưu
-    
-    # Color palette for different reminders
-    COLORS = ['#4a7adb', '#f5a623', '#4caf50', '#e74c3c', '#9b59b6', '#1abc9c']
-    _color_index = 0
-    
-    def __init__(self, reminder: Reminder, color: str = None):
-        super().__init__()
-        self.reminder = reminder
-        # Assign color based on index or use provided color
-        if color:
-            self.border_color = color
-        else:
-            self.border_color = ReminderItem.COLORS[ReminderItem._color_index % len(ReminderItem.COLORS)]
-            ReminderItem._color_index += 1
-        self.init_ui()
-    
-    def init_ui(self):
-        """Initialize UI"""
-        self.setMinimumHeight(80)
-        self.setMaximumHeight(90)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(20, 15, 20, 15)
-        layout.setSpacing(12)
-        
-        # Left border indicator (using a vertical line widget)
-        border_indicator = QWidget()
-        border_indicator.setFixedWidth(4)
-        border_indicator.setStyleSheet(f"background: {self.border_color}; border-radius: 2px;")
-        layout.addWidget(border_indicator)
-        
-        # Time and content (left side)
-        text_layout = QVBoxLayout()
-        text_layout.setSpacing(4)
-        
-        # Time row with repeat indicator
-        time_row = QHBoxLayout()
-        time_row.setSpacing(8)
-        
-        # Time label with color matching border
-        self.time_label = QLabel(self.reminder.time.toString("hh:mm AP"))
-        time_font = QFont("Segoe UI", 13)
-        time_font.setBold(True)
-        self.time_label.setFont(time_font)
-        self.time_label.setStyleSheet(f"color: {self.border_color}; background: transparent;")
-        time_row.addWidget(self.time_label)
-        
-        # Repeat indicator
-        if self.reminder.repeat_daily:
-            repeat_label = QLabel("🔁")
-            repeat_label.setToolTip("Repeats daily")
-            repeat_label.setStyleSheet("background: transparent; font-size: 12px;")
-            time_row.addWidget(repeat_label)
-        
-        time_row.addStretch()
-        text_layout.addLayout(time_row)
-        
-        # Content label
-        self.content_label = QLabel(self.reminder.content)
-        content_font = QFont("Segoe UI", 12)
-        self.content_label.setFont(content_font)
-        self.content_label.setStyleSheet("color: #333; background: transparent;")
-        text_layout.addWidget(self.content_label)
-        
-        layout.addLayout(text_layout, 1)
-        
-        # Checkbox
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(self.reminder.completed)
-        self.checkbox.stateChanged.connect(self.on_checkbox_changed)
-        self.checkbox.setFixedSize(28, 28)
-        self.checkbox.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.update_checkbox_style()
-        layout.addWidget(self.checkbox)
-        
-        # Delete button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setFixedSize(32, 32)
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.setToolTip("Delete reminder")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #ffebee;
-            }
-        """)
-        delete_btn.clicked.connect(self.on_delete_clicked)
-        layout.addWidget(delete_btn)
-        
-        # Set card styling
-        self.setStyleSheet("""
-            ReminderItem {
-                background: white;
-                border-radius: 12px;
-            }
-        """)
-        
-        self.update_completed_style()
-    
-    def on_delete_clicked(self):
-        """Handle delete button click"""
-        self.remove_clicked.emit(self.reminder)
-    
-    def update_checkbox_style(self):
-        """Update checkbox style based on state"""
-        if self.reminder.completed:
-            self.checkbox.setStyleSheet("""
-                QCheckBox::indicator {
-                    width: 24px;
-                    height: 24px;
-                    border-radius: 6px;
-                    background: #4caf50;
-                    border: 2px solid #4caf50;
-                }
-                QCheckBox::indicator:checked {
-                    image: none;
-                }
-            """)
-        else:
-            self.checkbox.setStyleSheet(f"""
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                    border-radius: 6px;
-                    background: transparent;
-                    border: 2px solid {self.border_color};
-                }}
-                QCheckBox::indicator:hover {{
-                    border: 2px solid {self.border_color};
-                    background: rgba(74, 122, 219, 0.1);
-                }}
-            """)
-    
-    def update_completed_style(self):
-        """Update style based on completion status"""
-        if self.reminder.completed:
-            self.content_label.setStyleSheet("""
-                color: #999; 
-                background: transparent;
-                text-decoration: line-through;
-            """)
-            self.time_label.setStyleSheet("color: #999; background: transparent;")
-        else:
-            self.content_label.setStyleSheet("color: #333; background: transparent;")
-            self.time_label.setStyleSheet(f"color: {self.border_color}; background: transparent;")
-    
-    def on_checkbox_changed(self):
-        """Handle checkbox state change"""
-        self.reminder.completed = self.checkbox.isChecked()
-        self.update_checkbox_style()
-        self.update_completed_style()
-        self.status_changed.emit()  # Notify parent to save
-
-
 class RemindersPanel(QWidget):
-    """Panel displaying all reminders"""
+    """Panel displaying all reminders; the Qt front end of a ReminderEngine"""
     
-    def __init__(self):
+    def __init__(self, storage_backend: str = "json"):
         super().__init__()
-        self.reminders = []
-        self.triggered_reminders = set()  # Track already triggered reminders
         self.notification_service = NotificationService()
-        self.storage_service = StorageService()
+        self.storage_service = StorageService(backend=storage_backend)
+        # The panel is the engine's notification sink
+        self.engine = ReminderEngine(self, storage=self.storage_service)
+        self.reminders = self.engine.index
+        self.scheduler = SchedulerService(self.engine.scheduler, self)
+        self.snooze_service = SnoozeService(self.storage_service, self)
+        self.snooze_service.snooze_due.connect(self.on_snooze_due)
+        self.notification_service.snooze_handler = self.snooze_service.snooze
         self.init_ui()
         self.load_reminders()
-        self.start_reminder_checker()
-        self.start_daily_reset_checker()
+        self.snooze_service.load()
+        self.rollover_service = RolloverService(self.engine.rollover, self)
+        self.engine.on_reminders_changed = self.list_view.reminder_model.reminders_changed
     
     def init_ui(self):
         """Initialize UI"""
@@ -473,44 +326,11 @@ class RemindersPanel(QWidget):
         title.setStyleSheet("color: #333; padding: 10px 0px; font-weight: bold; background: transparent;")
         layout.addWidget(title)
         
-        # Scroll area for reminders
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                width: 6px;
-                background: transparent;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #ccc;
-                border-radius: 3px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #999;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-        
-        self.reminders_container = QWidget()
-        self.reminders_layout = QVBoxLayout(self.reminders_container)
-        self.reminders_layout.setContentsMargins(5, 5, 5, 5)
-        self.reminders_layout.setSpacing(12)
-        self.reminders_container.setStyleSheet("background: transparent;")
-        
-        # Add stretch at bottom to push items up
-        self.reminders_layout.addStretch()
-        
-        scroll.setWidget(self.reminders_container)
-        layout.addWidget(scroll, 1)  # Give scroll area stretch factor
+        # Reminder list - only the visible rows are painted
+        self.list_view = ReminderListView()
+        self.list_view.delegate.toggle_clicked.connect(self.toggle_reminder)
+        self.list_view.delegate.remove_clicked.connect(self.remove_reminder)
+        layout.addWidget(self.list_view, 1)  # Give list stretch factor
         
         # Add New Reminder Button
         add_btn = QPushButton("+ Add New Reminder")
@@ -540,74 +360,38 @@ class RemindersPanel(QWidget):
     
     def load_reminders(self):
         """Load reminders from storage or use defaults"""
-        # Reset color index
-        ReminderItem._color_index = 0
-        
-        # Try to load from storage first
-        saved_reminders, is_new_day = self.storage_service.load_reminders()
-        
-        if saved_reminders:
-            # Use saved reminders
-            for reminder in saved_reminders:
-                self.add_reminder(reminder)
-            
-            if is_new_day:
-                # Save the reset state
-                self.save_reminders()
-                # Clear triggered reminders for new day
-                self.triggered_reminders.clear()
-        else:
-            # Use default reminders for first time
-            default_reminders = [
-                (Reminder(QTime(8, 0), "Learn 10 new words", repeat_daily=True), "#4a7adb"),
-                (Reminder(QTime(12, 0), "Practice pronunciation", repeat_daily=True), "#f5a623"),
-                (Reminder(QTime(15, 0), "Grammar exercise", repeat_daily=True), "#4caf50"),
-                (Reminder(QTime(19, 0), "Review vocabulary", repeat_daily=True), "#e74c3c"),
-            ]
-            
-            for reminder, color in default_reminders:
-                self.add_reminder(reminder, color)
-            
-            # Save defaults
-            self.save_reminders()
+        self.engine.load()
+        self.refresh_reminders()
     
-    def add_reminder(self, reminder: Reminder, color: str = None):
+    def add_reminder(self, reminder: Reminder):
         """Add a reminder to the panel"""
-        self.reminders.append(reminder)
-        item = ReminderItem(reminder, color)
-        item.remove_clicked.connect(self.remove_reminder)
-        item.status_changed.connect(self.save_reminders)
-        # Insert before the stretch
-        self.reminders_layout.insertWidget(self.reminders_layout.count() - 1, item)
+        self.engine.add(reminder)
     
     def save_reminders(self):
         """Save reminders to storage"""
-        self.storage_service.save_reminders(self.reminders)
+        self.engine.save()
+    
+    def toggle_reminder(self, reminder: Reminder):
+        """Flip a reminder's completed state from its checkbox"""
+        reminder.completed = not reminder.completed
+        self.list_view.reminder_model.reminder_changed(reminder)
+        self.on_status_changed(reminder)
+    
+    def on_status_changed(self, reminder: Reminder):
+        """Re-schedule a toggled reminder and persist the change"""
+        self.engine.status_changed(reminder)
+        if reminder.completed:
+            self.snooze_service.cancel(reminder.id)
     
     def remove_reminder(self, reminder: Reminder):
         """Remove a reminder"""
-        if reminder in self.reminders:
-            self.reminders.remove(reminder)
-            self.save_reminders()
-            self.refresh_reminders()
+        if self.engine.remove(reminder):
+            self.snooze_service.cancel(reminder.id)
+            self.list_view.reminder_model.remove_reminder(reminder)
     
     def refresh_reminders(self):
-        """Refresh the reminders display"""
-        # Remove all widgets except the stretch at the end
-        while self.reminders_layout.count() > 1:
-            item = self.reminders_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
-        
-        # Reset color index
-        ReminderItem._color_index = 0
-        
-        for reminder in sorted(self.reminders, key=lambda r: r.time.msecsSinceStartOfDay()):
-            item = ReminderItem(reminder)
-            item.remove_clicked.connect(self.remove_reminder)
-            item.status_changed.connect(self.save_reminders)
-            # Insert before the stretch
-            self.reminders_layout.insertWidget(self.reminders_layout.count() - 1, item)
+        """Rebuild the reminders display from scratch"""
+        self.list_view.reminder_model.set_reminders(self.reminders)
     
     def add_reminder_dialog(self):
         """Show dialog to add a new reminder"""
@@ -616,69 +400,36 @@ class RemindersPanel(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             content = dialog.get_content()
             if content:
-                reminder_time = dialog.get_time()
+                minute = dialog.get_minute_of_day()
                 repeat_daily = dialog.get_repeat_daily()
-                reminder = Reminder(reminder_time, content, repeat_daily=repeat_daily)
+                reminder = Reminder(minute, content, repeat_daily=repeat_daily)
                 self.add_reminder(reminder)
-                self.save_reminders()
-                self.refresh_reminders()
-    
-    def start_reminder_checker(self):
-        """Start timer to check for due reminders"""
-        self.check_timer = QTimer(self)
-        self.check_timer.timeout.connect(self.check_reminders)
-        self.check_timer.start(1000)  # Check every second
-    
-    def check_reminders(self):
-        """Check if any reminder is due and show notification"""
-        current_time = QTime.currentTime()
-        current_key = current_time.toString("hh:mm")
-        
-        for reminder in self.reminders:
-            if reminder.completed:
-                continue
-                
-            reminder_key = reminder.time.toString("hh:mm")
-            # Create unique key for this reminder instance
-            unique_key = f"{reminder_key}_{reminder.content}"
-            
-            # Check if time matches and not already triggered
-            if reminder_key == current_key and unique_key not in self.triggered_reminders:
-                self.triggered_reminders.add(unique_key)
-                self.show_reminder_notification(reminder)
+                self.list_view.reminder_model.insert_reminder(reminder)
     
-    def show_reminder_notification(self, reminder: Reminder):
-        """Show notification for a reminder"""
-        time_str = reminder.time.toString("hh:mm AP")
-        self.notification_service.show_notification(
-            time_str, 
-            reminder.content,
-            self.window()
-        )
+    def notify(self, notification: Notification):
+        """Show a notification from the engine as a popup"""
+        reminders = notification.reminders
+        if len(reminders) == 1:
+            self.notification_service.queue_notification(
+                notification.title,
+                reminders[0].content,
+                self.window(),
+                reminders[0].id
+            )
+        else:
+            self.notification_service.show_notification(
+                notification.title,
+                self.notification_service.group_message(notification.contents),
+                self.window(),
+                [r.id for r in reminders]
+            )
     
-    def start_daily_reset_checker(self):
-        """Start timer to check for daily reset at midnight"""
-        self.last_check_date = None
-        self.daily_reset_timer = QTimer(self)
-        self.daily_reset_timer.timeout.connect(self.check_daily_reset)
-        self.daily_reset_timer.start(60000)  # Check every minute
+    def on_snooze_due(self, reminder_id: str):
+        """Show a snoozed reminder again, unless it was completed or deleted since"""
+        reminder = self.reminders.get(reminder_id)
+        if reminder is not None and not reminder.completed:
+            self.engine.notify_reminder(reminder)
     
-    def check_daily_reset(self):
-        """Check if it's a new day and reset daily reminders"""
-        from datetime import date
-        today = date.today()
-        
-        if self.last_check_date is None:
-            self.last_check_date = today
-            return
-        
-        if today > self.last_check_date:
-            self.last_check_date = today
-            # Reset all daily reminders
-            for reminder in self.reminders:
-                reminder.reset_for_new_day()
-            # Clear triggered reminders
-            self.triggered_reminders.clear()
-            # Save and refresh
-            self.save_reminders()
-            self.refresh_reminders()
+    def shutdown(self):
+        """Write any pending changes before the app exits"""
+        self.engine.shutdown()
@@ -0,0 +1,53 @@
+import os
+import sys
+
+# Let the tests import src.* however pytest is started
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src.core.sinks import NotificationSink
+from src.services.storage_service import BACKENDS, StorageService
+
+
+class RecordingSink(NotificationSink):
+    """Keeps every notification an engine delivers"""
+    
+    def __init__(self):
+        self.notifications = []
+    
+    def notify(self, notification):
+        self.notifications.append(notification)
+    
+    @property
+    def shown(self) -> int:
+        """Reminders shown so far, counting each one in a group"""
+        return sum(len(n.reminders) for n in self.notifications)
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Each storage backend in turn"""
+    return request.param
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    """Factory for StorageService instances sharing the test's data directory"""
+    def make(backend="json"):
+        # A long window keeps the background writer out of the way; flush()
+        # and close() write on the test thread
+        return StorageService(coalesce_window=60, backend=backend, data_dir=str(tmp_path))
+    return make
+
+
+@pytest.fixture
+def recording_sink():
+    return RecordingSink()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The one QApplication; created here so no test makes a bare QCoreApplication first"""
+    widgets = pytest.importorskip("PyQt6.QtWidgets")
+    return widgets.QApplication.instance() or widgets.QApplication([])
@@ -0,0 +1,75 @@
+"""
+AudioService on the SDL dummy driver: channel pool, stale handles, stealing
+"""
+
+import os
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.services.audio_service import AudioService
+
+CHANNELS = 3
+
+
+@pytest.fixture
+def audio():
+    AudioService._instance = None
+    service = AudioService()
+    service._setup(channels=CHANNELS)
+    if service.ensure_ready() is None or service.backend.name != "pygame":
+        pytest.skip("pygame mixer unavailable")
+    yield service
+    pygame.mixer.quit()
+    AudioService._instance = None
+
+
+def test_overlapping_plays_get_their_own_channels(audio):
+    first = audio.play()
+    second = audio.play()
+    assert first[0] != second[0]
+    busy = [channel.get_busy() for channel in audio.backend.channels]
+    assert busy[first[0]] and busy[second[0]]
+    
+    audio.stop(first)
+    assert not audio.backend.channels[first[0]].get_busy()
+    assert audio.backend.channels[second[0]].get_busy()
+
+
+def test_stale_handle_leaves_a_reused_channel_alone(audio):
+    stale = audio.play()
+    audio.stop(stale)
+    reused = audio.play()
+    assert reused[0] == stale[0]
+    
+    audio.stop(stale)
+    assert audio.backend.channels[reused[0]].get_busy()
+    audio.stop(reused)
+    assert not audio.backend.channels[reused[0]].get_busy()
+
+
+def test_full_pool_steals_the_oldest_channel(audio):
+    handles = [audio.play() for _ in range(CHANNELS)]
+    stolen = audio.play()
+    assert stolen[0] == handles[0][0]
+    assert audio.backend.steals == 1
+    
+    # The first play no longer owns its channel
+    audio.stop(handles[0])
+    assert audio.backend.channels[stolen[0]].get_busy()
+
+
+def test_latency_stats(audio):
+    for _ in range(CHANNELS + 1):
+        audio.play()
+    stats = audio.latency_stats()
+    assert stats["backend"] == "pygame"
+    assert stats["plays"] == CHANNELS + 1
+    assert stats["steals"] == 1 and stats["max_overlap"] == CHANNELS
+    assert stats["load_ms"] > 0
+    assert 0 <= stats["avg_play_ms"] <= stats["max_play_ms"]
+    assert stats["last_play_ms"] <= stats["max_play_ms"]
+    assert "total_play_ms" not in stats
@@ -0,0 +1,57 @@
+"""
+Engine start-up: sink loading and the day rollover after load()
+"""
+
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.core.clock import FakeClock
+from src.core.engine import ReminderEngine
+from src.core.sinks import ConsoleSink, JsonSink, load_sink
+from src.models.reminder import Reminder
+
+
+class DuckSink:
+    """Not a NotificationSink subclass, only has notify()"""
+    
+    def notify(self, notification):
+        pass
+
+
+def test_load_sink_by_name_and_path():
+    assert isinstance(load_sink("json"), JsonSink)
+    assert isinstance(load_sink("src.core.sinks:ConsoleSink"), ConsoleSink)
+    assert isinstance(load_sink(f"{__name__}:DuckSink"), DuckSink)
+
+
+@pytest.mark.parametrize("spec", ["builtins:object", "math:pi"])
+def test_load_sink_rejects_what_is_not_a_sink(spec):
+    with pytest.raises(TypeError, match="notify|not callable"):
+        load_sink(spec)
+
+
+def test_rollover_starts_from_the_date_of_load(tmp_path, make_service):
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    reminder = Reminder(9 * 60, "daily", completed=True)
+    with open(tmp_path / "reminders.json", 'w', encoding='utf-8') as f:
+        json.dump({"last_saved": yesterday.isoformat(), "reminders": [reminder.to_dict()]}, f)
+    
+    # Created just before midnight, loaded just after it
+    clock = FakeClock(datetime.combine(yesterday, datetime.min.time()).replace(hour=23, minute=59))
+    storage = make_service()
+    engine = ReminderEngine(ConsoleSink(), clock=clock, storage=storage)
+    clock.advance(120)
+    engine.load()
+    loaded = engine.index.get(reminder.id)
+    assert not loaded.completed  # Reset by the load, a new day has started
+    
+    loaded.completed = True
+    engine.status_changed(loaded)
+    clock.advance(60)
+    engine.tick()
+    # No second reset for the same midnight
+    assert loaded.completed and engine.rollover.rollovers == 0
+    engine.shutdown()
@@ -0,0 +1,46 @@
+"""
+Flip clock power mode: no timer wakeups while the window is minimized
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from src.ui.widgets.flip_clock import FlipClock
+
+
+@pytest.fixture
+def clock(qapp):
+    clock = FlipClock()
+    clock.show()
+    yield clock
+    clock.close()
+    qapp.processEvents()
+
+
+def run_for(ms):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_minimized_clock_does_not_wake_up(clock):
+    run_for(600)
+    assert clock.driver.mode == "active"
+    assert clock.driver.mode_wakeups["active"] > 0
+    
+    clock.showMinimized()
+    run_for(1200)
+    assert clock.driver.mode == "idle"
+    assert not clock.driver.timer.isActive()
+    report = clock.driver.wakeup_report()
+    assert report["idle"]["wakeups"] == 0 and report["idle"]["seconds"] > 1.0
+    
+    clock.showNormal()
+    run_for(100)
+    assert clock.driver.mode == "active" and clock.driver.timer.isActive()
@@ -0,0 +1,34 @@
+"""
+Command line: the storage backend option and --simulate
+"""
+
+import json
+
+import pytest
+
+import main
+from src.services.storage_service import BACKENDS
+
+
+def test_storage_choices_match_the_service():
+    assert main.STORAGE_BACKENDS == BACKENDS
+
+
+def test_storage_option():
+    assert main.parse_args([]).storage == "json"
+    assert main.parse_args(["--headless", "--storage", "sqlite"]).storage == "sqlite"
+    with pytest.raises(SystemExit):
+        main.parse_args(["--storage", "csv"])
+
+
+def test_simulate_leaves_the_data_directory_alone(tmp_path, monkeypatch):
+    reminders = {"reminders": [{"id": "a", "time": "09:00", "content": "stand up"}],
+                 "last_saved": "2026-01-01"}
+    (tmp_path / "reminders.json").write_text(json.dumps(reminders), encoding="utf-8")
+    monkeypatch.setattr(main, "DATA_DIR", str(tmp_path))
+    
+    args = main.parse_args(["--simulate", "1", "--storage", "sqlite", "--sink", "json"])
+    assert main.run_headless(args) == 0
+    # No reminders.db from the JSON import, and the JSON file is as it was
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["reminders.json"]
+    assert json.loads((tmp_path / "reminders.json").read_text(encoding="utf-8")) == reminders
@@ -0,0 +1,124 @@
+"""
+Notification pool soak test and grouping of reminders queued together
+"""
+
+import os
+import random
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication
+from src.services.notification_service import NotificationDialog, NotificationService
+
+CYCLES = 3000
+WARMUP = 200  # Cycles before the memory baseline, so caches are already filled
+MAX_GROWTH = 512 * 1024  # bytes
+
+
+@pytest.fixture
+def service(qapp, monkeypatch):
+    # No sound: the soak is about dialogs, not the mixer. The application
+    # is the session's, since pooled dialogs outlive a single test
+    monkeypatch.setattr(NotificationDialog, "init_sound", lambda self: None)
+    service = NotificationService()
+    yield service
+    service.close_all()
+    settle(qapp)
+
+
+def settle(app):
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def live_dialogs(app):
+    return sum(1 for w in app.topLevelWidgets() if isinstance(w, NotificationDialog))
+
+
+def test_show_close_cycles_stay_bounded(service):
+    app = QApplication.instance()
+    rng = random.Random(16)
+    limit = service.MAX_ACTIVE + service.MAX_IDLE
+    
+    def cycle(i):
+        # Sometimes more than fit on screen, so the oldest gets recycled
+        for n in range(rng.randint(1, service.MAX_ACTIVE + 3)):
+            service.show_notification(f"{i % 24:02d}:{n:02d}", f"reminder {i}.{n}",
+                                      reminder_ids=[f"id-{i}-{n}"])
+        assert len(service.active_notifications) <= service.MAX_ACTIVE
+        # Close some one by one, the rest together
+        for dialog in list(service.active_notifications):
+            if rng.random() < 0.5:
+                dialog.close_notification()
+        service.close_all()
+        settle(app)
+        assert live_dialogs(app) <= limit
+    
+    for i in range(WARMUP):
+        cycle(i)
+    created = service.dialogs_created
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for i in range(WARMUP, CYCLES):
+            cycle(i)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    # The pool is reused: no dialogs are built once it has warmed up
+    assert service.dialogs_created == created
+    assert len(service.idle_dialogs) <= service.MAX_IDLE
+    assert live_dialogs(app) <= limit
+    assert current - baseline < MAX_GROWTH
+
+
+@pytest.fixture
+def sounds(service, monkeypatch):
+    """Sounds actually played; the rate limit starts fresh"""
+    played = []
+    monkeypatch.setattr(NotificationDialog, "init_sound", lambda self: played.append(self))
+    service._last_sound_at = None
+    return played
+
+
+def test_reminders_due_together_share_one_dialog_and_sound(qapp, service, sounds):
+    for i in range(50):
+        service.queue_notification("09:00 AM", f"reminder {i}", reminder_id=f"id-{i}")
+    assert not service.active_notifications  # Nothing is shown inline
+    
+    settle(qapp)
+    assert len(service.active_notifications) == 1
+    dialog = service.active_notifications[0]
+    assert dialog.reminder_ids == [f"id-{i}" for i in range(50)]
+    assert dialog.message_text == "reminder 0 · reminder 1 · +48 more"
+    assert sounds == [dialog]
+
+
+def test_one_dialog_per_event_loop_pass_and_rate_limited_sound(qapp, service, sounds):
+    for hour in range(3):
+        service.queue_notification(f"{hour:02d}:00 AM", f"reminder {hour}")
+    
+    service._drain()
+    assert len(service.active_notifications) == 1
+    settle(qapp)
+    settle(qapp)
+    assert len(service.active_notifications) == 3
+    # The later dialogs came within SOUND_MIN_INTERVAL of the first
+    assert len(sounds) == 1
+
+
+def test_snooze_uses_the_snooze_service_default(service):
+    requests = []
+    service.snooze_handler = lambda ids, minutes: requests.append((ids, minutes))
+    service.show_notification("09:00 AM", "stand up", reminder_ids=["id-1"])
+    service.active_notifications[0].snooze()
+    # None: SnoozeService.snooze falls back to its DEFAULT_MINUTES
+    assert requests == [(["id-1"], None)]
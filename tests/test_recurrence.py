@@ -0,0 +1,146 @@
+"""
+Recurrence across DST changes: seeded random property tests
+"""
+
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.core.clock import FakeClock
+from src.core.scheduler import Scheduler
+from src.models.recurrence import Recurrence
+from src.models.reminder import Reminder, MINUTES_PER_DAY
+from src.models.reminder_index import ReminderIndex
+
+CASES = 300
+# Zone -> (spring-forward day, fall-back day) in 2026
+ZONES = {
+    "America/New_York": (date(2026, 3, 8), date(2026, 11, 1)),
+    "Europe/Berlin": (date(2026, 3, 29), date(2026, 10, 25)),
+}
+
+
+@pytest.fixture(params=sorted(ZONES))
+def zone(request, monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset")
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield ZONES[request.param]
+    monkeypatch.undo()
+    time.tzset()
+
+
+def around(day: date, rng: random.Random) -> datetime:
+    """A random local instant within a day of midnight starting day, fold included"""
+    start = datetime.combine(day, datetime.min.time()).timestamp()
+    return datetime.fromtimestamp(start + rng.uniform(-86400, 2 * 86400))
+
+
+def random_hourly(day: date, rng: random.Random) -> Recurrence:
+    weekdays = rng.sample(range(7), rng.randint(1, 3)) if rng.random() < 0.3 else ()
+    return Recurrence(Recurrence.HOURLY, rng.randint(1, 5), weekdays,
+                      start=day - timedelta(days=rng.randint(0, 10)))
+
+
+def expected_hourly(rule: Recurrence, minute: int, after: datetime) -> datetime:
+    """Brute force: every real-time step from the anchor until one qualifies"""
+    anchor = datetime.combine(rule.start, datetime.min.time()) + timedelta(minutes=minute)
+    ts = anchor.timestamp()
+    while True:
+        occurrence = datetime.fromtimestamp(ts)
+        if ts > after.timestamp() and (not rule.weekdays or occurrence.weekday() in rule.weekdays):
+            return occurrence
+        ts += rule.interval * 3600
+
+
+@pytest.mark.parametrize("edge", [0, 1], ids=["spring-forward", "fall-back"])
+def test_hourly_steps_in_real_time(zone, edge):
+    rng = random.Random(22 + edge)
+    day = zone[edge]
+    for _ in range(CASES):
+        rule = random_hourly(day, rng)
+        minute = rng.randrange(MINUTES_PER_DAY)
+        after = around(day, rng)
+        occurrence = rule.next_after(minute, after)
+        expected = expected_hourly(rule, minute, after)
+        assert occurrence.timestamp() == expected.timestamp(), (rule, minute, after)
+        assert occurrence.fold == expected.fold
+
+
+def test_fall_back_hour_occurs_twice(zone):
+    day = zone[1]
+    rule = Recurrence(Recurrence.HOURLY, start=day - timedelta(days=1))
+    occurrence = datetime.combine(day, datetime.min.time())
+    seen = []
+    while occurrence.date() == day:
+        seen.append(occurrence)
+        occurrence = rule.next_after(0, occurrence)
+    # 25 hours in the day, each one real hour after the last
+    assert len(seen) == 25
+    assert all(b.timestamp() - a.timestamp() == 3600 for a, b in zip(seen, seen[1:]))
+    repeated = [t for t in seen if t.fold]
+    assert len(repeated) == 1
+    assert sum(1 for t in seen if t.hour == repeated[0].hour) == 2
+
+
+def test_spring_forward_day_has_no_skipped_or_extra_hours(zone):
+    day = zone[0]
+    rule = Recurrence(Recurrence.HOURLY, start=day - timedelta(days=1))
+    occurrence = datetime.combine(day, datetime.min.time())
+    seen = []
+    while occurrence.date() == day:
+        seen.append(occurrence)
+        occurrence = rule.next_after(0, occurrence)
+    assert len(seen) == 23
+    assert all(b.timestamp() - a.timestamp() == 3600 for a, b in zip(seen, seen[1:]))
+
+
+@pytest.mark.parametrize("edge", [0, 1], ids=["spring-forward", "fall-back"])
+def test_byday_keeps_wall_clock_time(zone, edge):
+    rng = random.Random(122 + edge)
+    day = zone[edge]
+    for _ in range(CASES):
+        weekdays = set(rng.sample(range(7), rng.randint(1, 4)))
+        rule = Recurrence(Recurrence.WEEKLY, 1, weekdays, start=day - timedelta(days=14))
+        minute = rng.randrange(MINUTES_PER_DAY)
+        after = around(day, rng).replace(fold=0)
+        occurrence = rule.next_after(minute, after)
+        # Brute force: the first matching day whose wall-clock time is still ahead
+        candidate = after.date()
+        while True:
+            expected = datetime.combine(candidate, datetime.min.time()) + timedelta(minutes=minute)
+            if candidate.weekday() in weekdays and expected > after:
+                break
+            candidate += timedelta(days=1)
+        assert occurrence == expected, (rule, minute, after)
+
+
+def test_scheduler_fires_each_hour_once_through_fall_back(zone):
+    day = zone[1]
+    clock = FakeClock(datetime.combine(day, datetime.min.time()))
+    reminder = Reminder(0, "hourly", recurrence=Recurrence(Recurrence.HOURLY,
+                                                          start=day - timedelta(days=1)))
+    scheduler = Scheduler(ReminderIndex([reminder]), clock)
+    fired = []
+    scheduler.on_fired = lambda due, missed: fired.extend(at for _, at in due + missed)
+    scheduler.schedule(reminder)
+    for _ in range(4 * 60):
+        scheduler.check_clock()
+        clock.advance(60)
+    # The fake wall clock never goes back, so the repeated hour stands in for nothing
+    assert [(t.hour, t.minute) for t in fired] == [(h, 0) for h in range(4)]
+
+
+def test_editing_time_or_rule_drops_the_cached_occurrence():
+    after = datetime(2026, 6, 1, 8, 0)
+    reminder = Reminder(9 * 60, "stand up", recurrence=Recurrence.parse("FREQ=DAILY"))
+    assert reminder.next_occurrence(after) == datetime(2026, 6, 1, 9, 0)
+    
+    reminder.minute_of_day = 10 * 60
+    assert reminder.next_occurrence(after) == datetime(2026, 6, 1, 10, 0)
+    
+    reminder.recurrence = Recurrence.parse("FREQ=WEEKLY;BYDAY=WE")
+    assert reminder.next_occurrence(after) == datetime(2026, 6, 3, 10, 0)
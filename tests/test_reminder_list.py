@@ -0,0 +1,85 @@
+"""
+Reminder list model: each edit touches only its own rows, never a reset
+"""
+
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from src.core.clock import FakeClock
+from src.core.engine import ReminderEngine
+from src.models.reminder import Reminder
+from src.ui.widgets.reminder_list import ReminderListModel
+
+
+def record_signals(model):
+    """Qt's own view of what changed, next to the model's op_counts"""
+    signals = {"reset": [], "inserted": [], "removed": [], "changed": []}
+    model.modelReset.connect(lambda: signals["reset"].append(True))
+    model.rowsInserted.connect(lambda parent, first, last: signals["inserted"].append((first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: signals["removed"].append((first, last)))
+    model.dataChanged.connect(lambda top, bottom: signals["changed"].append((top.row(), bottom.row())))
+    return signals
+
+
+@pytest.fixture
+def model(qapp, recording_sink):
+    clock = FakeClock(datetime(2026, 3, 10, 20, 0))
+    engine = ReminderEngine(recording_sink, clock=clock)
+    for i in range(20):
+        engine.add(Reminder(7 * 60 + 37 * i, f"reminder {i}"))
+    model = ReminderListModel()
+    model.set_reminders(list(engine.index))
+    engine.on_reminders_changed = model.reminders_changed
+    model.engine, model.clock = engine, clock
+    model.signals = record_signals(model)
+    model.op_counts = dict.fromkeys(model.op_counts, 0)
+    return model
+
+
+def test_insert_touches_one_row(model):
+    reminder = Reminder(12 * 60 + 1, "new")
+    row = model.insert_reminder(reminder)
+    assert model.reminder_at(row) is reminder
+    assert model.signals["inserted"] == [(row, row)]
+    assert model.op_counts == {"reset": 0, "inserted": 1, "removed": 0, "changed": 0}
+    assert not model.signals["reset"]
+
+
+def test_remove_touches_one_row(model):
+    reminder = model.reminder_at(5)
+    assert model.remove_reminder(reminder)
+    assert model.signals["removed"] == [(5, 5)]
+    assert model.row_of(reminder) == -1
+    assert model.op_counts == {"reset": 0, "inserted": 0, "removed": 1, "changed": 0}
+    assert not model.signals["reset"]
+
+
+def test_toggle_repaints_one_row(model):
+    reminder = model.reminder_at(3)
+    reminder.completed = True
+    model.reminder_changed(reminder)
+    assert model.signals["changed"] == [(3, 3)]
+    assert model.op_counts == {"reset": 0, "inserted": 0, "removed": 0, "changed": 1}
+    assert not model.signals["reset"]
+
+
+def test_rollover_repaints_only_the_reset_rows(model):
+    rows = [2, 6, 9]
+    for row in rows:
+        reminder = model.reminder_at(row)
+        reminder.completed = True
+        model.engine.status_changed(reminder)
+    
+    model.clock.advance(timedelta(hours=5))
+    model.engine.tick()
+    assert model.engine.rollover.rollovers == 1
+    # One dataChanged spanning the reset rows
+    assert model.signals["changed"] == [(min(rows), max(rows))]
+    assert model.op_counts == {"reset": 0, "inserted": 0, "removed": 0, "changed": len(rows)}
+    assert not model.signals["reset"]
@@ -0,0 +1,86 @@
+"""
+Reminder table and binary format: any reminder id survives packing
+"""
+
+import io
+import struct
+
+import pytest
+
+from src.models import reminder_codec
+from src.models.reminder import Reminder
+from src.models.reminder_codec import encode_records, write_binary, read_binary_header, \
+    iter_binary_blocks, table_to_records
+from src.models.reminder_table import ReminderTable
+
+ODD_IDS = [
+    "work-1",
+    "é-ünicode-id",
+    "0F8FAD5B-D9CB-469F-A165-70867728950E",  # A UUID, but not as Reminder writes it
+    "0f8fad5bd9cb469fa16570867728950e",
+    "x" * 36,
+]
+
+
+def sample_reminders():
+    reminders = [Reminder((600 - 7 * i) % 1440, f"reminder {i}") for i in range(20)]
+    for i, reminder_id in enumerate(ODD_IDS):
+        reminders[3 * i + 1].id = reminder_id
+    return reminders
+
+
+def read_back(data: bytes):
+    f = io.BytesIO(data)
+    last_saved, version = read_binary_header(f)
+    records = []
+    for table in iter_binary_blocks(f, version):
+        records.extend(table_to_records(table))
+    return records, last_saved
+
+
+@pytest.mark.parametrize("reminder_id", ODD_IDS)
+def test_pack_id_only_packs_canonical_uuids(reminder_id):
+    assert ReminderTable.pack_id(reminder_id) is None
+    canonical = Reminder(0, "x").id
+    assert ReminderTable.pack_id(canonical).hex() == canonical.replace("-", "")
+
+
+def test_table_keeps_ids_that_are_not_uuids():
+    reminders = sample_reminders()
+    table = ReminderTable(reminders)
+    assert table.to_reminders() == reminders
+    table.sort_by_time()
+    assert table.to_reminders() == sorted(reminders, key=lambda r: r.minute_of_day)
+
+
+@pytest.mark.parametrize("block_rows", [3, 4096])
+def test_binary_round_trip_keeps_ids_that_are_not_uuids(block_rows):
+    records = encode_records(sample_reminders())
+    f = io.BytesIO()
+    write_binary(f, records, "2026-10-16", block_rows=block_rows)
+    assert read_back(f.getvalue()) == (records, "2026-10-16")
+
+
+def test_version_2_files_still_load():
+    records = encode_records([Reminder(60 * i, f"reminder {i}") for i in range(5)])
+    f = io.BytesIO()
+    write_binary(f, records, None)
+    data = bytearray(f.getvalue())
+    # Turn the single block back into version 2: drop the text id lengths
+    header = reminder_codec._FILE_HEADER.size
+    rows, _ = reminder_codec._BLOCK_HEADER.unpack_from(data, header)
+    start = header + reminder_codec._BLOCK_HEADER.size + (2 + 1 + 16 + 4 + 4) * rows
+    del data[start:start + 4 * rows]
+    struct.pack_into("<B", data, 4, 2)
+    assert read_back(bytes(data)) == (records, None)
+
+
+def test_binary_backend_saves_ids_that_are_not_uuids(make_service):
+    reminders = sample_reminders()
+    service = make_service("binary")
+    assert service.save_reminders(reminders)
+    service.close()
+    service = make_service("binary")
+    loaded, _ = service.load_reminders()
+    service.close()
+    assert sorted(loaded, key=lambda r: r.id) == sorted(reminders, key=lambda r: r.id)
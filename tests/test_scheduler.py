@@ -0,0 +1,109 @@
+"""
+Scheduler catch-up across a suspend, driven the way each host drives it
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.clock import FakeClock
+from src.core.engine import ReminderEngine
+from src.models.reminder import Reminder
+
+
+def run(drive, sink):
+    clock = FakeClock(datetime(2026, 3, 10, 20, 0))
+    engine = ReminderEngine(sink, clock=clock)
+    morning = Reminder(8 * 60, "morning")
+    evening = Reminder(22 * 60, "evening")
+    late = Reminder(23 * 60, "late")
+    for reminder in (morning, evening, late):
+        engine.add(reminder)
+    
+    clock.advance(timedelta(hours=1))
+    for reminder in (morning, late):
+        reminder.completed = True
+        engine.status_changed(reminder)
+    
+    # Suspended at 21:00, woken at 09:00 the next day
+    clock.jump(timedelta(hours=12))
+    drive(engine)
+    return engine, morning, evening
+
+
+@pytest.mark.parametrize("drive", [
+    lambda engine: engine.tick(),  # HeadlessRunner
+    lambda engine: engine.scheduler.check_clock(),  # SchedulerService watchdog
+], ids=["headless", "qt"])
+def test_suspend_across_midnight_reports_both_days(drive, recording_sink):
+    sink = recording_sink
+    engine, morning, evening = run(drive, sink)
+    
+    # Yesterday's evening reminder was missed, and so was this morning's,
+    # which the rollover reset; the late one was done before its time
+    assert len(sink.notifications) == 1
+    notification = sink.notifications[0]
+    assert notification.missed and notification.title == "2 missed"
+    assert {r.id for r in notification.reminders} == {morning.id, evening.id}
+    assert engine.rollover.rollovers == 1
+    
+    # Nothing fires again until the evening reminder comes round today
+    assert engine.scheduler.next_due() == datetime(2026, 3, 11, 22, 0)
+
+
+def test_midnight_without_a_jump_rolls_over_before_firing(recording_sink):
+    clock = FakeClock(datetime(2026, 3, 10, 23, 59, 30))
+    sink = recording_sink
+    engine = ReminderEngine(sink, clock=clock)
+    reminder = Reminder(0, "midnight", completed=True)
+    engine.add(reminder)
+    
+    clock.advance(45)
+    engine.scheduler.check_clock()
+    assert [n.reminders for n in sink.notifications] == [[reminder]]
+    assert engine.rollover.rollovers == 1
+
+
+def test_reminder_added_in_a_minute_that_already_fired(recording_sink):
+    clock = FakeClock(datetime(2026, 3, 10, 9, 59, 50))
+    sink = recording_sink
+    engine = ReminderEngine(sink, clock=clock)
+    first = Reminder(10 * 60, "first")
+    engine.add(first)
+    
+    clock.advance(10)
+    engine.scheduler.timer_fired()
+    assert engine.scheduler.next_due() == datetime(2026, 3, 11, 10, 0)
+    
+    # Added half a minute after its slot fired and was re-armed for tomorrow
+    clock.advance(30)
+    second = Reminder(10 * 60, "second")
+    engine.add(second)
+    assert engine.scheduler.next_due() == datetime(2026, 3, 10, 10, 0)
+    engine.scheduler.timer_fired()
+    
+    # The first reminder is not shown twice
+    assert [n.reminders for n in sink.notifications] == [[first], [second]]
+    assert engine.scheduler.next_due() == datetime(2026, 3, 11, 10, 0)
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_time_zone_change_is_seen_as_a_clock_jump(monkeypatch, recording_sink):
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    try:
+        engine = ReminderEngine(recording_sink)
+        rearmed = []
+        engine.rollover.on_rearm = rearmed.append
+        before = engine.scheduler.last_processed
+        
+        # Fourteen hours east: local midnight moves, the process is not told
+        monkeypatch.setenv("TZ", "Etc/GMT-14")
+        engine.tick()
+        
+        assert engine.scheduler.last_processed - before > timedelta(hours=13)
+        assert rearmed and rearmed[-1] == engine.rollover.next_rollover()
+    finally:
+        monkeypatch.undo()
+        time.tzset()
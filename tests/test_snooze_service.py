@@ -0,0 +1,63 @@
+"""
+Snoozes survive a restart, can be cancelled, and bad records are skipped
+"""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from src.services.snooze_service import SnoozeService
+
+
+@pytest.fixture
+def storage(qapp, make_service):
+    # Timers only run with a live application
+    storage = make_service()
+    yield storage
+    storage.close()
+
+
+def test_snoozes_survive_a_reload(storage):
+    service = SnoozeService(storage)
+    service.snooze(["a", "b"], minutes=10)
+    service.snooze(["b"], minutes=20)  # Replaces the pending one
+    
+    restored = SnoozeService(storage)
+    restored.load()
+    assert restored.pending() == pytest.approx(service.pending())
+    assert restored.pending()["b"] - restored.pending()["a"] == pytest.approx(600, abs=1)
+    assert restored.timer.isActive()
+
+
+def test_cancel_drops_the_saved_snooze(storage):
+    service = SnoozeService(storage)
+    service.snooze(["a"], minutes=10)
+    service.cancel("a")
+    assert service.pending() == {} and not service.timer.isActive()
+    
+    restored = SnoozeService(storage)
+    restored.load()
+    assert restored.pending() == {}
+
+
+def test_malformed_records_are_skipped(storage):
+    due = time.time() + 600
+    with open(storage.snooze_path, 'w', encoding='utf-8') as f:
+        json.dump({"snoozes": [{"id": "x"}, {"due": due}, {"id": "y", "due": "soon"},
+                               "z", {"id": "ok", "due": due}]}, f)
+    service = SnoozeService(storage)
+    service.load()
+    assert service.pending() == {"ok": due}
+
+
+def test_overdue_snooze_fires_after_load(storage):
+    storage.save_snoozes([{"id": "late", "due": time.time() - 60}])
+    service = SnoozeService(storage)
+    fired = []
+    service.snooze_due.connect(fired.append)
+    service.load()
+    service.timer.timeout.emit()
+    assert fired == ["late"] and service.pending() == {}
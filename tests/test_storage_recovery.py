@@ -0,0 +1,273 @@
+"""
+Storage recovery: torn writes, truncated files and bad records never lose data
+"""
+
+import json
+import os
+import random
+from datetime import date
+
+import pytest
+
+from src.models.reminder import Reminder
+from src.services import storage_backends
+
+OFFSETS = 40  # Random cut points per case
+
+
+def sample_reminders(count=25):
+    return [Reminder((7 * 60 + 13 * i) % 1440, f"reminder {i} é", completed=i % 4 == 0,
+                     repeat_daily=i % 3 != 0)
+            for i in range(count)]
+
+
+def snapshot(reminders):
+    return sorted((r.id, r.minute_of_day, r.content, r.completed, r.repeat_daily)
+                  for r in reminders)
+
+
+def load(make_service, backend="json"):
+    service = make_service(backend)
+    reminders, _ = service.load_reminders()
+    return service, reminders
+
+
+def data_file(service):
+    return getattr(service.backend, "filepath", service.filepath)
+
+
+@pytest.mark.parametrize("backend", ["json", "binary"])
+def test_truncated_live_file_recovers_from_backup(tmp_path, make_service, backend):
+    rng = random.Random(6)
+    reminders = sample_reminders()
+    expected = snapshot(reminders)
+    for _ in range(OFFSETS):
+        for name in os.listdir(tmp_path):
+            os.remove(tmp_path / name)
+        service = make_service(backend)
+        # Twice, so the backup holds the same document as the live file
+        service.save_reminders(reminders)
+        service.save_reminders(reminders)
+        service.close()
+        path = data_file(service)
+        with open(path, 'r+b') as f:
+            f.truncate(rng.randrange(os.path.getsize(path)))
+        
+        service, loaded = load(make_service, backend)
+        assert snapshot(loaded) == expected
+        assert not service.read_only
+        
+        # The next save starts from the recovered data, not from nothing
+        extra = Reminder(23 * 60, "after recovery")
+        service.mark_dirty(extra)
+        service.close()
+        _, reloaded = load(make_service, backend)
+        assert snapshot(reloaded) == sorted(expected + snapshot([extra]))
+
+
+def test_write_killed_at_random_offset_keeps_previous_document(tmp_path, make_service, monkeypatch):
+    rng = random.Random(7)
+    before = sample_reminders()
+    service = make_service()
+    service.save_reminders(before)
+    service.close()
+    real_dump = storage_backends.dump_json
+    
+    for _ in range(OFFSETS):
+        class Killed(Exception):
+            pass
+        
+        def torn_dump(f, records, last_saved):
+            # Write a prefix of the new document, then die mid-write
+            text = json.dumps({"last_saved": last_saved, "reminders": records})
+            f.write(text[:rng.randrange(len(text))])
+            raise Killed()
+        
+        monkeypatch.setattr(storage_backends, "dump_json", torn_dump)
+        service = make_service()
+        assert not service.save_reminders(sample_reminders(40))
+        service.read_only = True  # The process "died": nothing else gets written
+        monkeypatch.setattr(storage_backends, "dump_json", real_dump)
+        
+        _, loaded = load(make_service)
+        assert snapshot(loaded) == snapshot(before)
+
+
+def test_journal_torn_at_random_offset_keeps_complete_entries(tmp_path, make_service):
+    rng = random.Random(8)
+    base = sample_reminders(10)
+    changes = [Reminder(600 + i, f"change {i}") for i in range(15)]
+    for _ in range(OFFSETS):
+        for name in os.listdir(tmp_path):
+            os.remove(tmp_path / name)
+        service = make_service("journal")
+        service.save_reminders(base)
+        for change in changes:
+            service.mark_dirty(change)
+            service.flush()
+        service.close()
+        
+        journal = service.backend.journal_path
+        with open(journal, 'rb') as f:
+            lines = f.readlines()
+        cut = rng.randrange(os.path.getsize(journal))
+        with open(journal, 'r+b') as f:
+            f.truncate(cut)
+        # Every change whose line was fully written before the cut survives
+        complete = sum(1 for end in _line_ends(lines) if end <= cut)
+        
+        _, loaded = load(make_service, "journal")
+        assert snapshot(loaded) == snapshot(base + changes[:complete])
+
+
+def test_failed_journal_append_is_retried_on_a_clean_line(tmp_path, make_service, monkeypatch):
+    service = make_service("journal")
+    service.save_reminders([Reminder(8 * 60, "base")])
+    service.mark_dirty(Reminder(9 * 60, "a"))
+    assert service.flush()
+    
+    class HalfWrite:
+        """Writes half of what it is given, then fails like a full disk"""
+        def __init__(self, f):
+            self.f = f
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc):
+            self.f.close()
+        
+        def write(self, data):
+            self.f.write(data[:len(data) // 2])
+            self.f.flush()
+            raise OSError("No space left on device")
+    
+    def appending_open(path, mode='r', *args, **kwargs):
+        f = open(path, mode, *args, **kwargs)
+        return HalfWrite(f) if mode == 'ab' else f
+    
+    monkeypatch.setattr(storage_backends, "open", appending_open, raising=False)
+    service.mark_dirty(Reminder(10 * 60, "b"))
+    assert not service.flush()
+    monkeypatch.undo()
+    
+    assert service.flush()
+    service.mark_dirty(Reminder(11 * 60, "c"))
+    assert service.flush()
+    service.close()
+    _, loaded = load(make_service, "journal")
+    assert sorted(r.content for r in loaded) == ["a", "b", "base", "c"]
+
+
+def test_bad_journal_line_is_skipped(tmp_path, make_service):
+    service = make_service("journal")
+    service.save_reminders([Reminder(8 * 60, "base")])
+    service.mark_dirty(Reminder(9 * 60, "a"))
+    service.flush()
+    with open(service.backend.journal_path, 'ab') as f:
+        f.write(b'{"op": "put", "rec\n')
+    service.mark_dirty(Reminder(10 * 60, "b"))
+    service.close()
+    
+    _, loaded = load(make_service, "journal")
+    assert sorted(r.content for r in loaded) == ["a", "b", "base"]
+
+
+def _line_ends(lines):
+    end = 0
+    for line in lines:
+        end += len(line)
+        yield end
+
+
+def test_single_bad_record_does_not_cost_the_others(tmp_path, make_service):
+    good = sample_reminders(5)
+    records = [r.to_dict() for r in good]
+    bad = [
+        {"id": "bad-time", "time": "24:00", "content": "bad time"},
+        {"id": "bad-rule", "time": "09:00", "content": "bad rule", "rrule": "FREQ=MONTHLY"},
+        {"id": "bad-day", "time": "09:00", "content": "bad day",
+         "rrule": "FREQ=WEEKLY;BYDAY=XX"},
+        "not a record",
+    ]
+    with open(tmp_path / "reminders.json", 'w', encoding='utf-8') as f:
+        json.dump({"last_saved": date.today().isoformat(), "reminders": records[:2] + bad + records[2:]}, f)
+    
+    service, loaded = load(make_service)
+    assert snapshot(loaded) == snapshot(good)
+    # Two rounds of write-behind saves must not lose the rejected records
+    for content in ("first", "second"):
+        service.mark_dirty(Reminder(12 * 60, content))
+        service.flush()
+    service.close()
+    
+    with open(service.rejected_path, encoding='utf-8') as f:
+        rejected = [json.loads(line) for line in f]
+    assert _canonical(rejected) == _canonical(bad)
+    _, reloaded = load(make_service)
+    assert {r.content for r in reloaded} == {r.content for r in good} | {"first", "second"}
+
+
+def _canonical(records):
+    return sorted(json.dumps(r, sort_keys=True) for r in records)
+
+
+def test_bad_records_are_quarantined_once(tmp_path, make_service):
+    with open(tmp_path / "reminders.json", 'w', encoding='utf-8') as f:
+        json.dump({"reminders": [{"id": "x", "time": "99:99", "content": "x"}]}, f)
+    for _ in range(3):
+        service, _ = load(make_service)
+        service.close()
+    with open(service.rejected_path, encoding='utf-8') as f:
+        assert len(f.readlines()) == 1
+
+
+@pytest.mark.parametrize("damage", [b'{"reminders": [', b'{"reminders": 5}', b'[]'])
+def test_unrecoverable_file_is_left_untouched(tmp_path, make_service, damage):
+    path = tmp_path / "reminders.json"
+    path.write_bytes(damage)
+    service, loaded = load(make_service)
+    assert loaded == [] and service.read_only
+    assert service.has_saved_data()  # So the app does not seed defaults over it
+    
+    service.mark_dirty(Reminder(8 * 60, "new"))
+    assert not service.save_reminders([Reminder(9 * 60, "other")])
+    service.close()
+    assert path.read_bytes() == damage
+
+
+def test_wrong_shape_falls_back_to_backup(tmp_path, make_service):
+    reminders = sample_reminders()
+    service = make_service()
+    service.save_reminders(reminders)
+    service.save_reminders(reminders)
+    service.close()
+    (tmp_path / "reminders.json").write_text('{"reminders": {"oops": 1}}')
+    service, loaded = load(make_service)
+    assert snapshot(loaded) == snapshot(reminders) and not service.read_only
+
+
+def test_sqlite_imports_json_only_into_an_unused_database(tmp_path, make_service):
+    service = make_service("sqlite")
+    service.save_reminders([Reminder(8 * 60, "only in sqlite")])
+    service.close()
+    # A run with the json backend writes its own file next to the database
+    service = make_service("json")
+    service.save_reminders([Reminder(9 * 60, "json default")])
+    service.close()
+    
+    _, loaded = load(make_service, "sqlite")
+    assert [r.content for r in loaded] == ["only in sqlite"]
+
+
+def test_sqlite_imports_json_on_first_run(tmp_path, make_service):
+    service = make_service("json")
+    service.save_reminders([Reminder(9 * 60, "from json")])
+    service.close()
+    
+    service, loaded = load(make_service, "sqlite")
+    assert [r.content for r in loaded] == ["from json"]
+    service.save_reminders([])
+    service.close()
+    _, reloaded = load(make_service, "sqlite")
+    assert reloaded == []
@@ -0,0 +1,81 @@
+"""
+Write-behind persistence: failed writes keep their changes and are retried
+"""
+
+import json
+import os
+
+from src.models.reminder import Reminder
+
+
+def load_contents(make_service, backend):
+    service = make_service(backend)
+    reminders, _ = service.load_reminders()
+    service.close()
+    return sorted(r.content for r in reminders)
+
+
+def fail_next_write(backend, times=1):
+    """Make the backend's next apply()/write_all() calls raise like a full disk"""
+    failures = {"left": times}
+    for name in ("apply", "write_all"):
+        original = getattr(backend, name)
+        
+        def failing(*args, _original=original, **kwargs):
+            if failures["left"] > 0:
+                failures["left"] -= 1
+                raise OSError("No space left on device")
+            return _original(*args, **kwargs)
+        setattr(backend, name, failing)
+
+
+def test_failed_incremental_write_is_retried(make_service, backend):
+    service = make_service(backend)
+    keep, drop = Reminder(8 * 60, "keep"), Reminder(9 * 60, "drop")
+    service.save_reminders([keep, drop])
+    
+    fail_next_write(service.backend)
+    service.mark_dirty(Reminder(10 * 60, "added"))
+    service.mark_deleted(drop.id)
+    assert not service.flush()
+    assert service.has_pending_changes()
+    
+    assert service.flush()
+    service.close()
+    assert load_contents(make_service, backend) == ["added", "keep"]
+
+
+def test_failed_full_rewrite_is_written_on_close(make_service, backend):
+    service = make_service(backend)
+    fail_next_write(service.backend)
+    assert not service.save_reminders([Reminder(8 * 60, "first")])
+    service.close()
+    assert load_contents(make_service, backend) == ["first"]
+
+
+def test_changes_marked_during_a_failed_write_are_kept(make_service, backend):
+    service = make_service(backend)
+    first = Reminder(8 * 60, "first")
+    service.mark_dirty(first)
+    fail_next_write(service.backend)
+    assert not service.flush()
+    first.content = "edited"
+    service.mark_dirty(first)
+    service.close()
+    assert load_contents(make_service, backend) == ["edited"]
+
+
+def test_side_files_are_written_behind(make_service):
+    service = make_service()
+    service.save_triggers([{"id": "a", "key": 1}])
+    service.save_triggers([{"id": "b", "key": 2}])
+    # Nothing written on the calling thread, but reads see the latest state
+    assert not os.path.exists(service.trigger_path)
+    assert service.has_pending_changes()
+    assert service.load_triggers() == [{"id": "b", "key": 2}]
+    
+    assert service.flush()
+    assert not service.has_pending_changes()
+    with open(service.trigger_path, encoding='utf-8') as f:
+        assert json.load(f) == {"triggers": [{"id": "b", "key": 2}]}
+    service.close()
@@ -0,0 +1,109 @@
+"""
+Trigger log: an occurrence is shown once, across restarts and DST changes
+"""
+
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.core.clock import FakeClock
+from src.core.engine import ReminderEngine
+from src.models.reminder import Reminder
+from src.models.trigger_log import TriggerLog
+
+COUNT = 100_000
+FALL_BACK = date(2026, 11, 1)  # America/New_York repeats 01:00-01:59
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def local(day: date, hour: int, minute: int, fold: int = 0) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, minute, fold=fold)
+
+
+def test_restart_inside_the_minute_does_not_refire(make_service):
+    ids = [f"reminder-{i}" for i in range(COUNT)]
+    occurrence = datetime(2026, 10, 16, 9, 30)
+    log = TriggerLog()
+    assert all(log.mark(rid, occurrence, occurrence + timedelta(seconds=1)) for rid in ids)
+    storage = make_service()
+    assert storage.save_triggers(log.entries())
+    storage.close()
+    
+    # Restarted later in the same minute: nothing fires again
+    restarted = TriggerLog()
+    storage = make_service()
+    restarted.load(storage.load_triggers(), occurrence + timedelta(seconds=40))
+    storage.close()
+    assert len(restarted) == COUNT
+    now = occurrence + timedelta(seconds=45)
+    assert not any(restarted.mark(rid, occurrence, now) for rid in ids)
+    
+    # Restarted once the clock can no longer come back to that minute
+    later = TriggerLog()
+    later.load(log.entries(), occurrence + timedelta(minutes=TriggerLog.REPEAT_WINDOW + 1))
+    assert len(later) == 0
+
+
+def test_repeated_dst_hour_does_not_refire_daily_reminders(new_york):
+    ids = [f"reminder-{i}" for i in range(COUNT)]
+    log = TriggerLog()
+    # Each reminder at one minute of the hour, spread evenly
+    for minute in range(60):
+        first = local(FALL_BACK, 1, minute)
+        assert all(log.mark(rid, first, first) for rid in ids[minute::60])
+    
+    # The clock goes back an hour; the scheduler reports each reminder
+    # again at its minute, now with fold=1
+    for minute in range(60):
+        second = local(FALL_BACK, 1, minute, fold=1)
+        assert second.timestamp() - local(FALL_BACK, 1, minute).timestamp() == 3600
+        assert not any(log.mark(rid, second, second) for rid in ids[minute::60])
+    
+    # An hour after the repeat everything from it has expired
+    log.mark("other", local(FALL_BACK, 3, 0), local(FALL_BACK, 3, 0))
+    assert len(log) == 1
+
+
+def test_hourly_rule_fires_in_both_passes_of_the_repeated_hour(new_york):
+    log = TriggerLog()
+    first = local(FALL_BACK, 1, 0)
+    second = local(FALL_BACK, 1, 0, fold=1)
+    assert log.mark("hourly", first, first, real_time=True)
+    assert not log.mark("hourly", first, first + timedelta(seconds=30), real_time=True)
+    assert log.mark("hourly", second, second, real_time=True)
+    assert not log.mark("hourly", second, second, real_time=True)
+
+
+def test_engine_shows_each_reminder_once_when_the_clock_goes_back(recording_sink):
+    rng = random.Random(124)
+    clock = FakeClock(datetime(2026, 10, 16, 0, 59))
+    sink = recording_sink
+    engine = ReminderEngine(sink, clock=clock)
+    for i in range(COUNT):
+        engine.add(Reminder(60 + rng.randrange(60), f"reminder {i}"))
+    
+    def run_minutes(count):
+        for _ in range(count):
+            clock.advance(60)
+            engine.tick()
+    
+    run_minutes(61)  # Through 02:00
+    assert sink.shown == COUNT
+    # Like the end of DST without a fold on the fake clock: the wall clock
+    # repeats 01:00-01:59
+    clock.jump(timedelta(hours=-1))
+    engine.tick()
+    run_minutes(60)
+    assert sink.shown == COUNT